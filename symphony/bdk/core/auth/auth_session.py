@@ -1,14 +1,20 @@
 """Module containing session handle classes.
 
 """
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 import logging
+import time
 
 from symphony.bdk.core.auth.exception import AuthInitializationError
+from symphony.bdk.core.config.model.bdk_token_renewal_config import BdkTokenRenewalConfig
 
 logger = logging.getLogger(__name__)
 
 EXPIRATION_SAFETY_BUFFER_SECONDS = 5
+FAILED_RENEWAL_RETRY_SECONDS = 30
+# tokens rejected sooner, e.g. because the session has been revoked, do not tell their lifetime
+MIN_LEARNT_TOKEN_LIFETIME_SECONDS = 300
 
 
 class AuthSession:
@@ -16,24 +22,128 @@ class AuthSession:
     It uses a BotAuthenticator to actually retrieve the tokens when needed.
     """
 
-    def __init__(self, authenticator):
+    def __init__(self, authenticator, token_renewal_config: BdkTokenRenewalConfig = None):
         """
 
         :param authenticator: the :class:`symphony.bdk.core.auth.bot_authenticator.BotAuthenticator` instance to
           retrieve the tokens from.
+        :param token_renewal_config: the configuration of the background renewal of the tokens. If not set or not
+          enabled, the tokens are only refreshed when a call fails with a 401.
         """
         self._session_token = None
         self._key_manager_token = None
         self._auth_token = None
         self._authenticator = authenticator
         self._expire_at = -1
+        self._generation = 0
+        self._refresh_task = None
+        self._token_renewal_config = token_renewal_config or BdkTokenRenewalConfig(None)
+        self._token_lifetime = self._token_renewal_config.token_lifetime
+        self._authenticated_at = None
+        self._authenticated = None
+        self._renewal_task = None
 
-    async def refresh(self):
+    @property
+    def generation(self) -> int:
+        """
+
+        :return: the number of times the tokens have been refreshed, to be compared to the value read before a call
+          in order to know if the tokens it used have been refreshed since.
+        """
+        return self._generation
+
+    async def refresh(self, generation: int = None):
         """Trigger re-authentication to refresh the tokens.
+        Concurrent calls wait for the same re-authentication instead of triggering one each.
+
+        :param generation: the :py:attr:`generation` of the tokens known to be invalid, e.g. the ones used by a call
+          which failed with a 401. If the tokens have been refreshed since, they are not refreshed again. Otherwise,
+          the time elapsed since they were retrieved is used as token lifetime by the background renewal, unless it
+          is configured, shorter than :py:const:`MIN_LEARNT_TOKEN_LIFETIME_SECONDS` or shorter than a lifetime
+          already learnt.
         """
+        if self._refresh_task is None:
+            if generation is not None:
+                if generation != self._generation:
+                    logger.debug("Tokens already refreshed, skipping authentication")
+                    return
+                self._learn_token_lifetime()
+            self._refresh_task = asyncio.ensure_future(self._refresh_generation())
+        # shielded so that a cancelled caller does not cancel the refresh awaited by the others
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh_generation(self):
+        try:
+            await self._refresh()
+            self._generation += 1
+            self._on_authenticated()
+        finally:
+            self._refresh_task = None
+
+    async def _refresh(self):
         logger.debug("Authenticate")
-        self._session_token = await self._authenticator.retrieve_session_token()
-        self._key_manager_token = await self._authenticator.retrieve_key_manager_token()
+        # both tokens are swapped at once, once both have been retrieved
+        self._session_token, self._key_manager_token = await asyncio.gather(
+            self._authenticator.retrieve_session_token(), self._authenticator.retrieve_key_manager_token())
+
+    def _on_authenticated(self):
+        self._authenticated_at = time.monotonic()
+        if self._authenticated is not None:
+            self._authenticated.set()
+        if self._token_renewal_config.enabled and self._renewal_task is None:
+            self._renewal_task = asyncio.ensure_future(self._renew_tokens())
+
+    def _learn_token_lifetime(self):
+        if self._token_renewal_config.token_lifetime is not None or self._authenticated_at is None:
+            return
+        lifetime = timedelta(seconds=time.monotonic() - self._authenticated_at)
+        if lifetime.total_seconds() < MIN_LEARNT_TOKEN_LIFETIME_SECONDS:
+            logger.debug("Tokens rejected after %s, too soon to be their lifetime", lifetime)
+        elif self._token_lifetime is None or lifetime > self._token_lifetime:
+            # an earlier rejection, e.g. of revoked tokens, does not shorten the lifetime already learnt
+            self._token_lifetime = lifetime
+            logger.debug("Tokens expired after %s", self._token_lifetime)
+
+    def _time_to_renewal(self):
+        if self._token_lifetime is None or self._authenticated_at is None:
+            return None
+        lifetime = self._token_lifetime.total_seconds()
+        margin = self._token_renewal_config.renewal_margin.total_seconds()
+        renew_after = lifetime - margin if lifetime > 2 * margin else lifetime / 2
+        return max(0.0, self._authenticated_at + renew_after - time.monotonic())
+
+    async def _renew_tokens(self):
+        self._authenticated = asyncio.Event()
+        while True:
+            self._authenticated.clear()
+            # the renewal is rescheduled whenever the tokens are refreshed in the meantime. asyncio.wait is used
+            # rather than asyncio.wait_for, which may swallow the cancellation of the renewal by close()
+            authenticated = asyncio.ensure_future(self._authenticated.wait())
+            try:
+                done, _ = await asyncio.wait([authenticated], timeout=self._time_to_renewal())
+            finally:
+                authenticated.cancel()
+            if done:
+                continue
+            logger.debug("Renewing tokens before their expiry")
+            try:
+                await self.refresh()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed to renew tokens, retrying in %s seconds", FAILED_RENEWAL_RETRY_SECONDS,
+                               exc_info=True)
+                await asyncio.sleep(FAILED_RENEWAL_RETRY_SECONDS)
+
+    async def close(self):
+        """Stops the background renewal of the tokens, if started.
+        """
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()
+            try:
+                await self._renewal_task
+            except asyncio.CancelledError:
+                pass
+            self._renewal_task = None
+            self._authenticated = None
 
     @property
     async def session_token(self):
@@ -43,6 +153,7 @@ class AuthSession:
         """
         if self._session_token is None:
             self._session_token = await self._authenticator.retrieve_session_token()
+            self._on_authenticated()
         return self._session_token
 
     @property
@@ -116,9 +227,7 @@ class OboAuthSession(AuthSession):
         self.user_id = user_id
         self.username = username
 
-    async def refresh(self):
-        """Trigger re-authentication to refresh the OBO session token.
-        """
+    async def _refresh(self):
         if self.user_id is not None:
             self._session_token = await self._authenticator.retrieve_obo_session_token_by_user_id(self.user_id)
         if self.username is not None:
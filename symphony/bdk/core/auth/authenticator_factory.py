@@ -88,14 +88,16 @@ class AuthenticatorFactory:
                 PodApi(self._api_client_factory.get_pod_client()),
                 app_config.app_id,
                 app_config.private_key,
-                self._config.retry
+                self._config.retry,
+                validated_jwt_cache_size=app_config.validated_jwt_cache_size
             )
         if app_config.is_certificate_configuration_valid():
             return ExtensionAppAuthenticatorCert(
                 CertificateAuthenticationApi(self._api_client_factory.get_app_session_auth_client()),
                 CertificatePodApi(self._api_client_factory.get_app_session_auth_client()),
                 app_config.app_id,
-                self._config.retry
+                self._config.retry,
+                validated_jwt_cache_size=app_config.validated_jwt_cache_size
             )
         raise AuthInitializationError("Application under 'app' field should be configured with a private key path or "
                                       "content in order to authenticate extension app.")
@@ -1,10 +1,15 @@
 """Module containing extension app authenticator classes.
 """
+import time
 from abc import ABC, abstractmethod
 
+from jwt import InvalidSignatureError
+
 from symphony.bdk.core.auth.auth_session import AppAuthSession
+from symphony.bdk.core.auth.exception import AuthInitializationError
 from symphony.bdk.core.auth.jwt_helper import validate_jwt, create_signed_jwt
 from symphony.bdk.core.auth.tokens_repository import TokensRepository, InMemoryTokensRepository
+from symphony.bdk.core.cache import LruCache
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.config.model.bdk_rsa_key_config import BdkRsaKeyConfig
 from symphony.bdk.core.retry import retry
@@ -18,20 +23,30 @@ from symphony.bdk.gen.login_model.extension_app_tokens import ExtensionAppTokens
 from symphony.bdk.gen.pod_api.pod_api import PodApi
 from symphony.bdk.gen.pod_model.pod_certificate import PodCertificate
 
+POD_CERTIFICATE_TTL_SECONDS = 3600
+POD_CERTIFICATE_MIN_RELOAD_INTERVAL_SECONDS = 30
+
 
 class ExtensionAppAuthenticator(ABC):
     """Base abstract class to handle extension app authentication.
     """
 
-    def __init__(self, app_id: str, tokens_repository: TokensRepository = None):
+    def __init__(self, app_id: str, tokens_repository: TokensRepository = None, validated_jwt_cache_size: int = 0):
         """
 
         :param app_id: the application ID
         :param tokens_repository: the tokens repository to store existing valid sessions.
           Defaults to InMemoryTokensRepository
+        :param validated_jwt_cache_size: the maximum number of validated jwts whose claims are cached until they expire.
+          Defaults to 0, i.e. jwts are validated each time.
         """
         self._app_id = app_id
         self._tokens_repository = tokens_repository or InMemoryTokensRepository()
+        # whether the repository accepts the tokens expiry, None until the first tokens are saved
+        self._repository_supports_expiry = None
+        self._pod_certificate = None
+        self._pod_certificate_loaded_at = None
+        self._validated_jwts = LruCache(validated_jwt_cache_size) if validated_jwt_cache_size > 0 else None
 
     async def authenticate_extension_app(self, app_token: str) -> AppAuthSession:
         """Authenticates an extension app.
@@ -46,13 +61,45 @@ class ExtensionAppAuthenticator(ABC):
 
     async def validate_jwt(self, jwt: str) -> dict:
         """Validates a jwt against the pod certificate.
+        The pod certificate is retrieved once and reloaded every hour, or sooner if a jwt signature does not match it.
 
         :param jwt: the jwt to be validated
         :return: the dictionary of jwt claims
         :raise AuthInitializationError: If the pod certificate or jwt are invalid.
         """
-        pod_certificate = await self._get_pod_certificate()
-        return validate_jwt(jwt, pod_certificate.certificate, self._app_id)
+        if self._validated_jwts is not None:
+            claims = self._validated_jwts.get(jwt)
+            if claims is not None:
+                return dict(claims)
+
+        pod_certificate = await self._get_cached_pod_certificate()
+        try:
+            claims = validate_jwt(jwt, pod_certificate, self._app_id)
+        except AuthInitializationError as exc:
+            if not isinstance(exc.__cause__, InvalidSignatureError) or not self._can_reload_pod_certificate():
+                raise
+            # the pod certificate may have been renewed since it was loaded
+            pod_certificate = await self._get_cached_pod_certificate(reload=True)
+            claims = validate_jwt(jwt, pod_certificate, self._app_id)
+
+        self._cache_validated_jwt(jwt, claims)
+        return claims
+
+    async def _get_cached_pod_certificate(self, reload: bool = False) -> str:
+        if reload or self._pod_certificate is None \
+                or time.monotonic() - self._pod_certificate_loaded_at >= POD_CERTIFICATE_TTL_SECONDS:
+            self._pod_certificate = (await self._get_pod_certificate()).certificate
+            self._pod_certificate_loaded_at = time.monotonic()
+        return self._pod_certificate
+
+    def _can_reload_pod_certificate(self) -> bool:
+        return time.monotonic() - self._pod_certificate_loaded_at >= POD_CERTIFICATE_MIN_RELOAD_INTERVAL_SECONDS
+
+    def _cache_validated_jwt(self, jwt: str, claims: dict):
+        if self._validated_jwts is not None and isinstance(claims.get("exp"), (int, float)):
+            ttl = claims["exp"] - time.time()
+            if ttl > 0:
+                self._validated_jwts.put(jwt, dict(claims), ttl)
 
     async def authenticate_and_retrieve_tokens(self, app_token: str) -> ExtensionAppTokens:
         """Actually authenticates and retrieves the tokens.
@@ -62,10 +109,24 @@ class ExtensionAppAuthenticator(ABC):
         :return: the extension app tokens
         """
         ext_app_tokens = await self._retrieve_tokens(app_token)
-        await self._tokens_repository.save(ext_app_tokens.app_token, ext_app_tokens.symphony_token)
+        await self._save_tokens(ext_app_tokens)
 
         return ext_app_tokens
 
+    async def _save_tokens(self, ext_app_tokens: ExtensionAppTokens):
+        if self._repository_supports_expiry is not False:
+            try:
+                await self._tokens_repository.save(ext_app_tokens.app_token, ext_app_tokens.symphony_token,
+                                                   expire_at=ext_app_tokens.expire_at)
+                self._repository_supports_expiry = True
+                return
+            except TypeError:
+                if self._repository_supports_expiry:
+                    raise
+                # repositories implemented before tokens expiry was introduced do not accept it
+                self._repository_supports_expiry = False
+        await self._tokens_repository.save(ext_app_tokens.app_token, ext_app_tokens.symphony_token)
+
     async def is_token_pair_valid(self, app_token: str, symphony_token: str) -> bool:
         """Validates if appToken and symphonyToken corresponds to an existing session.
 
@@ -102,7 +163,8 @@ class ExtensionAppAuthenticatorRsa(ExtensionAppAuthenticator):
                  app_id: str,
                  private_key_config: BdkRsaKeyConfig,
                  retry_config: BdkRetryConfig,
-                 tokens_repository: TokensRepository = None):
+                 tokens_repository: TokensRepository = None,
+                 validated_jwt_cache_size: int = 0):
         """
 
         :param authentication_api: the AuthenticationApi instance
@@ -112,8 +174,9 @@ class ExtensionAppAuthenticatorRsa(ExtensionAppAuthenticator):
         :param retry_config: retry configuration
         :param tokens_repository: the tokens repository to store existing valid sessions.
           Defaults to InMemoryTokensRepository
+        :param validated_jwt_cache_size: the maximum number of validated jwts whose claims are cached until they expire.
         """
-        super().__init__(app_id, tokens_repository)
+        super().__init__(app_id, tokens_repository, validated_jwt_cache_size)
         self._authentication_api = authentication_api
         self._pod_api = pod_api
         self._private_key_config = private_key_config
@@ -140,7 +203,8 @@ class ExtensionAppAuthenticatorCert(ExtensionAppAuthenticator):
                  certificate_pod_api: CertificatePodApi,
                  app_id: str,
                  retry_config: BdkRetryConfig,
-                 tokens_repository: TokensRepository = None):
+                 tokens_repository: TokensRepository = None,
+                 validated_jwt_cache_size: int = 0):
         """
 
         :param certificate_authentication_api: the CertificateAuthenticationApi instance
@@ -149,8 +213,9 @@ class ExtensionAppAuthenticatorCert(ExtensionAppAuthenticator):
         :param retry_config: Retry configuration
         :param tokens_repository: the tokens repository to store existing valid sessions.
           Defaults to InMemoryTokensRepository
+        :param validated_jwt_cache_size: the maximum number of validated jwts whose claims are cached until they expire.
         """
-        super().__init__(app_id, tokens_repository)
+        super().__init__(app_id, tokens_repository, validated_jwt_cache_size)
         self._certificate_authentication_api = certificate_authentication_api
         self._certificate_pod_api = certificate_pod_api
         self._retry_config = retry_config
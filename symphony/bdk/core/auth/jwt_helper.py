@@ -1,9 +1,12 @@
 """Module to help with jwt handling.
 """
 import datetime
+import functools
+
+from typing import Union
 
 import jwt
-from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from cryptography.x509 import load_pem_x509_certificate
 
 from symphony.bdk.core.auth.exception import AuthInitializationError
@@ -13,6 +16,8 @@ JWT_ENCRYPTION_ALGORITHM = "RS512"
 
 DEFAULT_EXPIRATION_SECONDS = (5 * 50) - 10
 
+PUBLIC_KEYS_CACHE_SIZE = 8
+
 
 def create_signed_jwt(private_key_config: BdkRsaKeyConfig, username: str, expiration: int = None) -> str:
     """Creates a JWT with the provided user name and expiration date, signed with the provided private key.
@@ -31,14 +36,13 @@ def create_signed_jwt(private_key_config: BdkRsaKeyConfig, username: str, expira
         "sub": username,
         "exp": expiration
     }
-    return create_signed_jwt_with_claims(private_key_config.get_private_key_content(), payload)
+    return create_signed_jwt_with_claims(private_key_config.get_private_key(), payload)
 
 
-def create_signed_jwt_with_claims(private_key: str, payload: dict) -> str:
-    """Creates a JWT with the payload signed with the provided private key content.
-    For testing purposes only.
+def create_signed_jwt_with_claims(private_key: Union[str, RSAPrivateKey], payload: dict) -> str:
+    """Creates a JWT with the payload signed with the provided private key.
 
-    :param private_key: the privste key content in string format.
+    :param private_key: the private key content in string format, or the already parsed private key.
     :param payload: the payload (aka claims) of the JWT in dict format.
     :return: a signed JWT
     """
@@ -55,7 +59,7 @@ def validate_jwt(jwt_token: str, certificate: str, allowed_audience: str) -> dic
     :raise AuthInitializationError: If the certificate or jwt are invalid.
     """
     try:
-        return jwt.decode(jwt_token, _parse_public_key_from_x509_cert(certificate),
+        return jwt.decode(jwt_token, _load_public_key_from_x509_cert(certificate),
                           algorithms=[JWT_ENCRYPTION_ALGORITHM], audience=allowed_audience)
     except (jwt.DecodeError, jwt.ExpiredSignatureError) as exc:
         raise AuthInitializationError("Unable to validate the jwt") from exc
@@ -71,14 +75,15 @@ def generate_expiration_time() -> int:
     )
 
 
-def _parse_public_key_from_x509_cert(certificate: str) -> str:
-    """Returns the public key in PEM format given a X509 certificate content in PEM format
+@functools.lru_cache(maxsize=PUBLIC_KEYS_CACHE_SIZE)
+def _load_public_key_from_x509_cert(certificate: str) -> RSAPublicKey:
+    """Returns the public key of a X509 certificate content in PEM format.
+    The keys are cached per certificate, so that validating several jwts against the same certificate parses it once.
 
     :param certificate: the X509 certificate in PEM format
-    :return: the public key associated to the certificate in PEM format
+    :return: the public key associated to the certificate
     """
     try:
-        public_key = load_pem_x509_certificate(certificate.encode()).public_key()
-        return public_key.public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo).decode()
+        return load_pem_x509_certificate(certificate.encode()).public_key()
     except ValueError as exc:
         raise AuthInitializationError("Unable to parse the certificate. Check certificate format.") from exc
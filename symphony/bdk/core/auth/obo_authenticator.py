@@ -1,9 +1,12 @@
 """Module containing OBO authenticator classes.
 """
+import asyncio
 from abc import ABC, abstractmethod
 
 from symphony.bdk.core.auth.auth_session import OboAuthSession
+from symphony.bdk.core.auth.exception import AuthUnauthorizedError
 from symphony.bdk.core.auth.jwt_helper import create_signed_jwt
+from symphony.bdk.core.cache import LruCache
 from symphony.bdk.core.config.model.bdk_app_config import BdkAppConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
@@ -12,24 +15,39 @@ from symphony.bdk.gen.auth_api.certificate_authentication_api import Certificate
 from symphony.bdk.gen.login_api.authentication_api import AuthenticationApi
 from symphony.bdk.gen.login_model.authenticate_request import AuthenticateRequest
 
+OBO_SESSIONS_CACHE_SIZE = 1000
+OBO_SESSIONS_TTL_SECONDS = 3600
+
 
 class OboAuthenticator(ABC):
     """Obo authentication service.
+    The app session token is retrieved once and reused for all the users until it is rejected. The OBO sessions are
+    cached per user, so that concurrent calls on behalf of the same user share the same session and authentication.
     """
 
     unauthorized_message = \
         "Extension Application is not authorized to authenticate in OBO mode. Check if credentials are valid."
 
-    @abstractmethod
+    def __init__(self, sessions_cache_size: int = OBO_SESSIONS_CACHE_SIZE,
+                 sessions_ttl: float = OBO_SESSIONS_TTL_SECONDS):
+        """
+
+        :param sessions_cache_size: the maximum number of OBO sessions cached.
+        :param sessions_ttl: the number of seconds after which a cached OBO session is discarded.
+        """
+        self._app_session_token = None
+        self._app_session_token_task = None
+        self._obo_sessions = LruCache(sessions_cache_size, sessions_ttl)
+
     async def retrieve_obo_session_token_by_user_id(self, user_id: int) -> str:
-        """Retrieve the OBO session token by username.
+        """Retrieve the OBO session token by user id.
 
         :param user_id: User Id.
         :return: The obo session token.
         :raise AuthUnauthorizedError: if session token cannot be retrieved
         """
+        return await self._retrieve_obo_session_token(self._authenticate_by_user_id, user_id)
 
-    @abstractmethod
     async def retrieve_obo_session_token_by_username(self, username: str) -> str:
         """Retrieve the OBO session token by username.
 
@@ -37,55 +55,98 @@ class OboAuthenticator(ABC):
         :return: The obo session token.
         :raise AuthUnauthorizedError: if session token cannot be retrieved
         """
+        return await self._retrieve_obo_session_token(self._authenticate_by_username, username)
 
     def authenticate_by_username(self, username: str) -> OboAuthSession:
         """Authenticate On-Behalf-Of user by username.
 
         :param username: Username
-        :return: the OBO authentication session.
+        :return: the OBO authentication session, the same one as long as it is cached.
         """
-        return OboAuthSession(self, username=username)
+        return self._get_obo_session(username=username)
 
     def authenticate_by_user_id(self, user_id: int) -> OboAuthSession:
         """Authenticate On-Behalf-Of user by user id.
 
         :param user_id: User Id
-        :return: the OBO authentication session.
+        :return: the OBO authentication session, the same one as long as it is cached.
         """
-        return OboAuthSession(self, user_id=user_id)
-
+        return self._get_obo_session(user_id=user_id)
+
+    def _get_obo_session(self, user_id: int = None, username: str = None) -> OboAuthSession:
+        key = (user_id, username)
+        obo_session = self._obo_sessions.get(key)
+        if obo_session is None:
+            obo_session = OboAuthSession(self, user_id=user_id, username=username)
+            self._obo_sessions.put(key, obo_session)
+        return obo_session
+
+    async def _retrieve_obo_session_token(self, authenticate, user) -> str:
+        cached = self._app_session_token is not None
+        app_session_token = await self._get_app_session_token()
+        try:
+            return await authenticate(app_session_token, user)
+        except AuthUnauthorizedError:
+            if not cached:
+                raise
+            # the cached app session token may have expired, retry once with a new one
+            if self._app_session_token == app_session_token:
+                self._app_session_token = None
+            return await authenticate(await self._get_app_session_token(), user)
+
+    async def _get_app_session_token(self) -> str:
+        if self._app_session_token is not None:
+            return self._app_session_token
+        if self._app_session_token_task is None:
+            self._app_session_token_task = asyncio.ensure_future(self._refresh_app_session_token())
+        # shielded so that a cancelled caller does not cancel the authentication awaited by the others
+        return await asyncio.shield(self._app_session_token_task)
+
+    async def _refresh_app_session_token(self) -> str:
+        try:
+            self._app_session_token = await self._retrieve_app_session_token()
+            return self._app_session_token
+        finally:
+            self._app_session_token_task = None
 
-class OboAuthenticatorRsa(OboAuthenticator):
-    """Obo authenticator RSA implementation.
-    """
+    @abstractmethod
+    async def _retrieve_app_session_token(self) -> str:
+        """Authenticates the extension app.
 
-    def __init__(self, app_config: BdkAppConfig, authentication_api: AuthenticationApi, retry_config: BdkRetryConfig):
-        self._app_config = app_config
-        self._authentication_api = authentication_api
-        self._retry_config = retry_config
+        :return: the app session token.
+        """
 
-    async def retrieve_obo_session_token_by_user_id(self, user_id: int) -> str:
-        """Retrieve the OBO session token by user id.
+    @abstractmethod
+    async def _authenticate_by_user_id(self, app_session_token: str, user_id: int) -> str:
+        """Authenticates a user by user id on behalf of the extension app.
 
+        :param app_session_token: the app session token.
         :param user_id: User Id.
         :return: The obo session token.
-        :raise AuthUnauthorizedError: if session token cannot be retrieved
         """
-        app_session_token = await self._authenticate_and_retrieve_app_session_token()
-        return await self._authenticate_by_user_id(app_session_token, user_id=user_id)
 
-    async def retrieve_obo_session_token_by_username(self, username: str) -> str:
-        """Retrieve the OBO session token by username.
+    @abstractmethod
+    async def _authenticate_by_username(self, app_session_token: str, username: str) -> str:
+        """Authenticates a user by username on behalf of the extension app.
 
+        :param app_session_token: the app session token.
         :param username: Username
         :return: The obo session token.
-        :raise AuthUnauthorizedError: if session token cannot be retrieved
         """
-        app_session_token = await self._authenticate_and_retrieve_app_session_token()
-        return await self._authenticate_by_username(app_session_token, username=username)
+
+
+class OboAuthenticatorRsa(OboAuthenticator):
+    """Obo authenticator RSA implementation.
+    """
+
+    def __init__(self, app_config: BdkAppConfig, authentication_api: AuthenticationApi, retry_config: BdkRetryConfig):
+        super().__init__()
+        self._app_config = app_config
+        self._authentication_api = authentication_api
+        self._retry_config = retry_config
 
     @retry(retry=authentication_retry)
-    async def _authenticate_and_retrieve_app_session_token(self) -> str:
+    async def _retrieve_app_session_token(self) -> str:
         jwt = create_signed_jwt(self._app_config.private_key, self._app_config.app_id)
         req = AuthenticateRequest(token=jwt)
 
@@ -110,36 +171,23 @@ class OboAuthenticatorCert(OboAuthenticator):
     """
 
     def __init__(self, certificate_authenticator_api: CertificateAuthenticationApi, retry_config: BdkRetryConfig):
+        super().__init__()
         self._authentication_api = certificate_authenticator_api
         self._retry_config = retry_config
 
     @retry(retry=authentication_retry)
-    async def retrieve_obo_session_token_by_user_id(self, user_id: int) -> str:
-        """Retrieve the OBO session token by username.
+    async def _retrieve_app_session_token(self) -> str:
+        token = await self._authentication_api.v1_app_authenticate_post()
+        return token.token
 
-        :param user_id: User Id.
-        :return: The obo session token.
-        :raise AuthUnauthorizedError: if session token cannot be retrieved
-        """
-        app_session_token = await self._retrieve_app_session_token()
+    @retry(retry=authentication_retry)
+    async def _authenticate_by_user_id(self, app_session_token, user_id) -> str:
         obo_auth = await self._authentication_api.v1_app_user_uid_authenticate_post(session_token=app_session_token,
                                                                                     uid=user_id)
         return obo_auth.session_token
 
     @retry(retry=authentication_retry)
-    async def retrieve_obo_session_token_by_username(self, username: str) -> str:
-        """Retrieve the OBO session token by username.
-
-        :param username: Username
-        :return: The obo session token.
-        :raise AuthUnauthorizedError: if session token cannot be retrieved
-        """
-        app_session_token = await self._retrieve_app_session_token()
+    async def _authenticate_by_username(self, app_session_token, username) -> str:
         obo_auth = await self._authentication_api.v1_app_username_username_authenticate_post(
             session_token=app_session_token, username=username)
         return obo_auth.session_token
-
-    @retry(retry=authentication_retry)
-    async def _retrieve_app_session_token(self) -> str:
-        token = await self._authentication_api.v1_app_authenticate_post()
-        return token.token
@@ -1,6 +1,16 @@
 """Module which handles the storage of valid extension app tokens.
 """
+import asyncio
+import heapq
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_MAX_TOKENS = 10000
 
 
 class TokensRepository(ABC):
@@ -8,11 +18,12 @@ class TokensRepository(ABC):
     """
 
     @abstractmethod
-    async def save(self, app_token: str, symphony_token: str) -> None:
+    async def save(self, app_token: str, symphony_token: str, expire_at: Optional[int] = None) -> None:
         """Saves a pair (app_token, symphony_token)
 
         :param app_token: the application token
         :param symphony_token: the Symphony token
+        :param expire_at: the unix timestamp in milliseconds when the tokens expire, if known
         :return: None
         """
 
@@ -21,18 +32,106 @@ class TokensRepository(ABC):
         """Retrieves the corresponding Symphony token from a given application token.
 
         :param app_token: the application token
-        :return: the symphony token corresponding to the app token if it exists, None otherwise
+        :return: the symphony token corresponding to the app token if it exists and has not expired, None otherwise
         """
 
 
 class InMemoryTokensRepository(TokensRepository):
     """Class implementing an in-memory TokensRepository.
+    Tokens are dropped once expired, and the oldest ones are evicted when the maximum number of tokens is reached.
     """
-    def __init__(self):
-        self._tokens = {}
 
-    async def save(self, app_token: str, symphony_token: str) -> None:
+    def __init__(self, max_tokens: int = DEFAULT_MAX_TOKENS):
+        """
+
+        :param max_tokens: the maximum number of token pairs kept.
+        """
+        self._max_tokens = max_tokens
+        self._tokens = OrderedDict()
+        self._expire_at = {}
+        # heap of the (expire_at, app_token) pairs of the tokens whose expiry is known, including outdated pairs of
+        # tokens saved again or evicted since
+        self._expiries = []
+
+    async def save(self, app_token: str, symphony_token: str, expire_at: Optional[int] = None) -> None:
+        self._remove_expired()
         self._tokens[app_token] = symphony_token
+        self._tokens.move_to_end(app_token)
+        self._expire_at[app_token] = expire_at
+        if expire_at is not None:
+            heapq.heappush(self._expiries, (expire_at, app_token))
+        while len(self._tokens) > self._max_tokens:
+            self._remove(next(iter(self._tokens)))
+        if len(self._expiries) > 2 * self._max_tokens:
+            self._expiries = [(expire_at, app_token) for app_token, expire_at in self._expire_at.items()
+                              if expire_at is not None]
+            heapq.heapify(self._expiries)
 
     async def get(self, app_token: str) -> str:
+        if _is_expired(self._expire_at.get(app_token)):
+            self._remove(app_token)
         return self._tokens.get(app_token)
+
+    def _remove_expired(self):
+        while self._expiries and _is_expired(self._expiries[0][0]):
+            expire_at, app_token = heapq.heappop(self._expiries)
+            if self._expire_at.get(app_token) == expire_at:
+                self._remove(app_token)
+
+    def _remove(self, app_token: str):
+        self._tokens.pop(app_token, None)
+        self._expire_at.pop(app_token, None)
+
+
+class SqliteTokensRepository(TokensRepository):
+    """Class implementing a TokensRepository stored in a SQLite database file, which can be shared by several
+    processes of the same extension app backend.
+    Expired tokens are removed when new tokens are saved.
+    """
+
+    def __init__(self, database: Union[str, Path]):
+        """
+
+        :param database: the path of the SQLite database file, created if it does not exist.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database), timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS tokens ("
+                                     "app_token TEXT PRIMARY KEY, symphony_token TEXT NOT NULL, expire_at INTEGER)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS tokens_expire_at ON tokens (expire_at)")
+
+    async def save(self, app_token: str, symphony_token: str, expire_at: Optional[int] = None) -> None:
+        await asyncio.to_thread(self._save, app_token, symphony_token, expire_at)
+
+    async def get(self, app_token: str) -> str:
+        return await asyncio.to_thread(self._get, app_token)
+
+    def close(self):
+        """Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _save(self, app_token, symphony_token, expire_at):
+        with self._lock:
+            self._connection.execute("DELETE FROM tokens WHERE expire_at <= ?", (_now_millis(),))
+            self._connection.execute("INSERT OR REPLACE INTO tokens (app_token, symphony_token, expire_at) "
+                                     "VALUES (?, ?, ?)", (app_token, symphony_token, expire_at))
+
+    def _get(self, app_token):
+        with self._lock:
+            row = self._connection.execute("SELECT symphony_token, expire_at FROM tokens WHERE app_token = ?",
+                                           (app_token,)).fetchone()
+        if row is None or _is_expired(row[1]):
+            return None
+        return row[0]
+
+
+def _now_millis() -> int:
+    return int(time.time() * 1000)
+
+
+def _is_expired(expire_at: Optional[int]) -> bool:
+    return expire_at is not None and expire_at <= _now_millis()
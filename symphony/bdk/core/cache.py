@@ -0,0 +1,144 @@
+"""Module containing the in-memory cache used by the BDK services.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class LruCache:
+    """Bounded in-memory cache evicting the least recently used entry when full.
+    Entries can also expire after a time to live.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+
+        :param max_size: the maximum number of entries kept in the cache.
+        :param ttl: the number of seconds after which an entry expires, counted from when it was stored.
+          Entries never expire if not set.
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """
+
+        :return: the number of calls to :py:meth:`get` which found a value.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+
+        :return: the number of calls to :py:meth:`get` which did not find a value.
+        """
+        return self._misses
+
+    def get(self, key, default=None):
+        """Gets the value stored for a key and marks it as the most recently used.
+
+        :param key: the key to look up.
+        :param default: the value to return if the key is not in the cache or has expired.
+        :return: the cached value, or default if missing.
+        """
+        if not self._contains(key):
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def peek(self, key, default=None):
+        """Gets the value stored for a key, without marking it as the most recently used nor counting a hit or a miss.
+
+        :param key: the key to look up.
+        :param default: the value to return if the key is not in the cache or has expired.
+        :return: the cached value, or default if missing.
+        """
+        if not self._contains(key):
+            return default
+        return self._entries[key][0]
+
+    def put(self, key, value, ttl: Optional[float] = None):
+        """Stores a value, evicting the least recently used entry if the cache is full.
+
+        :param key: the key to store the value under.
+        :param value: the value to store.
+        :param ttl: the number of seconds after which this entry expires, overriding the one of the cache.
+        """
+        ttl = ttl if ttl is not None else self._ttl
+        expire_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expire_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Removes the entry stored for a key.
+
+        :param key: the key to remove.
+        :param default: the value to return if the key is not in the cache or has expired.
+        :return: the removed value, or default if missing.
+        """
+        if not self._contains(key):
+            return default
+        return self._entries.pop(key)[0]
+
+    def remove_if(self, predicate: Callable[[object], bool]) -> int:
+        """Removes the entries whose value matches a predicate.
+
+        :param predicate: the function called with each cached value, returning true if its entry has to be removed.
+        :return: the number of removed entries.
+        """
+        keys = [key for key, (value, _) in self._entries.items() if predicate(value)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Removes all the entries.
+        """
+        self._entries.clear()
+
+    def values(self):
+        """
+
+        :return: the list of the cached values which have not expired, from the least to the most recently used.
+        """
+        self._remove_expired()
+        return [value for value, _ in self._entries.values()]
+
+    def items(self):
+        """
+
+        :return: the list of the cached keys and values which have not expired, from the least to the most recently
+          used.
+        """
+        self._remove_expired()
+        return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def _contains(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            return False
+        return True
+
+    def _remove_expired(self):
+        now = time.monotonic()
+        for key in [key for key, (_, expire_at) in self._entries.items() if expire_at is not None and expire_at <= now]:
+            del self._entries[key]
+
+    def __contains__(self, key):
+        return self._contains(key)
+
+    def __len__(self):
+        self._remove_expired()
+        return len(self._entries)
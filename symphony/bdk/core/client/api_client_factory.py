@@ -8,9 +8,12 @@ from ssl import SSLError
 import urllib3
 from aiohttp.hdrs import USER_AGENT
 
+from symphony.bdk.core.client.connector_pool import ConnectorPool
 from symphony.bdk.core.client.trace_id import add_x_trace_id, X_TRACE_ID
+from symphony.bdk.core.config.exception import BdkConfigError
 from symphony.bdk.gen.api_client import ApiClient
 from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.json_codec import get_json_codec
 
 KEY_AUTH = "/keyauth"
 SESSION_AUTH = "/sessionauth"
@@ -24,10 +27,13 @@ logger = logging.getLogger(__name__)
 
 class ApiClientFactory:
     """Factory responsible for creating ApiClient instances for each main Symphony's components.
+    All the clients targeting the same origin (scheme, host, port and client certificate) share the same connector,
+    i.e. the same socket pool and SSL context.
     """
 
     def __init__(self, config):
         self._config = config
+        self._connector_pool = ConnectorPool()
         self._login_client = self._get_api_client(self._config.pod, LOGIN)
         self._pod_client = self._get_api_client(self._config.pod, POD)
         self._relay_client = self._get_api_client(self._config.key_manager, RELAY)
@@ -102,6 +108,7 @@ class ApiClientFactory:
     async def close_clients(self):
         """
         Close all the existing api clients created by the api client factory.
+        Shared connectors are closed once all the clients using them are closed.
         """
         await self._login_client.close()
         await self._relay_client.close()
@@ -115,26 +122,27 @@ class ApiClientFactory:
 
     def _get_api_client(self, server_config, context) -> ApiClient:
         configuration = self._get_client_config(context, server_config)
-        return ApiClientFactory._get_api_client_from_config(configuration, server_config)
+        return self._get_api_client_from_config(configuration, server_config)
 
     def _get_api_client_with_client_cert(self, server_config, context, certificate_path) -> ApiClient:
         configuration = self._get_client_config(context, server_config)
         configuration.cert_file = certificate_path
 
-        return ApiClientFactory._get_api_client_from_config(configuration, server_config)
+        return self._get_api_client_from_config(configuration, server_config)
 
     def _get_client_config(self, context, server_config):
         configuration = Configuration(host=(server_config.get_base_path() + context), discard_unknown_keys=True)
         configuration.verify_ssl = True
         configuration.ssl_ca_cert = self._config.ssl.trust_store_path
+        configuration.lazy_deserialization = self._config.lazy_deserialization
+        configuration.json_codec = ApiClientFactory._json_codec(self._config.json_codec)
         if server_config.proxy is not None:
             ApiClientFactory._configure_proxy(server_config, configuration)
         return configuration
 
-    @staticmethod
-    def _get_api_client_from_config(client_config, server_config):
+    def _get_api_client_from_config(self, client_config, server_config):
         try:
-            client = ApiClient(configuration=client_config)
+            client = ApiClient(configuration=client_config, connector_pool=self._connector_pool)
             ApiClientFactory._add_headers(client, server_config)
             return client
         except SSLError as exc:
@@ -152,6 +160,13 @@ class ApiClientFactory:
         if X_TRACE_ID.lower() not in (header_name.lower() for header_name in default_headers.keys()):
             client._ApiClient__call_api = add_x_trace_id(client._ApiClient__call_api)
 
+    @staticmethod
+    def _json_codec(name):
+        try:
+            return get_json_codec(name)
+        except ValueError as exc:
+            raise BdkConfigError(str(exc)) from exc
+
     @staticmethod
     def _configure_proxy(server_config, configuration):
         proxy_config = server_config.proxy
@@ -0,0 +1,71 @@
+"""Module containing the ConnectorPool class which shares the HTTP transport between api clients.
+"""
+import logging
+from urllib.parse import urlparse
+
+from aiohttp import TCPConnector
+
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.rest import create_connector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class ConnectorPool:
+    """Pool of aiohttp connectors shared between the api clients targeting the same origin.
+
+    A connector (holding the socket pool and the SSL context) is created per (scheme, host, port, client certificate)
+    key and is shared by all the clients with the same key. Connectors are reference counted: a connector is only
+    closed once all the clients which acquired it have released it.
+    """
+
+    def __init__(self):
+        self._connectors = {}
+        self._ref_counts = {}
+
+    def acquire(self, configuration: Configuration) -> TCPConnector:
+        """Gets the connector for the origin targeted by the configuration, creating it if needed, and increments its
+        reference count.
+
+        :param configuration: the client configuration.
+        :return: the shared connector.
+        """
+        key = self.connector_key(configuration)
+        if key not in self._connectors:
+            logger.debug("Creating connector for %s://%s:%s", *key[:3])
+            self._connectors[key] = create_connector(configuration)
+            self._ref_counts[key] = 0
+        self._ref_counts[key] += 1
+        return self._connectors[key]
+
+    async def release(self, configuration: Configuration):
+        """Decrements the reference count of the connector for the origin targeted by the configuration, and closes it
+        when no client uses it anymore.
+
+        :param configuration: the client configuration used to acquire the connector.
+        """
+        key = self.connector_key(configuration)
+        if key not in self._connectors:
+            return
+        self._ref_counts[key] -= 1
+        if self._ref_counts[key] <= 0:
+            logger.debug("Closing connector for %s://%s:%s", *key[:3])
+            del self._ref_counts[key]
+            await self._connectors.pop(key).close()
+
+    def __len__(self):
+        return len(self._connectors)
+
+    @staticmethod
+    def connector_key(configuration: Configuration) -> tuple:
+        """Computes the key identifying the connector to use for a given configuration.
+
+        :param configuration: the client configuration.
+        :return: a tuple (scheme, host, port, client certificate, client key, trust store, verify ssl).
+        """
+        url = urlparse(configuration.host)
+        port = url.port or DEFAULT_PORTS.get(url.scheme)
+        return (url.scheme, url.hostname, port, configuration.cert_file, configuration.key_file,
+                configuration.ssl_ca_cert, configuration.verify_ssl)
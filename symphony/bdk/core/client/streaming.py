@@ -0,0 +1,95 @@
+"""Module containing helpers to stream HTTP response bodies without holding them in memory.
+
+The responses to stream are retrieved by calling the generated API methods with ``_preload_content=False``, e.g.:
+
+.. code-block:: python
+
+    response = await attachments_api.v1_stream_sid_attachment_get(..., _preload_content=False)
+    async for chunk in decode_base64_chunks(iter_response_chunks(response)):
+        ...
+"""
+import base64
+from pathlib import Path
+from typing import AsyncGenerator, AsyncIterable, Union
+
+from aiohttp import ClientResponse
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# characters which may surround or split a base64 payload and are not part of the encoded data
+IGNORED_BASE64_CHARACTERS = b"\" \t\r\n"
+
+
+class Base64StreamDecoder:
+    """Incremental base64 decoder: decodes the chunks of a base64 payload as they are received, keeping the incomplete
+    4-characters quantum at the end of a chunk until the next one is received.
+    """
+
+    def __init__(self):
+        self._remainder = b""
+
+    def decode(self, chunk: bytes) -> bytes:
+        """Decodes the complete base64 quanta of a chunk.
+
+        :param chunk: the next chunk of the base64 payload.
+        :return: the decoded bytes available so far.
+        """
+        data = self._remainder + chunk.translate(None, IGNORED_BASE64_CHARACTERS)
+        complete_length = len(data) - len(data) % 4
+        self._remainder = data[complete_length:]
+        return base64.b64decode(data[:complete_length])
+
+    def flush(self) -> bytes:
+        """Decodes the remaining characters once the whole payload has been received, tolerating missing padding.
+
+        :return: the last decoded bytes.
+        """
+        remainder, self._remainder = self._remainder, b""
+        if not remainder:
+            return b""
+        return base64.b64decode(remainder + b"=" * (-len(remainder) % 4))
+
+
+async def iter_response_chunks(response: ClientResponse,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes, None]:
+    """Iterates over the body of a response which has not been preloaded, then releases the response.
+
+    :param response: the response returned by a generated API method called with ``_preload_content=False``.
+    :param chunk_size: the maximum size in bytes of each chunk.
+    :return: an asynchronous generator of the body chunks.
+    """
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            yield chunk
+    finally:
+        response.release()
+
+
+async def decode_base64_chunks(chunks: AsyncIterable[bytes]) -> AsyncGenerator[bytes, None]:
+    """Decodes a base64 payload received in chunks.
+
+    :param chunks: the chunks of the base64 payload.
+    :return: an asynchronous generator of the decoded chunks.
+    """
+    decoder = Base64StreamDecoder()
+    async for chunk in chunks:
+        decoded = decoder.decode(chunk)
+        if decoded:
+            yield decoded
+    last = decoder.flush()
+    if last:
+        yield last
+
+
+async def write_chunks(chunks: AsyncIterable[bytes], file_path: Union[str, Path]) -> Path:
+    """Writes chunks to a file as they are received.
+
+    :param chunks: the chunks to write.
+    :param file_path: the path of the file to write, overwritten if it already exists.
+    :return: the path of the written file.
+    """
+    file_path = Path(file_path)
+    with file_path.open("wb") as file:
+        async for chunk in chunks:
+            file.write(chunk)
+    return file_path
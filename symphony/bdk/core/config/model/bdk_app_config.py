@@ -6,8 +6,10 @@ class BdkAppConfig(BdkAuthenticationConfig):
     """
 
     def __init__(self, config):
+        self.validated_jwt_cache_size = 0
         if config is not None:
             self.app_id = config.get("appId")
+            self.validated_jwt_cache_size = config.get("validatedJwtCacheSize", 0)
             super().__init__(private_key_config=config.get("privateKey"), certificate_config=config.get("certificate"))
         else:
             super().__init__()
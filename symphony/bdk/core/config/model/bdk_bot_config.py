@@ -1,4 +1,5 @@
 from symphony.bdk.core.config.model.bdk_authentication_config import BdkAuthenticationConfig
+from symphony.bdk.core.config.model.bdk_token_renewal_config import BdkTokenRenewalConfig
 
 
 class BdkBotConfig(BdkAuthenticationConfig):
@@ -7,6 +8,8 @@ class BdkBotConfig(BdkAuthenticationConfig):
     def __init__(self, config):
         if config is not None:
             self.username = config.get("username")
+            self.token_renewal = BdkTokenRenewalConfig(config.get("tokenRenewal"))
             super().__init__(private_key_config=config.get("privateKey"), certificate_config=config.get("certificate"))
         else:
+            self.token_renewal = BdkTokenRenewalConfig(None)
             super().__init__()
@@ -0,0 +1,19 @@
+class BdkCacheConfig:
+    """Class holding the configuration of an in-memory cache of the BDK services.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_TTL_SECONDS = 300
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the cache configuration parameters.
+        """
+        self.enabled = False
+        self.max_size = self.DEFAULT_MAX_SIZE
+        self.ttl = self.DEFAULT_TTL_SECONDS
+        if config is not None:
+            self.enabled = config.get("enabled", False)
+            self.max_size = config.get("maxSize", self.DEFAULT_MAX_SIZE)
+            self.ttl = config.get("ttlSeconds", self.DEFAULT_TTL_SECONDS)
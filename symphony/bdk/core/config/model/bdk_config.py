@@ -1,5 +1,6 @@
 from symphony.bdk.core.config.model.bdk_app_config import BdkAppConfig
 from symphony.bdk.core.config.model.bdk_bot_config import BdkBotConfig
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
 from symphony.bdk.core.config.model.bdk_client_config import BdkClientConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.config.model.bdk_server_config import BdkServerConfig
@@ -30,6 +31,11 @@ class BdkConfig(BdkServerConfig):
         self.datafeed = BdkDatafeedConfig(config.get("datafeed"))
         self.datahose = BdkDatahoseConfig(config.get("datahose"))
         self.retry = BdkRetryConfig(config.get("retry"))
+        self.lazy_deserialization = config.get("lazyDeserialization", False)
+        self.json_codec = config.get("jsonCodec", "json")
+        self.user_cache = BdkCacheConfig(config.get("userCache"))
+        self.room_membership_cache = BdkCacheConfig(config.get("roomMembershipCache"))
+        self.stream_cache = BdkCacheConfig(config.get("streamCache"))
 
     def is_bot_configured(self) -> bool:
         """
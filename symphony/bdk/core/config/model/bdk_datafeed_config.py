@@ -1,10 +1,17 @@
 import logging
 from pathlib import Path
 
+from symphony.bdk.core.config.exception import BdkConfigError
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
+from symphony.bdk.core.config.model.bdk_spool_config import BdkSpoolConfig
 
 VERSION = "version"
 DF_ID_FILE_PATH = "idFilePath"
+MAX_CONCURRENT_LISTENER_TASKS = "maxConcurrentListenerTasks"
+MAX_UNACKED_BATCHES = "maxUnackedBatches"
+EVENT_DEDUPLICATION = "eventDeduplication"
+SPOOL = "spool"
 DF_V1 = "v1"
 DF_V2 = "v2"
 
@@ -20,6 +27,19 @@ def log_dfv1_deprecation(version):
             "documentation https://docs.developers.symphony.com/building-bots-on-symphony/datafeed)")
 
 
+def get_max_concurrent_listener_tasks(config):
+    """Returns the maximum number of listener calls running at the same time of a datafeed or datahose configuration.
+
+    :param config: the dict containing the datafeed or datahose specific configuration.
+    :return: the maximum number of listener calls, None if not bounded.
+    :raise BdkConfigError: if the value is not a positive integer.
+    """
+    value = config.get(MAX_CONCURRENT_LISTENER_TASKS)
+    if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+        raise BdkConfigError(f"{MAX_CONCURRENT_LISTENER_TASKS} must be a positive integer, got {value!r}")
+    return value
+
+
 class BdkDatafeedConfig:
     """Class holding datafeed specific configuration.
     """
@@ -32,7 +52,15 @@ class BdkDatafeedConfig:
         self.version = DF_V2
         self.id_file_path = ""
         self.retry = BdkRetryConfig(dict(maxAttempts=BdkRetryConfig.INFINITE_MAX_ATTEMPTS))
+        self.max_concurrent_listener_tasks = None
+        self.max_unacked_batches = None
+        self.event_deduplication = BdkCacheConfig(None)
+        self.spool = BdkSpoolConfig(None)
         if config is not None:
+            self.max_concurrent_listener_tasks = get_max_concurrent_listener_tasks(config)
+            self.max_unacked_batches = config.get(MAX_UNACKED_BATCHES)
+            self.event_deduplication = BdkCacheConfig(config.get(EVENT_DEDUPLICATION))
+            self.spool = BdkSpoolConfig(config.get(SPOOL))
             self.id_file_path = Path(config.get(DF_ID_FILE_PATH)) if DF_ID_FILE_PATH in config else ""
             log_dfv1_deprecation(config.get(VERSION))
             self.version = config.get(VERSION)
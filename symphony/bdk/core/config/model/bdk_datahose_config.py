@@ -1,4 +1,8 @@
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
+from symphony.bdk.core.config.model.bdk_datafeed_config import MAX_UNACKED_BATCHES, EVENT_DEDUPLICATION, SPOOL, \
+    get_max_concurrent_listener_tasks
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
+from symphony.bdk.core.config.model.bdk_spool_config import BdkSpoolConfig
 
 TAG = "tag"
 EVENT_TYPES = "eventTypes"
@@ -17,7 +21,15 @@ class BdkDatahoseConfig:
         self.tag = None
         self.event_types = None
         self.retry = BdkRetryConfig(dict(maxAttempts=BdkRetryConfig.INFINITE_MAX_ATTEMPTS))
+        self.max_concurrent_listener_tasks = None
+        self.max_unacked_batches = None
+        self.event_deduplication = BdkCacheConfig(None)
+        self.spool = BdkSpoolConfig(None)
         if config is not None:
+            self.max_concurrent_listener_tasks = get_max_concurrent_listener_tasks(config)
+            self.max_unacked_batches = config.get(MAX_UNACKED_BATCHES)
+            self.event_deduplication = BdkCacheConfig(config.get(EVENT_DEDUPLICATION))
+            self.spool = BdkSpoolConfig(config.get(SPOOL))
             self.tag = config.get(TAG)
             self.event_types = config.get(EVENT_TYPES)
             if RETRY in config:
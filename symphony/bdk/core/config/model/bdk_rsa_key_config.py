@@ -1,9 +1,14 @@
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+
 class BdkRsaKeyConfig:
     """Class containing the bot's RSA Key configuration
     """
     def __init__(self, path=None, content=""):
         self._path = path
         self._content = content
+        self._private_key = None
 
     @property
     def path(self):
@@ -23,6 +28,7 @@ class BdkRsaKeyConfig:
         """
         self._content = rsa_key_content
         self._path = None
+        self._private_key = None
 
     @path.setter
     def path(self, rsa_key_path):
@@ -31,6 +37,7 @@ class BdkRsaKeyConfig:
         """
         self._path = rsa_key_path
         self._content = None
+        self._private_key = None
 
     def is_configured(self) -> bool:
         """"Check if the RSA authentication is configured or not
@@ -56,6 +63,16 @@ class BdkRsaKeyConfig:
         return self._load_key_from_path() \
             if self._path is not None else self._content
 
+    def get_private_key(self) -> RSAPrivateKey:
+        """Loads and parses the private key, once: the parsed key is reused until the path or the content is changed.
+        A key file modified on disk is therefore only reloaded after a restart or after the path is set again.
+
+        :return: the parsed private key.
+        """
+        if self._private_key is None:
+            self._private_key = load_pem_private_key(self.get_private_key_content().encode(), password=None)
+        return self._private_key
+
     def _load_key_from_path(self):
         with open(self._path, "r") as file:
             private_key_content = file.readlines()
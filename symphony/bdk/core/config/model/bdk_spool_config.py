@@ -0,0 +1,30 @@
+from pathlib import Path
+
+
+class BdkSpoolConfig:
+    """Class holding the configuration of the spool file in which the events read by a datafeed loop are persisted
+    before being acknowledged.
+    """
+
+    DEFAULT_MAX_PENDING_EVENTS = 10000
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the spool configuration parameters.
+        """
+        self.path = None
+        self.fsync = True
+        self.max_pending_events = self.DEFAULT_MAX_PENDING_EVENTS
+        if config is not None:
+            self.path = Path(config.get("path")) if config.get("path") else None
+            self.fsync = config.get("fsync", True)
+            self.max_pending_events = config.get("maxPendingEvents", self.DEFAULT_MAX_PENDING_EVENTS)
+
+    @property
+    def enabled(self) -> bool:
+        """
+
+        :return: True if a spool file path is configured, False otherwise.
+        """
+        return self.path is not None
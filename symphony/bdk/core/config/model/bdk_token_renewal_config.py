@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+
+class BdkTokenRenewalConfig:
+    """Class holding the configuration of the background renewal of the bot session and key manager tokens.
+    """
+
+    DEFAULT_RENEWAL_MARGIN = 60
+
+    def __init__(self, config):
+        """
+
+        :param config: the dict containing the token renewal configuration parameters.
+        """
+        self.enabled = False
+        self.token_lifetime = None
+        self.renewal_margin = timedelta(seconds=self.DEFAULT_RENEWAL_MARGIN)
+        if config is not None:
+            self.enabled = config.get("enabled", False)
+            if config.get("tokenLifetimeSeconds") is not None:
+                self.token_lifetime = timedelta(seconds=config.get("tokenLifetimeSeconds"))
+            self.renewal_margin = timedelta(seconds=config.get("renewalMarginSeconds", self.DEFAULT_RENEWAL_MARGIN))
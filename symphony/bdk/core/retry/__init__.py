@@ -5,7 +5,7 @@ from functools import wraps
 from tenacity import stop_after_attempt, wait_exponential, before_sleep_log
 
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
-from symphony.bdk.core.retry.strategy import refresh_session_if_unauthorized
+from symphony.bdk.core.retry.strategy import record_auth_generation, refresh_session_if_unauthorized
 
 from ._asyncio import AsyncRetrying
 
@@ -34,7 +34,7 @@ def retry(*dargs, **dkw):
             retry_config: BdkRetryConfig = getattr(self, '_retry_config')
             logger = logging.getLogger(self.__module__)
             _before_sleep = before_sleep_log(logger, logging.INFO)
-            default_kwargs.update(dict(before_sleep=_before_sleep))
+            default_kwargs.update(dict(before=record_auth_generation, before_sleep=_before_sleep))
             if retry_config is not None:
                 config_kwargs = dict(retry=retry_function,
                                      wait=wait_exponential(multiplier=retry_config.multiplier,
@@ -66,6 +66,29 @@ def is_network_or_minor_error_or_client(exception: Exception) -> bool:
     return is_client_timeout_error(exception)
 
 
+def record_auth_generation(retry_state: RetryCallState):
+    """Records, before each attempt, the generation of the AuthSession tokens the attempt is going to use
+
+    The recorded generation is used by :py:func:`refresh_auth_session` to not refresh tokens which have already been
+    refreshed since the attempt started, e.g. by a concurrent call which failed with a 401 as well.
+    """
+    auth_session = getattr(retry_state.args[0], "_auth_session", None) if retry_state.args else None
+    retry_state.auth_generation = getattr(auth_session, "generation", None)
+
+
+async def refresh_auth_session(retry_state: RetryCallState):
+    """Refreshes the AuthSession tokens used by the failed attempt, unless they have been refreshed since
+
+    Concurrent refreshes of the same AuthSession are coalesced into a single re-authentication.
+    """
+    service_auth_session = retry_state.args[0]._auth_session
+    generation = getattr(retry_state, "auth_generation", None)
+    if isinstance(generation, int):
+        await service_auth_session.refresh(generation)
+    else:
+        await service_auth_session.refresh()
+
+
 def authentication_retry(retry_state: RetryCallState):
     """Authentication retry strategy
 
@@ -94,8 +117,7 @@ async def refresh_session_if_unauthorized(retry_state: RetryCallState):
         exception = retry_state.outcome.exception()
         if is_network_or_minor_error(exception):
             if is_unauthorized(exception):
-                service_auth_session = retry_state.args[0]._auth_session
-                await service_auth_session.refresh()
+                await refresh_auth_session(retry_state)
             return True
     return False
 
@@ -114,8 +136,7 @@ async def read_datafeed_retry(retry_state: RetryCallState):
                 datafeed_service = retry_state.args[0]  # datafeed_service is an AbstractDataFeedLoop instance
                 await datafeed_service.recreate_datafeed()
             elif is_unauthorized(exception):
-                service_auth_session = retry_state.args[0]._auth_session
-                await service_auth_session.refresh()
+                await refresh_auth_session(retry_state)
             return True
         raise exception
     return False
@@ -131,8 +152,11 @@ async def read_datahose_retry(retry_state: RetryCallState):
     if retry_state.outcome.failed:
         exception = retry_state.outcome.exception()
         if is_network_or_minor_error(exception):
-            service_auth_session = retry_state.args[0]._auth_session
-            await service_auth_session.refresh()
+            if is_unauthorized(exception):
+                await refresh_auth_session(retry_state)
+            else:
+                # not a token expiry, the tokens are not known to be invalid
+                await retry_state.args[0]._auth_session.refresh()
             return True
         raise exception
     return False
@@ -1,10 +1,13 @@
+import asyncio
 import logging
 import time
 from abc import abstractmethod, ABC
+from collections import deque
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop
+from symphony.bdk.core.service.datafeed.event_spool import EventSpool
 from symphony.bdk.core.service.datafeed.exception import EventError
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
@@ -29,8 +32,41 @@ class AbstractAckIdEventLoop(AbstractDatafeedLoop, ABC):
         """
         super().__init__(datafeed_api, session_service, auth_session, config)
         self._ack_id = ""
+        self._max_unacked_batches = config.datafeed.max_unacked_batches
+        # tasks handling the batches of events read in pipelined mode, with their ack id, in the order they were read
+        self._unacked_batches = deque()
+        self._spool_config = config.datafeed.spool
+        self._spool = None
+        self._spooled_events = None
+        self._spool_progress = None
+        self._spool_consumer = None
+
+    async def _run_loop(self):
+        if not self._spool_config.enabled:
+            await super()._run_loop()
+            return
+
+        spool = EventSpool(self._spool_config.path, self._spool_config.fsync)
+        replayed_events = await asyncio.to_thread(spool.open)
+        self._spool = spool
+        self._spooled_events = asyncio.Queue()
+        self._spool_progress = asyncio.Event()
+        if replayed_events:
+            logger.info("Dispatching %s events not handled before the loop was stopped", len(replayed_events))
+        for entry in replayed_events:
+            self._spooled_events.put_nowait(entry)
+        self._spool_consumer = asyncio.create_task(self._consume_spooled_events())
+        await super()._run_loop()
 
     async def _run_loop_iteration(self):
+        if self._spool is not None:
+            await self._run_spooled_loop_iteration()
+            return
+
+        if self._max_unacked_batches and self._max_unacked_batches > 1:
+            await self._run_pipelined_loop_iteration()
+            return
+
         events = await self._read_events()
 
         is_run_successful = await self._run_all_listener_tasks(events.events)
@@ -39,6 +75,112 @@ class AbstractAckIdEventLoop(AbstractDatafeedLoop, ABC):
             # if not updated, events will be requeued after some time, typically 30s
             self._ack_id = events.ack_id
 
+    async def _run_pipelined_loop_iteration(self):
+        # the next batch is read while the previous ones are still being handled, unless there are too many of them
+        self._ack_handled_batches()
+        while len(self._unacked_batches) >= self._max_unacked_batches:
+            await asyncio.wait([self._unacked_batches[0][0]])
+            self._ack_handled_batches()
+
+        events = await self._read_events()
+        batch_task = asyncio.create_task(self._run_all_listener_tasks(events.events))
+        self._unacked_batches.append((batch_task, events.ack_id))
+
+    def _ack_handled_batches(self):
+        # batches are acked in the order they were read, as in the sequential mode, so that the ack id of a batch
+        # is never overwritten by the one of a previous batch
+        while self._unacked_batches and self._unacked_batches[0][0].done():
+            batch_task, ack_id = self._unacked_batches.popleft()
+            if batch_task.result() and ack_id is not None:
+                self._ack_id = ack_id
+
+    async def _run_spooled_loop_iteration(self):
+        # the events are acked as soon as they are persisted, the listeners handling them at their own pace
+        while True:
+            if self._spool_consumer.done():
+                # raises the error which stopped the dispatch of the events
+                self._spool_consumer.result()
+            if self._spool.pending_count < self._spool_config.max_pending_events:
+                break
+            self._spool_progress.clear()
+            await self._spool_progress.wait()
+
+        events = await self._read_events()
+        for entry in await self._spool.append(events.events or []):
+            self._spooled_events.put_nowait(entry)
+        self._ack_id = events.ack_id
+
+    async def _consume_spooled_events(self):
+        try:
+            while True:
+                sequence, event = await self._spooled_events.get()
+                try:
+                    tasks = await self._create_listener_tasks([event])
+                    # tracked with the listener tasks, so that stopping the loop waits for the event to be marked
+                    mark_task = asyncio.create_task(self._mark_spooled_event(sequence, event, tasks))
+                    self._tasks.add(mark_task)
+                    mark_task.add_done_callback(self._tasks.discard)
+                finally:
+                    self._spooled_events.task_done()
+        finally:
+            # wakes the loop up if it is waiting for pending events to be handled
+            self._spool_progress.set()
+
+    async def _mark_spooled_event(self, sequence, event, tasks):
+        if tasks:
+            await asyncio.wait(tasks)
+        if any(task.cancelled() for task in tasks):
+            # the loop has been stopped, the event will be dispatched again when it is restarted
+            return
+        if any(isinstance(task.exception(), EventError) for task in tasks):
+            logger.warning("Failed to process the event %s, it will be dispatched again when the loop is restarted",
+                           event.id)
+            self._spool.mark_failed(sequence)
+        else:
+            await self._save_handled_event(event, tasks)
+            await self._spool.mark_handled(sequence)
+        self._spool_progress.set()
+
+    def _reset_ack_id(self):
+        self._ack_id = ""
+        # the batches being handled belong to a previous datafeed and must not be acked
+        self._unacked_batches = deque((batch_task, None) for batch_task, _ in self._unacked_batches)
+
+    async def _stop_listener_tasks(self):
+        if self._spool is not None:
+            await self._stop_spool()
+            return
+
+        batch_tasks = [batch_task for batch_task, _ in self._unacked_batches]
+        self._unacked_batches.clear()
+        if not batch_tasks:
+            await super()._stop_listener_tasks()
+        elif self._hard_kill:
+            for batch_task in batch_tasks:
+                batch_task.cancel()
+            await super()._stop_listener_tasks()
+            await asyncio.gather(*batch_tasks, return_exceptions=True)
+        else:
+            # the listener tasks of a batch may not all be created yet, waiting for the batch includes them
+            logger.debug("Waiting for %s batches of events to be handled", len(batch_tasks))
+            await asyncio.wait(batch_tasks, timeout=self._timeout)
+
+    async def _stop_spool(self):
+        if not self._hard_kill:
+            logger.debug("Waiting for %s spooled events to be dispatched", self._spooled_events.qsize())
+            dispatched = asyncio.create_task(self._spooled_events.join())
+            await asyncio.wait([dispatched, self._spool_consumer], timeout=self._timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+            dispatched.cancel()
+        # the events not dispatched yet stay in the spool file
+        self._spool_consumer.cancel()
+        await asyncio.gather(self._spool_consumer, return_exceptions=True)
+        await super()._stop_listener_tasks()
+        self._spool.close()
+        if not self._spool_consumer.cancelled():
+            # raises the error which stopped the dispatch of the events
+            self._spool_consumer.result()
+
     async def _run_all_listener_tasks(self, events):
         start = time.time()
         done_tasks = await self._run_listener_tasks(events)
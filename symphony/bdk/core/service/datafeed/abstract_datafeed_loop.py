@@ -4,14 +4,19 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Task
+from collections import deque
 from contextvars import ContextVar
 from enum import Enum
-from typing import List
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
+from symphony.bdk.core.service.datafeed.handled_events_repository import HandledEventsRepository, \
+    InMemoryHandledEventsRepository
 from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
 from symphony.bdk.core.service.session.session_service import SessionService
+from symphony.bdk.core.service.stream.stream_util import normalize_stream_id
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
 from symphony.bdk.gen.agent_model.v4_event import V4Event
 
@@ -54,11 +59,47 @@ class RealTimeEvent(Enum):
     MESSAGESUPPRESSED = ("on_message_suppressed", "message_suppressed")
 
 
+def event_stream_id(event: V4Event) -> Optional[str]:
+    """Returns the id of the stream an event happened in, URLSafe encoded.
+
+    :param event: the received event.
+    :return: the id of the stream of the event, None if the event does not relate to a stream.
+    """
+    try:
+        payload_field_name = RealTimeEvent[event.type].value[1]
+    except KeyError:
+        return None
+    event_field = getattr(event.payload, payload_field_name, None)
+    stream = getattr(event_field, "stream", None) or getattr(getattr(event_field, "message", None), "stream", None)
+    stream_id = getattr(stream, "stream_id", None)
+    return normalize_stream_id(stream_id) if stream_id else None
+
+
+def _is_handling(listener: RealTimeEventListener, listener_method_name: str) -> bool:
+    # listeners inheriting the no-op method of RealTimeEventListener do not need to be called
+    listener_method = getattr(listener, listener_method_name, None)
+    return getattr(listener_method, "__func__", None) is not getattr(RealTimeEventListener, listener_method_name)
+
+
 def _set_context_var(current_task, event, listener):
     event_id = getattr(event, "id", "None")
     event_listener_context.set(f"{current_task.get_name()}/{event_id}/{id(listener)}")
 
 
+class _ListenerCall(asyncio.Future):
+    """Call of a listener method for an event, run by one of the listener workers of a loop whose number of concurrent
+    listener calls is bounded. Completed as the listener task running the call would be.
+    """
+
+    def __init__(self, listener: RealTimeEventListener, event: V4Event):
+        super().__init__()
+        self.listener = listener
+        self.event = event
+
+    def get_name(self) -> str:
+        return f"{type(self.listener).__name__}/{getattr(self.event, 'id', None)}"
+
+
 class AbstractDatafeedLoop(ABC):
     """Base class for implementing the datafeed services.
 
@@ -78,13 +119,25 @@ class AbstractDatafeedLoop(ABC):
         self._datafeed_api = datafeed_api
         self._session_service = session_service
         self._listeners = []
+        self._listeners_by_event_type: Dict[str, List[RealTimeEventListener]] = {}
+        self._route_events()
         self._auth_session = auth_session
         self._api_client = datafeed_api.api_client
         self._running = False
         self._hard_kill = False
         self._timeout = None
-        self._tasks = []
+        self._tasks = set()
         self._retry_config = config.datafeed.retry
+        self._max_concurrent_listener_tasks = config.datafeed.max_concurrent_listener_tasks
+        # listener calls waiting for a worker, created on first use since asyncio primitives are bound to a loop
+        self._listener_calls = None
+        # listener calls which waited for the previous event of their lane, waiting for a worker too
+        self._released_listener_calls = deque()
+        self._listener_workers = set()
+        self._ordering_key = None
+        self._lanes = {}
+        self._listener_tasks_creation_lock = None
+        self._handled_events = self._create_handled_events_repository(config.datafeed.event_deduplication)
         self._bot_info = None
 
     @abstractmethod
@@ -117,6 +170,7 @@ class AbstractDatafeedLoop(ABC):
         :param listener: the RealTimeEventListener to be added.
         """
         self._listeners.append(listener)
+        self._route_events()
 
     def unsubscribe(self, listener: RealTimeEventListener):
         """Removes a given listener from the datafeed loop instance.
@@ -124,6 +178,37 @@ class AbstractDatafeedLoop(ABC):
         :param listener: the RealTimeEventListener to be removed.
         """
         self._listeners.remove(listener)
+        self._route_events()
+
+    def _route_events(self):
+        self._listeners_by_event_type = {
+            event_type.name: [listener for listener in self._listeners if _is_handling(listener, event_type.value[0])]
+            for event_type in RealTimeEvent
+        }
+
+    def order_events_by(self, key: Optional[Callable[[V4Event], Optional[Hashable]]] = event_stream_id):
+        """Makes the events with the same key be handled one after the other, in the order they are received, while
+        the events with different keys are still handled concurrently. Each event is handled by the listeners once all
+        of them have handled the previous event with the same key.
+
+        :param key: the function returning the key of an event, the id of its stream by default. The events whose key is
+          None are not ordered. If None, no events are ordered, which is the default.
+        """
+        self._ordering_key = key
+
+    @staticmethod
+    def _create_handled_events_repository(config: BdkCacheConfig) -> Optional[HandledEventsRepository]:
+        return InMemoryHandledEventsRepository(config.max_size, config.ttl) if config.enabled else None
+
+    def deduplicate_events(self, handled_events: Optional[HandledEventsRepository]):
+        """Makes the events re-delivered by the datafeed, e.g. when their batch has not been acknowledged, only be
+        dispatched again if they have not been successfully handled by all the listeners they were dispatched to.
+
+        :param handled_events: the repository storing the ids of the handled events, which can be shared by several
+          instances of the bot. If None, all the events are dispatched, which is the default unless
+          ``eventDeduplication`` is enabled in the configuration.
+        """
+        self._handled_events = handled_events
 
     async def _run_loop(self):
         self._running = True
@@ -146,9 +231,10 @@ class AbstractDatafeedLoop(ABC):
 
     async def _cancel_tasks(self):
         logger.debug("Cancelling %s listener tasks", len(self._tasks))
-        for task in self._tasks:
+        tasks = list(self._tasks)
+        for task in tasks:
             task.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _wait_for_completion_or_timeout(self):
         logger.debug("Waiting for %s listener tasks to finish", len(self._tasks))
@@ -158,33 +244,176 @@ class AbstractDatafeedLoop(ABC):
             logger.debug("Task completion timed out")
 
     async def _run_listener_tasks(self, events: List[V4Event]) -> List[Task]:
-        tasks = await self._create_listener_tasks(events)
+        tasks_by_event = await self._create_listener_tasks_by_event(events)
+        tasks = [task for _, event_tasks in tasks_by_event for task in event_tasks]
         if tasks:
             done, _ = await asyncio.wait(tasks)
+            # the batch is only done once its handled events are saved
+            await asyncio.gather(*(self._save_handled_event(event, event_tasks)
+                                   for event, event_tasks in tasks_by_event))
             return done
         return []
 
     async def _create_listener_tasks(self, events: List[V4Event]) -> List[Task]:
-        tasks = []
-        sanitized_events = filter(lambda e: e is not None, events) if events else []
+        tasks_by_event = await self._create_listener_tasks_by_event(events)
+        return [task for _, event_tasks in tasks_by_event for task in event_tasks]
+
+    async def _create_listener_tasks_by_event(self, events: List[V4Event]) -> List[Tuple[V4Event, List[Task]]]:
+        if self._listener_tasks_creation_lock is None:
+            self._listener_tasks_creation_lock = asyncio.Lock()
+        # batches handled concurrently, e.g. with pipelined reads, create their tasks one after the other in the order
+        # they were read, so that the lanes keep the order of the events
+        async with self._listener_tasks_creation_lock:
+            return await self._create_ordered_listener_tasks(events)
+
+    async def _create_ordered_listener_tasks(self, events: List[V4Event]) -> List[Tuple[V4Event, List[Task]]]:
+        tasks_by_event = []
+        sanitized_events = [e for e in events if e is not None] if events else []
+        handled_event_ids = await self._find_handled_events(sanitized_events)
 
         for event in sanitized_events:
-            for listener in self._listeners:
+            if event.id in handled_event_ids:
+                logger.debug("Event %s already handled, it will not be dispatched again", event.id)
+                continue
+            listeners = self._listeners_by_event_type.get(event.type)
+            if listeners is None:
+                logger.info("Received event with an unknown type: %s", event.type)
+                continue
+            if not listeners:
+                continue
+
+            key = self._ordering_key(event) if self._ordering_key is not None else None
+            previous = self._lanes.get(key) if key is not None else None
+
+            event_tasks = []
+            for listener in listeners:
                 if await listener.is_accepting_event(event, self._bot_info):
-                    task = asyncio.create_task(self._dispatch_to_listener_method(listener, event))
-                    tasks.append(task)
+                    event_tasks.append(await self._create_listener_task(listener, event, previous))
+
+            if key is not None and event_tasks:
+                self._append_to_lane(key, event_tasks)
+            if event_tasks:
+                tasks_by_event.append((event, event_tasks))
+
+        return tasks_by_event
+
+    async def _find_handled_events(self, events: List[V4Event]):
+        event_ids = [event.id for event in events if event.id]
+        if self._handled_events is None or not event_ids:
+            return set()
+        try:
+            return await self._handled_events.filter_handled(event_ids)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to retrieve the handled events, all the events will be dispatched", exc_info=True)
+            return set()
+
+    async def _save_handled_event(self, event: V4Event, event_tasks: List[Task]):
+        # an event is handled once all its listener tasks, already done, have succeeded
+        if self._handled_events is None or not event.id:
+            return
+        if any(task.cancelled() or task.exception() is not None for task in event_tasks):
+            return
+        try:
+            await self._handled_events.save(event.id)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to save the handled event %s", event.id, exc_info=True)
+
+    def _append_to_lane(self, key: Hashable, event_tasks: List[Task]):
+        # the next event with the same key waits for all the listeners of this one
+        lane_tail = asyncio.gather(*event_tasks, return_exceptions=True)
+        self._lanes[key] = lane_tail
+
+        def remove_lane(_):
+            if self._lanes.get(key) is lane_tail:
+                del self._lanes[key]
+
+        lane_tail.add_done_callback(remove_lane)
+
+    async def _create_listener_task(self, listener: RealTimeEventListener, event: V4Event,
+                                    previous: asyncio.Future = None) -> asyncio.Future:
+        if not self._max_concurrent_listener_tasks:
+            return asyncio.create_task(self._dispatch_to_listener_method(listener, event, previous))
+
+        listener_call = _ListenerCall(listener, event)
+        self._tasks.add(listener_call)
+        listener_call.add_done_callback(self._tasks.discard)
+        if previous is None or previous.done():
+            # waits while the workers are busy and the queue is full, which delays the next read of events
+            await self._get_listener_calls().put(listener_call)
+            self._start_listener_worker()
+        else:
+            # the call waits for the previous event of its lane without taking room in the queue nor a worker
+            previous.add_done_callback(lambda _: self._release_listener_call(listener_call))
+        return listener_call
+
+    def _get_listener_calls(self) -> asyncio.Queue:
+        if self._listener_calls is None:
+            self._listener_calls = asyncio.Queue(maxsize=self._max_concurrent_listener_tasks)
+        return self._listener_calls
 
-        return tasks
+    def _release_listener_call(self, listener_call: _ListenerCall):
+        if listener_call.done():
+            return
+        try:
+            self._get_listener_calls().put_nowait(listener_call)
+        except asyncio.QueueFull:
+            # the workers take the released calls first once they are done with their current one
+            self._released_listener_calls.append(listener_call)
+        self._start_listener_worker()
+
+    def _next_listener_call(self) -> Optional[_ListenerCall]:
+        if self._released_listener_calls:
+            return self._released_listener_calls.popleft()
+        try:
+            return self._get_listener_calls().get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    def _start_listener_worker(self):
+        # up to max_concurrent_listener_tasks workers, each one stopping once there is no call left to run
+        if len(self._listener_workers) < self._max_concurrent_listener_tasks:
+            worker = asyncio.create_task(self._run_listener_worker())
+            self._listener_workers.add(worker)
+            self._tasks.add(worker)
+            worker.add_done_callback(self._tasks.discard)
+
+    async def _run_listener_worker(self):
+        current_task = asyncio.current_task()
+        try:
+            listener_call = self._next_listener_call()
+            while listener_call is not None:
+                if not listener_call.done():
+                    await self._run_listener_call(current_task, listener_call)
+                listener_call = self._next_listener_call()
+        finally:
+            self._listener_workers.discard(current_task)
+
+    async def _run_listener_call(self, current_task: Task, listener_call: _ListenerCall):
+        _set_context_var(current_task, listener_call.event, listener_call.listener)
+        try:
+            await self._run_listener_method(listener_call.listener, listener_call.event)
+        except asyncio.CancelledError:
+            listener_call.cancel()
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            if not listener_call.done():
+                listener_call.set_exception(exc)
+        else:
+            if not listener_call.done():
+                listener_call.set_result(None)
 
-    async def _dispatch_to_listener_method(self, listener: RealTimeEventListener, event: V4Event):
+    async def _dispatch_to_listener_method(self, listener: RealTimeEventListener, event: V4Event,
+                                           previous: asyncio.Future = None):
         current_task = asyncio.current_task()
         _set_context_var(current_task, event, listener)
 
-        self._tasks.append(current_task)
+        self._tasks.add(current_task)
         try:
+            if previous is not None:
+                await asyncio.wait([previous])
             await self._run_listener_method(listener, event)
         finally:
-            self._tasks.remove(current_task)
+            self._tasks.discard(current_task)
 
     @staticmethod
     async def _run_listener_method(listener: RealTimeEventListener, event: V4Event):
@@ -78,7 +78,7 @@ class DatafeedLoopV2(AbstractAckIdEventLoop):
         datafeed = await self._create_datafeed()
 
         self._datafeed_id = datafeed.id
-        self._ack_id = ""
+        self._reset_ack_id()
 
     @retry
     async def _retrieve_datafeed(self) -> Optional[V5Datafeed]:
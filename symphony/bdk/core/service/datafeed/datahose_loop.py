@@ -38,6 +38,10 @@ class DatahoseLoop(AbstractAckIdEventLoop, AbstractDatahoseLoop):
             self._tag = not_truncated_tag[:DATAHOSE_TAG_MAX_LENGTH]
             self._retry = config.datahose.retry
             self._event_types = config.datahose.event_types
+            self._max_concurrent_listener_tasks = config.datahose.max_concurrent_listener_tasks
+            self._max_unacked_batches = config.datahose.max_unacked_batches
+            self._handled_events = self._create_handled_events_repository(config.datahose.event_deduplication)
+            self._spool_config = config.datahose.spool
 
     async def start(self):
         if self._running:
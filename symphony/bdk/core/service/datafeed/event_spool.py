@@ -0,0 +1,177 @@
+"""Module containing the spool file in which the events read from the datafeed are persisted before being
+acknowledged, so that they are handled even if the bot stops before dispatching them.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Union
+
+from symphony.bdk.gen.api_client import ApiClient
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.configuration import Configuration
+from symphony.bdk.gen.model_utils import validate_and_convert_types
+
+# number of events marked as handled after which the spool file is rewritten with the pending events only
+COMPACTION_THRESHOLD = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class EventSpool:
+    """Append-only file of the events read from the datafeed.
+
+    Each event is written with a sequence number, then a marker is appended once it has been handled. When the spool
+    is opened, the events which were not marked as handled are returned so that they are dispatched again. The file
+    is rewritten with the pending events only once many events have been handled, and when it is opened.
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = True):
+        """
+
+        :param path: the path of the spool file, created if it does not exist.
+        :param fsync: whether the file is flushed to the disk after each batch of events is written, so that the events
+          are not lost if the host crashes. Otherwise they are only written to the operating system buffers.
+        """
+        self._path = Path(path)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending: Dict[int, str] = {}
+        self._failed: Set[int] = set()
+        self._next_sequence = 0
+        self._handled_since_compaction = 0
+        self._configuration = Configuration()
+
+    @property
+    def pending_count(self) -> int:
+        """
+
+        :return: the number of spooled events being handled, excluding the ones whose handling failed.
+        """
+        return len(self._pending) - len(self._failed)
+
+    def open(self) -> List[Tuple[int, V4Event]]:
+        """Opens the spool file and reads the events which have not been handled.
+
+        :return: the sequence numbers and events not marked as handled, in the order they were spooled.
+        """
+        with self._lock:
+            self._pending = {}
+            self._failed = set()
+            if self._path.exists():
+                self._read_records()
+            self._compact()
+        return [(sequence, self._deserialize(line)) for sequence, line in self._pending.items()]
+
+    async def append(self, events: List[V4Event]) -> List[Tuple[int, V4Event]]:
+        """Writes events at the end of the spool file, and flushes them to the disk if fsync is enabled.
+
+        :param events: the events to write.
+        :return: the sequence numbers and events written.
+        """
+        entries, lines = [], []
+        for event in events:
+            line = json.dumps({"sequence": self._next_sequence, "event": ApiClient.sanitize_for_serialization(event)})
+            entries.append((self._next_sequence, event))
+            lines.append(line)
+            self._next_sequence += 1
+        if lines:
+            await asyncio.to_thread(self._write, [sequence for sequence, _ in entries], lines)
+        return entries
+
+    async def mark_handled(self, sequence: int):
+        """Records that an event has been handled, so that it is not returned when the spool is opened again.
+
+        :param sequence: the sequence number of the event.
+        """
+        if sequence not in self._pending:
+            return
+        self._failed.discard(sequence)
+        await asyncio.to_thread(self._write_handled, sequence)
+
+    def mark_failed(self, sequence: int):
+        """Records that the handling of an event failed. The event is kept in the spool file, to be returned when the
+        spool is opened again, but is no longer counted as pending.
+
+        :param sequence: the sequence number of the event.
+        """
+        if sequence in self._pending:
+            self._failed.add(sequence)
+
+    def close(self):
+        """Closes the spool file. The events not marked as handled are kept in it.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _read_records(self):
+        with self._path.open("r", encoding="utf-8") as spool_file:
+            for line in spool_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may have been partially written when the bot stopped
+                    logger.warning("Ignoring an invalid line of the spool file %s", self._path)
+                    continue
+                if "event" in record:
+                    self._pending[record["sequence"]] = line.rstrip("\n")
+                    self._next_sequence = max(self._next_sequence, record["sequence"] + 1)
+                else:
+                    self._pending.pop(record.get("handled"), None)
+
+    # the pending events are only updated while holding the lock, so that a compaction never drops an event written
+    # concurrently
+    def _write(self, sequences: List[int], lines: List[str]):
+        with self._lock:
+            self._file.write("".join(line + "\n" for line in lines))
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._pending.update(zip(sequences, lines))
+
+    def _write_handled(self, sequence: int):
+        with self._lock:
+            if self._file is None or self._pending.pop(sequence, None) is None:
+                return
+            self._handled_since_compaction += 1
+            if self._handled_since_compaction >= COMPACTION_THRESHOLD:
+                self._compact()
+            else:
+                # losing this marker only leads to the event being dispatched again
+                self._file.write(json.dumps({"handled": sequence}) + "\n")
+                self._file.flush()
+
+    def _compact(self):
+        if self._file is not None:
+            self._file.close()
+        compacted_path = self._path.with_name(self._path.name + ".tmp")
+        with compacted_path.open("w", encoding="utf-8") as compacted_file:
+            compacted_file.write("".join(line + "\n" for line in self._pending.values()))
+            compacted_file.flush()
+            if self._fsync:
+                os.fsync(compacted_file.fileno())
+        os.replace(compacted_path, self._path)
+        if self._fsync:
+            self._fsync_directory()
+        self._file = self._path.open("a", encoding="utf-8")
+        self._handled_since_compaction = 0
+
+    def _fsync_directory(self):
+        # the renaming of the compacted file is only durable once the directory is flushed to the disk too
+        if not hasattr(os, "O_DIRECTORY"):
+            # directories cannot be opened, e.g. on Windows
+            return
+        directory = os.open(self._path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    def _deserialize(self, line: str) -> V4Event:
+        return validate_and_convert_types(json.loads(line)["event"], (V4Event,), ["spooled_event"], True, True,
+                                          configuration=self._configuration)
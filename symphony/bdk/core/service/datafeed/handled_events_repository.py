@@ -0,0 +1,134 @@
+"""Module which handles the storage of the ids of the datafeed events already handled, so that the events re-delivered
+by the datafeed are not dispatched again.
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Set, Union
+
+from symphony.bdk.core.cache import LruCache
+
+DEFAULT_MAX_EVENTS = 10000
+DEFAULT_TTL_SECONDS = 300
+# maximum number of parameters of a SQLite query in its older versions
+_SQLITE_MAX_PARAMETERS = 999
+# number of saved event ids after which the expired and oldest ones are removed from a SQLite database
+_SQLITE_PRUNING_INTERVAL = 100
+
+
+class HandledEventsRepository(ABC):
+    """Base abstract class to store and retrieve the ids of the handled events.
+    """
+
+    @abstractmethod
+    async def save(self, event_id: str) -> None:
+        """Records that an event has been successfully handled by all the listeners it was dispatched to.
+
+        :param event_id: the id of the event.
+        :return: None
+        """
+
+    @abstractmethod
+    async def filter_handled(self, event_ids: List[str]) -> Set[str]:
+        """Retrieves which of the given events have already been handled.
+
+        :param event_ids: the ids of the events to check.
+        :return: the ids of the events already handled, among the given ones.
+        """
+
+
+class InMemoryHandledEventsRepository(HandledEventsRepository):
+    """Class implementing an in-memory HandledEventsRepository.
+    Event ids are dropped once expired, and the least recently used ones are evicted when the maximum number of events
+    is reached.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS, ttl: float = DEFAULT_TTL_SECONDS):
+        """
+
+        :param max_events: the maximum number of event ids kept.
+        :param ttl: the number of seconds after which an event id is dropped.
+        """
+        self._event_ids = LruCache(max_events, ttl)
+
+    async def save(self, event_id: str) -> None:
+        self._event_ids.put(event_id, True)
+
+    async def filter_handled(self, event_ids: List[str]) -> Set[str]:
+        return {event_id for event_id in event_ids if self._event_ids.get(event_id, False)}
+
+
+class SqliteHandledEventsRepository(HandledEventsRepository):
+    """Class implementing a HandledEventsRepository stored in a SQLite database file, which can be shared by several
+    instances of the same bot reading the same datafeed.
+    Expired event ids and the oldest ones above the maximum number of events are removed every 100 saved events, in the
+    same transaction as the event saved.
+    """
+
+    def __init__(self, database: Union[str, Path], max_events: int = DEFAULT_MAX_EVENTS,
+                 ttl: float = DEFAULT_TTL_SECONDS):
+        """
+
+        :param database: the path of the SQLite database file, created if it does not exist.
+        :param max_events: the maximum number of event ids kept.
+        :param ttl: the number of seconds after which an event id is dropped.
+        """
+        self._max_events = max_events
+        self._ttl = ttl
+        self._saves_since_pruning = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database), timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS handled_events ("
+                                     "event_id TEXT PRIMARY KEY, handled_at REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS handled_events_handled_at "
+                                     "ON handled_events (handled_at)")
+
+    async def save(self, event_id: str) -> None:
+        await asyncio.to_thread(self._save, event_id)
+
+    async def filter_handled(self, event_ids: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self._filter_handled, event_ids)
+
+    def close(self):
+        """Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _save(self, event_id):
+        now = time.time()
+        with self._lock:
+            self._saves_since_pruning += 1
+            if self._saves_since_pruning < _SQLITE_PRUNING_INTERVAL:
+                self._insert(event_id, now)
+                return
+            self._saves_since_pruning = 0
+            with self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.execute("DELETE FROM handled_events WHERE handled_at <= ?", (now - self._ttl,))
+                self._insert(event_id, now)
+                # rows are inserted with increasing rowids, the oldest ones have the lowest
+                self._connection.execute("DELETE FROM handled_events WHERE rowid <= "
+                                         "(SELECT MAX(rowid) FROM handled_events) - ?", (self._max_events,))
+
+    def _insert(self, event_id, handled_at):
+        self._connection.execute("INSERT OR REPLACE INTO handled_events (event_id, handled_at) VALUES (?, ?)",
+                                 (event_id, handled_at))
+
+    def _filter_handled(self, event_ids):
+        handled = set()
+        min_handled_at = time.time() - self._ttl
+        for start in range(0, len(event_ids), _SQLITE_MAX_PARAMETERS - 1):
+            chunk = event_ids[start:start + _SQLITE_MAX_PARAMETERS - 1]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows = self._connection.execute(f"SELECT event_id FROM handled_events WHERE handled_at > ? "
+                                                f"AND event_id IN ({placeholders})",
+                                                (min_handled_at, *chunk)).fetchall()
+            handled.update(row[0] for row in rows)
+        return handled
@@ -1,6 +1,11 @@
+from pathlib import Path
 from typing import Union, List, Tuple, IO, AsyncGenerator
 
+from aiohttp import ClientResponse
+
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.client.streaming import DEFAULT_CHUNK_SIZE, decode_base64_chunks, iter_response_chunks, \
+    write_chunks
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.service.message.model import Message
 from symphony.bdk.core.service.message.multi_attachments_messages_api import MultiAttachmentsMessagesApi
@@ -307,6 +312,68 @@ class MessageService(OboMessageService):
         }
         return await self._attachment_api.v1_stream_sid_attachment_get(**params)
 
+    async def stream_attachment(
+            self,
+            stream_id: str,
+            message_id: str,
+            attachment_id: str,
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[bytes, None]:
+        """Downloads the attachment body by chunks, decoding it from base 64 as it is received, so that the whole
+        attachment is never held in memory.
+        See: `Attachment <https://developers.symphony.com/restapi/reference/attachment>`_
+
+        :param stream_id: The stream ID where to look for the attachment.
+        :param message_id: The ID of the message containing the attachment.
+        :param attachment_id: The ID of the attachment
+        :param chunk_size: The maximum size in bytes of the chunks read from the response.
+
+        :return: an asynchronous generator of the decoded attachment chunks.
+
+        """
+        response = await self._get_attachment_response(stream_id, message_id, attachment_id)
+        async for chunk in decode_base64_chunks(iter_response_chunks(response, chunk_size)):
+            yield chunk
+
+    async def download_attachment(
+            self,
+            stream_id: str,
+            message_id: str,
+            attachment_id: str,
+            file_path: Union[str, Path],
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Path:
+        """Downloads the attachment body by chunks into a file, decoded from base 64.
+        See: `Attachment <https://developers.symphony.com/restapi/reference/attachment>`_
+
+        :param stream_id: The stream ID where to look for the attachment.
+        :param message_id: The ID of the message containing the attachment.
+        :param attachment_id: The ID of the attachment
+        :param file_path: The path of the file to write the attachment to, overwritten if it already exists.
+        :param chunk_size: The maximum size in bytes of the chunks read from the response.
+
+        :return: the path of the written file.
+
+        """
+        return await write_chunks(self.stream_attachment(stream_id, message_id, attachment_id, chunk_size), file_path)
+
+    @retry
+    async def _get_attachment_response(
+            self,
+            stream_id: str,
+            message_id: str,
+            attachment_id: str
+    ) -> ClientResponse:
+        params = {
+            "sid": stream_id,
+            "file_id": attachment_id,
+            "message_id": message_id,
+            "session_token": await self._auth_session.session_token,
+            "key_manager_token": await self._auth_session.key_manager_token,
+            "_preload_content": False
+        }
+        return await self._attachment_api.v1_stream_sid_attachment_get(**params)
+
     async def get_message_status(
             self,
             message_id: str
@@ -448,7 +515,7 @@ class MessageService(OboMessageService):
         return message_list.value  # endpoint returns empty list when no values found
 
     async def search_all_messages(self, query: MessageSearchQuery, sort_dir: str = "desc", chunk_size: int = 50,
-                                  max_number: int = None) -> AsyncGenerator[V4Message, None]:
+                                  max_number: int = None, concurrency: int = 1) -> AsyncGenerator[V4Message, None]:
         """Searches for messages in the context of a specified user, given an argument-based query.
         See: `Message Search (using POST) <https://developers.symphony.com/restapi/reference/message-search-post>`_
 
@@ -456,13 +523,14 @@ class MessageService(OboMessageService):
         :param sort_dir: Sorting direction for response. Possible values are desc (default) and asc.
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
         :param max_number: the total maximum number of elements to retrieve
+        :param concurrency: the maximum number of pages retrieved concurrently, in order.
         :return: an asynchronous generator of matching messages
         """
 
         async def search_messages_one_page(skip, limit):
             return await self.search_messages(query, sort_dir, skip, limit)
 
-        return offset_based_pagination(search_messages_one_page, chunk_size, max_number)
+        return offset_based_pagination(search_messages_one_page, chunk_size, max_number, concurrency=concurrency)
 
     @retry
     async def update_message(self, stream_id: str, message_id: str, message: Union[str, Message], data=None,
@@ -20,16 +20,19 @@ class OboServices:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close_clients()
 
-    def __init__(self, config: BdkConfig, obo_session: OboAuthSession):
+    def __init__(self, config: BdkConfig, obo_session: OboAuthSession, api_client_factory: ApiClientFactory = None):
         """
 
         :param config: the BDK configuration.
         :param obo_session: the OBO session to use.
+        :param api_client_factory: the api client factory whose clients are used to perform the calls.
+          If None, a new factory is created and its clients are closed by :meth:`close_clients`.
         """
         self._config = config
         self._obo_session = obo_session
 
-        self._api_client_factory = ApiClientFactory(config)
+        self._owns_api_client_factory = api_client_factory is None
+        self._api_client_factory = ApiClientFactory(config) if api_client_factory is None else api_client_factory
         self._service_factory = OboServiceFactory(self._api_client_factory, self._obo_session, self._config)
         self._connection_service = self._service_factory.get_connection_service()
         self._message_service = self._service_factory.get_message_service()
@@ -72,7 +75,18 @@ class OboServices:
         """
         return self._signal_service
 
+    @property
+    def obo_session(self) -> OboAuthSession:
+        """
+
+        :return: the OBO session used by the services.
+        """
+        return self._obo_session
+
     async def close_clients(self):
         """Close all the existing api clients created by the api client factory.
+        Clients shared with the api client factory given at construction are left open.
         """
-        await self._api_client_factory.close_clients()
+        await self._user_service.loader().close()
+        if self._owns_api_client_factory:
+            await self._api_client_factory.close_clients()
@@ -1,13 +1,22 @@
 """This module takes care of creating generators from paginated endpoints, so that user do not have to care about
 making several calls to the same endpoint with the correct pagination values.
+
+Both generators can read ahead: with `prefetch` set to N, the next pages are retrieved in the background while the
+current one is consumed, up to N pages being retrieved or waiting to be consumed. As the offsets of the pages are known
+in advance, the offset based generator can also retrieve several pages concurrently with `concurrency`.
 """
-from typing import AsyncGenerator, TypeVar, Callable, Awaitable, Tuple
+import asyncio
+import contextlib
+from typing import AsyncGenerator, TypeVar, Callable, Awaitable, Tuple, List
 
 T = TypeVar('T')
 
+_END_OF_PAGES = object()
+
 
 async def offset_based_pagination(func: Callable[[int, int], Awaitable[T]],
-                                  chunk_size=50, max_number=None) -> AsyncGenerator[T, None]:
+                                  chunk_size=50, max_number=None, prefetch: int = 0, concurrency: int = 1,
+                                  ordered: bool = True) -> AsyncGenerator[T, None]:
     """Creates an asynchronous generator from a paginated endpoint. The generator makes the call to the underlying
     endpoint `func` until the `max_number` of items is reached or results are exhausted (i.e. `func` is None or empty).
 
@@ -16,34 +25,24 @@ async def offset_based_pagination(func: Callable[[int, int], Awaitable[T]],
     :param chunk_size: the maximum number of elements to retrieve in one call.
     :param max_number: the maximum total number of items to retrieve. If not specified or set to None, it will fetch all
       items until we retrieved all elements.
+    :param prefetch: the number of pages to retrieve ahead of the one being consumed. Defaults to 0, i.e. the next page
+      is only retrieved once the current one has been consumed.
+    :param concurrency: the maximum number of pages retrieved concurrently. Defaults to 1. If greater, the next pages
+      are requested in parallel, knowing their offsets in advance, until a page shorter than `chunk_size` is received.
+    :param ordered: when pages are retrieved concurrently, if False, items are yielded as soon as their page is
+      received instead of in the order of the pages. Defaults to True.
     :return: an asynchronous generator of elements which makes the calls to `func` with the correct parameters.
     """
-    if max_number is not None and max_number <= 0:
-        return
-
-    skip = 0
-    item_count = 0
-
-    chunk = await func(skip, chunk_size)
-    while chunk:
-        for item in chunk:
-            yield item
-
-            item_count += 1
-            if max_number is not None and item_count == max_number:
-                # max_number items already retrieved
-                return
-
-        if len(chunk) < chunk_size:
-            # received chunk has less elements than the sent chunk size: we are already at the end
-            return
-
-        skip += chunk_size
-        chunk = await func(skip, chunk_size)
+    if concurrency > 1:
+        pages = _parallel_offset_based_pages(func, chunk_size, max_number, concurrency, ordered)
+    else:
+        pages = _offset_based_pages(func, chunk_size, max_number)
+    async for item in _items(pages, max_number, prefetch):
+        yield item
 
 
 async def cursor_based_pagination(func: Callable[[int, str], Awaitable[Tuple[T, str]]],
-                                  chunk_size=100, max_number=None) -> AsyncGenerator[T, None]:
+                                  chunk_size=100, max_number=None, prefetch: int = 0) -> AsyncGenerator[T, None]:
     """Creates an asynchronous generator from a cursor based endpoint. The generator makes the call to the underlying
     endpoint `func` until the `max_number` of items is reached or results are exhausted (i.e. cursor returned by `func`
     is None).
@@ -55,20 +54,97 @@ async def cursor_based_pagination(func: Callable[[int, str], Awaitable[Tuple[T,
     :param chunk_size: the maximum number of elements to retrieve in one call.
     :param max_number: the maximum total number of items to retrieve. If not specified or set to None, it will fetch all
       items until we retrieved all elements.
+    :param prefetch: the number of pages to retrieve ahead of the one being consumed. Defaults to 0, i.e. the next page
+      is only retrieved once the current one has been consumed.
     :return: an asynchronous generator of elements which makes the calls to `func` with the correct parameters.
     """
-    if max_number is not None and max_number <= 0:
-        return
+    async for item in _items(_cursor_based_pages(func, chunk_size, max_number), max_number, prefetch):
+        yield item
 
+
+async def _offset_based_pages(func, chunk_size, max_number) -> AsyncGenerator[List, None]:
+    skip = 0
+    while max_number is None or skip < max_number:
+        chunk = await func(skip, chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+        if len(chunk) < chunk_size:
+            # received chunk has less elements than the sent chunk size: we are already at the end
+            return
+        skip += chunk_size
+
+
+async def _parallel_offset_based_pages(func, chunk_size, max_number, concurrency, ordered) \
+        -> AsyncGenerator[List, None]:
+    in_flight = {}  # index of the page -> task retrieving it
+    next_index = 0
+    next_ordered_index = 0
+    end_index = None  # index of the first page shorter than chunk_size
+
+    def can_request_next_page():
+        return len(in_flight) < concurrency \
+               and (end_index is None or next_index < end_index) \
+               and (max_number is None or next_index * chunk_size < max_number)
+
+    try:
+        while True:
+            while can_request_next_page():
+                in_flight[next_index] = asyncio.ensure_future(func(next_index * chunk_size, chunk_size))
+                next_index += 1
+            if not in_flight:
+                return
+
+            if ordered:
+                index = next_ordered_index
+                next_ordered_index += 1
+            else:
+                done, _ = await asyncio.wait(in_flight.values(), return_when=asyncio.FIRST_COMPLETED)
+                index = next(index for index, task in in_flight.items() if task in done)
+            chunk = await in_flight[index]
+            del in_flight[index]
+
+            if not chunk or len(chunk) < chunk_size:
+                # we are at the end: pages after this one are empty
+                end_index = index if end_index is None else min(end_index, index)
+                for later_index in [later_index for later_index in in_flight if later_index > end_index]:
+                    _discard(in_flight.pop(later_index))
+            if chunk:
+                yield chunk
+    finally:
+        for task in in_flight.values():
+            _discard(task)
+
+
+def _discard(task: asyncio.Future):
+    task.cancel()
+    if task.done() and not task.cancelled():
+        # marks the exception as retrieved, it is not relevant anymore
+        task.exception()
+
+
+async def _cursor_based_pages(func, chunk_size, max_number) -> AsyncGenerator[List, None]:
     after = None
     item_count = 0
-
-    while True:
+    while max_number is None or item_count < max_number:
         (result, after) = await func(chunk_size, after)
-        if result is None:
-            result = []
+        if result:
+            yield result
+            item_count += len(result)
 
-        for item in result:
+        if after is None:
+            # we exhausted the results
+            return
+
+
+async def _items(pages: AsyncGenerator[List, None], max_number, prefetch) -> AsyncGenerator[T, None]:
+    if max_number is not None and max_number <= 0:
+        return
+
+    item_count = 0
+    async for page in (_read_ahead(pages, prefetch) if prefetch > 0 else pages):
+        for item in page:
             yield item
 
             item_count += 1
@@ -76,6 +152,41 @@ async def cursor_based_pagination(func: Callable[[int, str], Awaitable[Tuple[T,
                 # max_number items already retrieved
                 return
 
-        if after is None:
-            # we exhausted the results
-            break
+
+async def _read_ahead(pages: AsyncGenerator[List, None], prefetch: int) -> AsyncGenerator[List, None]:
+    """Retrieves the pages in a background task, which is cancelled as soon as the returned generator is closed, e.g.
+    because its consumer stopped early. The pages generator is then closed once the task is done.
+    """
+    buffer = asyncio.Queue()
+    # a page is only retrieved once there is room for it, so that at most prefetch pages are retrieved or waiting to
+    # be consumed, the page held by the retrieving task included
+    room = asyncio.Semaphore(prefetch)
+
+    async def retrieve_pages():
+        try:
+            while True:
+                await room.acquire()
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                buffer.put_nowait(page)
+            buffer.put_nowait(_END_OF_PAGES)
+        except Exception as exc:  # pylint: disable=broad-except
+            buffer.put_nowait(exc)
+
+    retrieval = asyncio.ensure_future(retrieve_pages())
+    try:
+        while True:
+            page = await buffer.get()
+            room.release()
+            if page is _END_OF_PAGES:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        retrieval.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await retrieval
+        await pages.aclose()
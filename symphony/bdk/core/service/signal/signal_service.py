@@ -48,7 +48,8 @@ class OboSignalService:
             skip=skip, limit=limit, session_token=await self._auth_session.session_token,
             key_manager_token=await self._auth_session.key_manager_token)
 
-    async def list_all_signals(self, chunk_size: int = 50, max_number: int = None) -> AsyncGenerator[Signal, None]:
+    async def list_all_signals(self, chunk_size: int = 50, max_number: int = None,
+                               concurrency: int = 1) -> AsyncGenerator[Signal, None]:
         """Lists all signals on behalf of the user. The response includes signals that the user has created and
         public signals to which they have subscribed.
 
@@ -56,6 +57,7 @@ class OboSignalService:
 
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
         :param max_number: the total maximum number of elements to retrieve
+        :param concurrency: the maximum number of pages retrieved concurrently, in order.
         :return: an asynchronous generator of found signals
         """
 
@@ -63,7 +65,7 @@ class OboSignalService:
             result = await self.list_signals(skip, limit)
             return result.value if result else None
 
-        return offset_based_pagination(list_signals_one_page, chunk_size, max_number)
+        return offset_based_pagination(list_signals_one_page, chunk_size, max_number, concurrency=concurrency)
 
     @retry
     async def get_signal(self, signal_id: str) -> Signal:
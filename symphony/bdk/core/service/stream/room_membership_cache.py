@@ -0,0 +1,187 @@
+"""Module containing the cache of the members of the rooms, kept up to date from the datafeed events.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+from symphony.bdk.core.cache import LruCache
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.stream.stream_util import normalize_stream_id
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_member_demoted_from_owner import V4RoomMemberDemotedFromOwner
+from symphony.bdk.gen.agent_model.v4_room_member_promoted_to_owner import V4RoomMemberPromotedToOwner
+from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
+from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
+from symphony.bdk.gen.pod_model.membership_list import MembershipList
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+
+class RoomMembershipCache:
+    """Bounded in-memory cache of the members of the rooms and of whether they own the room.
+    The members of a room are loaded the first time they are needed, then kept up to date by the
+    :class:`RoomMembershipListener` and by the membership changes made through the BDK. They are reloaded once they
+    expire, so that the events which may have been missed are eventually reconciled.
+    """
+
+    def __init__(self, list_room_members: Callable[[str], Awaitable[MembershipList]], max_size: int, ttl: float):
+        """
+
+        :param list_room_members: the coroutine function returning the members of a room.
+        :param max_size: the maximum number of rooms whose members are kept in the cache.
+        :param ttl: the number of seconds after which the members of a room are reloaded.
+        """
+        self._list_room_members = list_room_members
+        self._rooms = LruCache(max_size, ttl)
+        self._loading_tasks = {}
+        self._changed_while_loading = set()
+
+    @property
+    def hits(self) -> int:
+        """
+
+        :return: the number of lookups of rooms whose members were cached.
+        """
+        return self._rooms.hits
+
+    @property
+    def misses(self) -> int:
+        """
+
+        :return: the number of lookups of rooms whose members had to be loaded.
+        """
+        return self._rooms.misses
+
+    async def is_member(self, room_id: str, user_id: int) -> bool:
+        """
+
+        :param room_id: the id of the room.
+        :param user_id: the id of the user.
+        :return: True if the user is a member of the room, False otherwise.
+        """
+        return user_id in await self._get_members(room_id)
+
+    async def is_owner(self, room_id: str, user_id: int) -> bool:
+        """
+
+        :param room_id: the id of the room.
+        :param user_id: the id of the user.
+        :return: True if the user is an owner of the room, False otherwise.
+        """
+        return (await self._get_members(room_id)).get(user_id, False)
+
+    async def list_member_ids(self, room_id: str) -> List[int]:
+        """
+
+        :param room_id: the id of the room.
+        :return: the ids of the members of the room.
+        """
+        return list(await self._get_members(room_id))
+
+    def add_member(self, room_id: str, user_id: int, owner: bool = False):
+        """Records that a user has joined a room, if the members of the room are cached.
+
+        :param room_id: the id of the room.
+        :param user_id: the id of the user.
+        :param owner: whether the user is an owner of the room.
+        """
+        members = self._cached_members(room_id)
+        if members is not None:
+            members[user_id] = owner or members.get(user_id, False)
+
+    def remove_member(self, room_id: str, user_id: int):
+        """Records that a user has left a room, if the members of the room are cached.
+
+        :param room_id: the id of the room.
+        :param user_id: the id of the user.
+        """
+        members = self._cached_members(room_id)
+        if members is not None:
+            members.pop(user_id, None)
+
+    def set_owner(self, room_id: str, user_id: int, owner: bool):
+        """Records that a member of a room has been promoted to owner or demoted to participant, if the members of the
+        room are cached.
+
+        :param room_id: the id of the room.
+        :param user_id: the id of the user.
+        :param owner: whether the user is now an owner of the room.
+        """
+        members = self._cached_members(room_id)
+        if members is not None:
+            members[user_id] = owner
+
+    def invalidate(self, room_id: str):
+        """Removes the members of a room from the cache, so that they are reloaded when next needed.
+
+        :param room_id: the id of the room.
+        """
+        room_id = normalize_stream_id(room_id)
+        self._rooms.pop(room_id)
+        if room_id in self._loading_tasks:
+            self._changed_while_loading.add(room_id)
+
+    def clear(self):
+        """Removes the members of all the rooms from the cache.
+        """
+        self._rooms.clear()
+        self._changed_while_loading.update(self._loading_tasks)
+
+    def _cached_members(self, room_id: str):
+        room_id = normalize_stream_id(room_id)
+        if room_id in self._loading_tasks:
+            # the loaded members may not include this change
+            self._changed_while_loading.add(room_id)
+        return self._rooms.peek(room_id)
+
+    async def _get_members(self, room_id: str) -> Dict[int, bool]:
+        room_id = normalize_stream_id(room_id)
+        members = self._rooms.get(room_id)
+        if members is not None:
+            return members
+
+        task = self._loading_tasks.get(room_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_members(room_id))
+            self._loading_tasks[room_id] = task
+        return await asyncio.shield(task)
+
+    async def _load_members(self, room_id: str) -> Dict[int, bool]:
+        try:
+            membership_list = await self._list_room_members(room_id)
+            members = {member.id: bool(member.owner) for member in membership_list.value or []}
+            if room_id not in self._changed_while_loading:
+                self._rooms.put(room_id, members)
+            return members
+        finally:
+            del self._loading_tasks[room_id]
+            self._changed_while_loading.discard(room_id)
+
+
+class RoomMembershipListener(RealTimeEventListener):
+    """Listener keeping a :class:`RoomMembershipCache` up to date from the USERJOINEDROOM, USERLEFTROOM,
+    ROOMMEMBERPROMOTEDTOOWNER and ROOMMEMBERDEMOTEDFROMOWNER events.
+    """
+
+    def __init__(self, room_membership_cache: RoomMembershipCache):
+        """
+
+        :param room_membership_cache: the cache to keep up to date.
+        """
+        self._room_membership_cache = room_membership_cache
+
+    @staticmethod
+    async def is_accepting_event(event: V4Event, bot_info: UserV2) -> bool:
+        # the membership changes made by the bot itself must be recorded too
+        return True
+
+    async def on_user_joined_room(self, initiator: V4Initiator, event: V4UserJoinedRoom):
+        self._room_membership_cache.add_member(event.stream.stream_id, event.affected_user.user_id)
+
+    async def on_user_left_room(self, initiator: V4Initiator, event: V4UserLeftRoom):
+        self._room_membership_cache.remove_member(event.stream.stream_id, event.affected_user.user_id)
+
+    async def on_room_member_promoted_to_owner(self, initiator: V4Initiator, event: V4RoomMemberPromotedToOwner):
+        self._room_membership_cache.set_owner(event.stream.stream_id, event.affected_user.user_id, True)
+
+    async def on_room_demoted_from_owner(self, initiator: V4Initiator, event: V4RoomMemberDemotedFromOwner):
+        self._room_membership_cache.set_owner(event.stream.stream_id, event.affected_user.user_id, False)
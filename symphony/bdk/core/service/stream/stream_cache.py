@@ -0,0 +1,142 @@
+"""Module containing the cache of the streams information, invalidated from the datafeed events.
+"""
+from typing import Awaitable, Callable, Optional
+
+from symphony.bdk.core.cache import LruCache
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
+from symphony.bdk.core.service.stream.stream_util import normalize_stream_id
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
+from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
+from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
+from symphony.bdk.gen.agent_model.v4_room_updated import V4RoomUpdated
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+STREAM = "stream"
+ROOM = "room"
+IM = "im"
+
+
+class StreamCache:
+    """Bounded in-memory cache of the information about streams, rooms and IMs, whose entries expire after a time to
+    live. The entries of a stream are invalidated by the :class:`StreamCacheListener` and when the stream is updated
+    through the BDK.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+
+        :param max_size: the maximum number of entries kept in the cache.
+        :param ttl: the number of seconds after which an entry expires.
+        """
+        self._entries = LruCache(max_size, ttl)
+        self._loading = {}
+        self._invalidated_while_loading = set()
+
+    @property
+    def hits(self) -> int:
+        """
+
+        :return: the number of lookups which found the information in the cache.
+        """
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        """
+
+        :return: the number of lookups which did not find the information in the cache.
+        """
+        return self._entries.misses
+
+    def get(self, kind: str, stream_id: str) -> Optional[object]:
+        """
+
+        :param kind: the kind of information, ``stream``, ``room`` or ``im``.
+        :param stream_id: the id of the stream.
+        :return: the cached information about the stream, None otherwise.
+        """
+        return self._entries.get((kind, normalize_stream_id(stream_id)))
+
+    async def load(self, kind: str, stream_id: str, loader: Callable[[], Awaitable]):
+        """Returns the cached information about a stream, or loads and caches it if it is not cached. The loaded
+        information is not cached if the stream is invalidated while it is being loaded, as it may be outdated.
+
+        :param kind: the kind of information, ``stream``, ``room`` or ``im``.
+        :param stream_id: the id of the stream.
+        :param loader: the coroutine function retrieving the information about the stream.
+        :return: the information about the stream.
+        """
+        value = self.get(kind, stream_id)
+        if value is not None:
+            return value
+
+        stream_id = normalize_stream_id(stream_id)
+        self._loading[stream_id] = self._loading.get(stream_id, 0) + 1
+        try:
+            value = await loader()
+            if stream_id not in self._invalidated_while_loading:
+                self._entries.put((kind, stream_id), value)
+            return value
+        finally:
+            self._loading[stream_id] -= 1
+            if not self._loading[stream_id]:
+                del self._loading[stream_id]
+                self._invalidated_while_loading.discard(stream_id)
+
+    def put(self, kind: str, stream_id: str, value):
+        """
+
+        :param kind: the kind of information, ``stream``, ``room`` or ``im``.
+        :param stream_id: the id of the stream.
+        :param value: the information about the stream to store.
+        """
+        self._entries.put((kind, normalize_stream_id(stream_id)), value)
+
+    def invalidate(self, stream_id: str):
+        """Removes all the cached information about a stream.
+
+        :param stream_id: the id of the stream.
+        """
+        stream_id = normalize_stream_id(stream_id)
+        for kind in (STREAM, ROOM, IM):
+            self._entries.pop((kind, stream_id))
+        if stream_id in self._loading:
+            self._invalidated_while_loading.add(stream_id)
+
+    def clear(self):
+        """Removes all the cached information.
+        """
+        self._entries.clear()
+        self._invalidated_while_loading.update(self._loading)
+
+
+class StreamCacheListener(RealTimeEventListener):
+    """Listener invalidating the entries of a :class:`StreamCache` from the ROOMCREATED, ROOMUPDATED, ROOMDEACTIVATED
+    and ROOMREACTIVATED events.
+    """
+
+    def __init__(self, stream_cache: StreamCache):
+        """
+
+        :param stream_cache: the cache to invalidate.
+        """
+        self._stream_cache = stream_cache
+
+    @staticmethod
+    async def is_accepting_event(event: V4Event, bot_info: UserV2) -> bool:
+        # the rooms updated by the bot itself must be invalidated too
+        return True
+
+    async def on_room_created(self, initiator: V4Initiator, event: V4RoomCreated):
+        self._stream_cache.invalidate(event.stream.stream_id)
+
+    async def on_room_updated(self, initiator: V4Initiator, event: V4RoomUpdated):
+        self._stream_cache.invalidate(event.stream.stream_id)
+
+    async def on_room_deactivated(self, initiator: V4Initiator, event: V4RoomDeactivated):
+        self._stream_cache.invalidate(event.stream.stream_id)
+
+    async def on_room_reactivated(self, initiator: V4Initiator, event: V4RoomReactivated):
+        self._stream_cache.invalidate(event.stream.stream_id)
@@ -1,9 +1,12 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.retry import retry
 from symphony.bdk.core.service.pagination import offset_based_pagination
+from symphony.bdk.core.service.stream.room_membership_cache import RoomMembershipCache
+from symphony.bdk.core.service.stream.stream_cache import StreamCache, STREAM, ROOM, IM
 from symphony.bdk.gen.agent_api.share_api import ShareApi
 from symphony.bdk.gen.agent_model.share_content import ShareContent
 from symphony.bdk.gen.agent_model.v2_message import V2Message
@@ -48,6 +51,8 @@ class OboStreamService:
         self._share_api = share_api
         self._auth_session = auth_session
         self._retry_config = retry_config
+        self._room_membership_cache = None
+        self._stream_cache = None
 
     @retry
     async def create_im_or_mim(self, user_ids: [int]) -> Stream:
@@ -86,8 +91,11 @@ class OboStreamService:
         :param stream_id: the ID of the stream to be retrieved.
         :return: the information about the given stream.
         """
-        return await self._streams_api.v2_streams_sid_info_get(sid=stream_id,
-                                                               session_token=await self._auth_session.session_token)
+        async def load_stream():
+            return await self._streams_api.v2_streams_sid_info_get(
+                sid=stream_id, session_token=await self._auth_session.session_token)
+
+        return await self._load_cached(STREAM, stream_id, load_stream)
 
     @retry
     async def get_room_info(self, room_id: str) -> V3RoomDetail:
@@ -97,8 +105,11 @@ class OboStreamService:
         :param room_id: the id of the room.
         :return: the room details.
         """
-        return await self._streams_api.v3_room_id_info_get(id=room_id,
-                                                           session_token=await self._auth_session.session_token)
+        async def load_room_detail():
+            return await self._streams_api.v3_room_id_info_get(
+                id=room_id, session_token=await self._auth_session.session_token)
+
+        return await self._load_cached(ROOM, room_id, load_room_detail)
 
     @retry
     async def list_streams(self, stream_filter: StreamFilter, skip: int = 0,
@@ -116,8 +127,8 @@ class OboStreamService:
                                                             session_token=await self._auth_session.session_token)
 
     @retry
-    async def list_all_streams(self, stream_filter: StreamFilter, chunk_size: int = 50, max_number: int = None) \
-            -> AsyncGenerator[StreamAttributes, None]:
+    async def list_all_streams(self, stream_filter: StreamFilter, chunk_size: int = 50, max_number: int = None,
+                               concurrency: int = 1) -> AsyncGenerator[StreamAttributes, None]:
         """Returns an asynchronous of all the streams of which the requesting user is a member,
         sorted by creation date (ascending - oldest to newest).
         Wraps the `List User Streams <https://developers.symphony.com/restapi/reference/list-user-streams>`_ endpoint.
@@ -125,6 +136,7 @@ class OboStreamService:
         :param stream_filter:  the stream searching criteria.
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
         :param max_number: the total maximum number of elements to retrieve
+        :param concurrency: the maximum number of pages retrieved concurrently, in order.
         :return: an asynchronous generator of the streams matching the search filter.
         """
 
@@ -132,7 +144,7 @@ class OboStreamService:
             result = await self.list_streams(stream_filter, skip, limit)
             return result.value if result else None
 
-        return offset_based_pagination(list_streams_one_page, chunk_size, max_number)
+        return offset_based_pagination(list_streams_one_page, chunk_size, max_number, concurrency=concurrency)
 
     @retry
     async def search_rooms(self, query: V2RoomSearchCriteria, skip: int = 0,
@@ -174,8 +186,11 @@ class OboStreamService:
         :param room_attributes: the attributes of the room to be updated.
         :return: the details of the updated room.
         """
-        return await self._streams_api.v3_room_id_update_post(id=room_id, payload=room_attributes,
-                                                              session_token=await self._auth_session.session_token)
+        room_detail = await self._streams_api.v3_room_id_update_post(
+            id=room_id, payload=room_attributes, session_token=await self._auth_session.session_token)
+        self._invalidate_cached(room_id)
+        self._put_cached(ROOM, room_id, room_detail)
+        return room_detail
 
     @retry
     async def add_member_to_room(self, user_id: int, room_id: str):
@@ -189,6 +204,8 @@ class OboStreamService:
         await self._room_membership_api.v1_room_id_membership_add_post(
             payload=UserId(id=user_id), id=room_id,
             session_token=await self._auth_session.session_token)
+        if self._room_membership_cache is not None:
+            self._room_membership_cache.add_member(room_id, user_id)
 
     @retry
     async def remove_member_from_room(self, user_id: int, room_id: str):
@@ -202,6 +219,8 @@ class OboStreamService:
         await self._room_membership_api.v1_room_id_membership_remove_post(
             payload=UserId(id=user_id), id=room_id,
             session_token=await self._auth_session.session_token)
+        if self._room_membership_cache is not None:
+            self._room_membership_cache.remove_member(room_id, user_id)
 
     @retry
     async def share(self, stream_id: str, content: ShareContent) -> V2Message:
@@ -228,6 +247,8 @@ class OboStreamService:
         """
         await self._room_membership_api.v1_room_id_membership_promote_owner_post(
             id=room_id, payload=UserId(id=user_id), session_token=await self._auth_session.session_token)
+        if self._room_membership_cache is not None:
+            self._room_membership_cache.set_owner(room_id, user_id, True)
 
     @retry
     async def demote_owner_to_room_participant(self, user_id: int, room_id: str):
@@ -240,12 +261,64 @@ class OboStreamService:
         """
         await self._room_membership_api.v1_room_id_membership_demote_owner_post(
             id=room_id, payload=UserId(id=user_id), session_token=await self._auth_session.session_token)
+        if self._room_membership_cache is not None:
+            self._room_membership_cache.set_owner(room_id, user_id, False)
+
+    async def _load_cached(self, kind: str, stream_id: str, loader):
+        if self._stream_cache is None:
+            return await loader()
+        return await self._stream_cache.load(kind, stream_id, loader)
+
+    def _put_cached(self, kind: str, stream_id: str, value):
+        if self._stream_cache is not None:
+            self._stream_cache.put(kind, stream_id, value)
+
+    def _invalidate_cached(self, stream_id: str):
+        if self._stream_cache is not None:
+            self._stream_cache.invalidate(stream_id)
 
 
 class StreamService(OboStreamService):
     """Service class to manage streams.
     """
 
+    def __init__(self, streams_api: StreamsApi, room_membership_api: RoomMembershipApi, share_api: ShareApi,
+                 auth_session: AuthSession, retry_config: BdkRetryConfig,
+                 room_membership_cache_config: BdkCacheConfig = None, stream_cache_config: BdkCacheConfig = None):
+        """
+
+        :param streams_api: a generated StreamsApi instance.
+        :param room_membership_api: a generated RoomMembershipApi instance.
+        :param share_api: a generated ShareApi instance.
+        :param auth_session: the bot session.
+        :param room_membership_cache_config: the configuration of the cache of the room members, if any.
+        :param stream_cache_config: the configuration of the cache of the streams information, if any.
+        """
+        super().__init__(streams_api, room_membership_api, share_api, auth_session, retry_config)
+        if room_membership_cache_config is not None and room_membership_cache_config.enabled:
+            self._room_membership_cache = RoomMembershipCache(self.list_room_members,
+                                                              room_membership_cache_config.max_size,
+                                                              room_membership_cache_config.ttl)
+        if stream_cache_config is not None and stream_cache_config.enabled:
+            self._stream_cache = StreamCache(stream_cache_config.max_size, stream_cache_config.ttl)
+
+    def room_membership_cache(self) -> Optional[RoomMembershipCache]:
+        """Returns the cache of the room members, to check whether a user is a member or an owner of a room without
+        calling :py:meth:`list_room_members`. It is kept up to date from the datafeed events.
+
+        :return: the room membership cache, None if the cache is disabled in the configuration.
+        """
+        return self._room_membership_cache
+
+    def stream_cache(self) -> Optional[StreamCache]:
+        """Returns the cache of the information returned by :py:meth:`get_stream`, :py:meth:`get_room_info` and
+        :py:meth:`get_im_info`. It is invalidated from the datafeed events and when the streams are updated through
+        this service.
+
+        :return: the stream cache, None if the cache is disabled in the configuration.
+        """
+        return self._stream_cache
+
     @retry
     async def get_im_info(self, im_id: str) -> V1IMDetail:
         """Get information about a particular IM.
@@ -254,8 +327,11 @@ class StreamService(OboStreamService):
         :param im_id: the id of the IM.
         :return: the im details.
         """
-        return await self._streams_api.v1_im_id_info_get(id=im_id,
-                                                         session_token=await self._auth_session.session_token)
+        async def load_im_detail():
+            return await self._streams_api.v1_im_id_info_get(
+                id=im_id, session_token=await self._auth_session.session_token)
+
+        return await self._load_cached(IM, im_id, load_im_detail)
 
     @retry
     async def set_room_active(self, room_id: str, active: bool) -> RoomDetail:
@@ -267,8 +343,10 @@ class StreamService(OboStreamService):
         :param active: the new active status (True to reactivate, false to deactivate).
         :return: the details of the updated room.
         """
-        return await self._streams_api.v1_room_id_set_active_post(id=room_id, active=active,
-                                                                  session_token=await self._auth_session.session_token)
+        room_detail = await self._streams_api.v1_room_id_set_active_post(
+            id=room_id, active=active, session_token=await self._auth_session.session_token)
+        self._invalidate_cached(room_id)
+        return room_detail
 
     @retry
     async def update_im(self, im_id: str, im_attributes: V1IMAttributes) -> V1IMDetail:
@@ -279,8 +357,11 @@ class StreamService(OboStreamService):
         :param im_attributes: the attributes of the im to be updated.
         :return: the details of the updated im.
         """
-        return await self._streams_api.v1_im_id_update_post(id=im_id, payload=im_attributes,
-                                                            session_token=await self._auth_session.session_token)
+        im_detail = await self._streams_api.v1_im_id_update_post(
+            id=im_id, payload=im_attributes, session_token=await self._auth_session.session_token)
+        self._invalidate_cached(im_id)
+        self._put_cached(IM, im_id, im_detail)
+        return im_detail
 
     @retry
     async def create_im_admin(self, user_ids: [int]) -> Stream:
@@ -309,9 +390,11 @@ class StreamService(OboStreamService):
         :param active: the new active status (True to reactivate, false to deactivate).
         :return: the details of the updated room.
         """
-        return await self._streams_api.v1_admin_room_id_set_active_post(
+        room_detail = await self._streams_api.v1_admin_room_id_set_active_post(
             id=room_id, active=active,
             session_token=await self._auth_session.session_token)
+        self._invalidate_cached(room_id)
+        return room_detail
 
     @retry
     async def list_streams_admin(self, stream_filter: V2AdminStreamFilter, skip: int = 0,
@@ -328,8 +411,8 @@ class StreamService(OboStreamService):
         return await self._streams_api.v2_admin_streams_list_post(filter=stream_filter, skip=skip, limit=limit,
                                                                   session_token=await self._auth_session.session_token)
 
-    async def list_all_streams_admin(self, stream_filter: V2AdminStreamFilter, chunk_size=50, max_number=None) \
-            -> AsyncGenerator[V2AdminStreamInfo, None]:
+    async def list_all_streams_admin(self, stream_filter: V2AdminStreamFilter, chunk_size=50, max_number=None,
+                                     prefetch: int = 0) -> AsyncGenerator[V2AdminStreamInfo, None]:
         """Retrieves all the streams across the enterprise.
         Wraps the `List Streams for Enterprise V2
         <https://developers.symphony.com/restapi/reference/list-streams-for-enterprise-v2>`_ endpoint.
@@ -337,6 +420,7 @@ class StreamService(OboStreamService):
         :param stream_filter: the stream searching filter.
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call.
         :param max_number: the total maximum number of elements to retrieve.
+        :param prefetch: the number of pages to retrieve in the background ahead of the one being consumed.
         :return: an asynchronous generator of streams matching the search criteria.
         """
 
@@ -344,7 +428,7 @@ class StreamService(OboStreamService):
             result = await self.list_streams_admin(stream_filter, skip, limit)
             return result.streams.value if result.streams else None
 
-        return offset_based_pagination(list_streams_admin_one_page, chunk_size, max_number)
+        return offset_based_pagination(list_streams_admin_one_page, chunk_size, max_number, prefetch)
 
     @retry
     async def list_stream_members(self, stream_id: str, skip: int = 0, limit: int = 100) -> V2MembershipList:
@@ -360,14 +444,15 @@ class StreamService(OboStreamService):
             id=stream_id, skip=skip, limit=limit,
             session_token=await self._auth_session.session_token)
 
-    async def list_all_stream_members(self, stream_id: str, chunk_size: int = 50, max_number=None) \
-            -> AsyncGenerator[V2MemberInfo, None]:
+    async def list_all_stream_members(self, stream_id: str, chunk_size: int = 50, max_number=None,
+                                      concurrency: int = 1) -> AsyncGenerator[V2MemberInfo, None]:
         """List the current members of an existing stream. The stream can be of type IM, MIM, or ROOM.
         Wraps the `Stream Members <https://developers.symphony.com/restapi/reference#stream-members>`_ endpoint.
 
         :param stream_id: the ID of the stream.
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call.
         :param max_number: the total maximum number of elements to retrieve.
+        :param concurrency: the maximum number of pages retrieved concurrently, in order.
         :return: an asynchronous generator of the stream members.
         """
 
@@ -375,7 +460,7 @@ class StreamService(OboStreamService):
             members = await self.list_stream_members(stream_id, skip, limit)
             return members.members.value if members.members else None
 
-        return offset_based_pagination(list_stream_members_one_page, chunk_size, max_number)
+        return offset_based_pagination(list_stream_members_one_page, chunk_size, max_number, concurrency=concurrency)
 
     @retry
     async def list_room_members(self, room_id: str) -> MembershipList:
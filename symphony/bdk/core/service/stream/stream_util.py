@@ -24,3 +24,15 @@ def from_url_safe_stream_id(stream_id: str) -> str:
     decoded_url_bytes = base64.urlsafe_b64decode(stream_id + "==")
     encoded_str = base64.b64encode(decoded_url_bytes)
     return str(encoded_str, "utf-8")
+
+
+def normalize_stream_id(stream_id: str) -> str:
+    """Convert the stream id to the corresponding URLSafe encoded stream id if it is not already URLSafe encoded,
+    so that the ids of the same stream received from the datafeed or from the REST API can be compared.
+
+    :param stream_id: stream id in any of the two forms
+    :return: the URLSafe encoded stream id
+    """
+    if any(character in stream_id for character in "+/="):
+        return to_url_safe_stream_id(stream_id)
+    return stream_id
@@ -0,0 +1,155 @@
+"""Module containing the cache of the users retrieved by the
+:class:`symphony.bdk.core.service.user.user_service.UserService`.
+"""
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from symphony.bdk.core.cache import LruCache
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
+
+ID = "id"
+EMAIL = "email"
+USERNAME = "username"
+
+
+class UserCache:
+    """Bounded in-memory cache of the users looked up by id, email or username and of the user details, whose entries
+    expire after a time to live.
+    The entries of a user are invalidated when it is updated through the BDK.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+
+        :param max_size: the maximum number of users and of user details kept in the cache.
+        :param ttl: the number of seconds after which an entry expires.
+        """
+        self._max_size = max_size
+        # users stored under their id and whether they have been looked up in the local pod only
+        self._users = LruCache(max_size, ttl)
+        # ids of the users by email and username, including the ones of users evicted or invalidated since
+        self._user_ids: Dict[Hashable, int] = {}
+        self._user_hits = 0
+        self._user_misses = 0
+        self._user_details = LruCache(max_size, ttl)
+
+    @property
+    def hits(self) -> int:
+        """
+
+        :return: the number of users and user details found in the cache.
+        """
+        return self._user_hits + self._user_details.hits
+
+    @property
+    def misses(self) -> int:
+        """
+
+        :return: the number of users and user details not found in the cache.
+        """
+        return self._user_misses + self._user_details.misses
+
+    def get_users(self, kind: str, values: list, local: bool) -> Tuple[List[UserV2], list]:
+        """Looks users up by id, email or username.
+
+        :param kind: the kind of the looked up values, ``id``, ``email`` or ``username``.
+        :param values: the looked up values.
+        :param local: whether the users are looked up in the local pod only.
+        :return: the cached users and the values not found in the cache.
+        """
+        users, missing = [], []
+        for value in values:
+            user = self._get_user(kind, value, local)
+            if user is None:
+                self._user_misses += 1
+                missing.append(value)
+            else:
+                self._user_hits += 1
+                users.append(user)
+        return users, missing
+
+    def put_users(self, users: List[UserV2], local: bool):
+        """Stores users, to be looked up by id, email and username.
+
+        :param users: the users to store.
+        :param local: whether the users have been looked up in the local pod only.
+        """
+        for user in users:
+            self._users.put((user.id, local), user)
+            for kind in (EMAIL, USERNAME):
+                key = _key_of(kind, user, local)
+                if key is not None:
+                    self._user_ids[key] = user.id
+        if len(self._user_ids) > 4 * self._max_size:
+            # drops the ids of the users no longer cached
+            self._user_ids = {key: user_id for (user_id, local), user in self._users.items()
+                              for key in (_key_of(EMAIL, user, local), _key_of(USERNAME, user, local))
+                              if key is not None}
+
+    def _get_user(self, kind: str, value, local: bool) -> Optional[UserV2]:
+        if kind == ID:
+            return self._users.get((value, local))
+        key = _user_key(kind, value, local)
+        user_id = self._user_ids.get(key)
+        user = self._users.get((user_id, local)) if user_id is not None else None
+        # the email or username of the user may have changed since it was indexed
+        return user if user is not None and _key_of(kind, user, local) == key else None
+
+    def get_user_detail(self, user_id: int) -> Optional[V2UserDetail]:
+        """
+
+        :param user_id: the user id.
+        :return: the cached details of the user, None otherwise.
+        """
+        return self._user_details.get(user_id)
+
+    def put_user_detail(self, user_id: int, user_detail: V2UserDetail):
+        """
+
+        :param user_id: the user id.
+        :param user_detail: the details of the user to store.
+        """
+        self._user_details.put(user_id, user_detail)
+
+    def invalidate(self, user_id: int):
+        """Removes the cached user and user details of a user.
+
+        :param user_id: the id of the user whose entries are removed.
+        """
+        self._user_details.pop(user_id)
+        for local in (False, True):
+            self._users.pop((user_id, local))
+
+    def clear(self):
+        """Removes all the cached users and user details.
+        """
+        self._users.clear()
+        self._user_ids.clear()
+        self._user_details.clear()
+
+
+def order_users(kind: str, values: list, users: List[UserV2]) -> List[UserV2]:
+    """Sorts users in the order of the values they have been looked up with.
+
+    :param kind: the kind of the looked up values, ``id``, ``email`` or ``username``.
+    :param values: the looked up values.
+    :param users: the users found.
+    :return: the users found in the order of the looked up values, followed by the ones not matching any value.
+    """
+    users_by_key = {_key_of(kind, user, False): user for user in users}
+    ordered = [users_by_key.pop(_user_key(kind, value, False)) for value in values
+               if _user_key(kind, value, False) in users_by_key]
+    ordered_ids = {id(user) for user in ordered}
+    return ordered + [user for user in users if id(user) not in ordered_ids]
+
+
+def _key_of(kind: str, user: UserV2, local: bool) -> Optional[Hashable]:
+    value = {ID: user.id, EMAIL: user.email_address, USERNAME: user.username}[kind]
+    return _user_key(kind, value, local) if value is not None else None
+
+
+def _user_key(kind: str, value, local: bool) -> Hashable:
+    # emails are case-insensitive
+    if kind == EMAIL:
+        value = value.lower()
+    return kind, value, local
@@ -0,0 +1,164 @@
+"""Module containing the loader batching the lookups of single users.
+
+Lookups made within a short window, e.g. by the listeners of a datafeed events batch, are merged into a single
+`Users Lookup v3 <https://developers.symphony.com/restapi/reference/users-lookup-v3>`_ call, each looked up value
+being requested once however many callers are waiting for it.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_list import V2UserList
+
+DEFAULT_BATCH_WINDOW_SECONDS = 0.01
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class _Batch:
+    """Values waiting to be looked up with the same function and parameters.
+    """
+
+    def __init__(self, lookup: Callable[[list], Awaitable[V2UserList]], key_of: Callable[[UserV2], Hashable]):
+        self.lookup = lookup
+        self.key_of = key_of
+        self.values = []
+        self.futures: Dict[Hashable, List[asyncio.Future]] = {}
+        self.timer = None
+
+
+class UserLoader:
+    """Batches the lookups of single users by id, email or username made through an
+    :class:`symphony.bdk.core.service.user.user_service.OboUserService`.
+    """
+
+    def __init__(self, user_service, batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        """
+
+        :param user_service: the :class:`symphony.bdk.core.service.user.user_service.OboUserService` to look up the
+          users with.
+        :param batch_window: the number of seconds lookups are collected for before being sent in one call.
+        :param max_batch_size: the maximum number of values looked up in one call. A call is sent as soon as this
+          number of values is reached.
+        """
+        self._user_service = user_service
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._batches: Dict[Tuple, _Batch] = {}
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    async def load_by_id(self, user_id: int, local: bool = False, active: bool = None) -> Optional[UserV2]:
+        """Looks up a user by id, along with the other lookups made within the batch window.
+
+        :param user_id: the user id.
+        :param local: If true then a local DB search will be performed, see
+          :py:meth:`~symphony.bdk.core.service.user.user_service.OboUserService.list_users_by_ids`.
+        :param active: If set, only active or inactive users are returned.
+        :return: the user found, None otherwise.
+        """
+        async def lookup(user_ids):
+            return await self._user_service.list_users_by_ids(user_ids, local=local, active=active)
+
+        return await self._load(("id", local, active), lookup, lambda user: user.id, user_id, user_id)
+
+    async def load_by_email(self, email: str, local: bool = False, active: bool = None) -> Optional[UserV2]:
+        """Looks up a user by email, along with the other lookups made within the batch window.
+
+        :param email: the email address, compared case-insensitively.
+        :param local: If true then a local DB search will be performed, see
+          :py:meth:`~symphony.bdk.core.service.user.user_service.OboUserService.list_users_by_emails`.
+        :param active: If set, only active or inactive users are returned.
+        :return: the user found, None otherwise.
+        """
+        async def lookup(emails):
+            return await self._user_service.list_users_by_emails(emails, local=local, active=active)
+
+        return await self._load(("email", local, active), lookup, lambda user: _lower(user.email_address), email,
+                                _lower(email))
+
+    async def load_by_username(self, username: str, active: bool = None) -> Optional[UserV2]:
+        """Looks up a user by username, along with the other lookups made within the batch window.
+
+        :param username: the username.
+        :param active: If set, only active or inactive users are returned.
+        :return: the user found, None otherwise.
+        """
+        async def lookup(usernames):
+            return await self._user_service.list_users_by_usernames(usernames, active=active)
+
+        return await self._load(("username", active), lookup, lambda user: user.username, username, username)
+
+    async def close(self):
+        """Cancels the lookups not completed yet, whose callers get a CancelledError. Called when the BDK or the OBO
+        services are closed, so that no lookup is sent with closed clients.
+        """
+        for batch in self._batches.values():
+            batch.timer.cancel()
+            for futures in batch.futures.values():
+                _cancel(futures)
+        self._batches.clear()
+
+        send_tasks = list(self._send_tasks)
+        for task in send_tasks:
+            task.cancel()
+        await asyncio.gather(*send_tasks, return_exceptions=True)
+
+    async def _load(self, batch_key: Tuple, lookup, key_of, value, key) -> Optional[UserV2]:
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = _Batch(lookup, key_of)
+            batch.timer = asyncio.get_running_loop().call_later(self._batch_window, self._flush, batch_key)
+            self._batches[batch_key] = batch
+
+        future = asyncio.get_running_loop().create_future()
+        if key not in batch.futures:
+            batch.futures[key] = []
+            batch.values.append(value)
+        batch.futures[key].append(future)
+
+        if len(batch.futures) >= self._max_batch_size:
+            batch.timer.cancel()
+            self._flush(batch_key)
+        return await future
+
+    def _flush(self, batch_key: Tuple):
+        batch = self._batches.pop(batch_key, None)
+        if batch is not None:
+            task = asyncio.ensure_future(self._send(batch))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, batch: _Batch):
+        try:
+            users = (await batch.lookup(batch.values)).users or []
+        except asyncio.CancelledError:
+            for futures in batch.futures.values():
+                _cancel(futures)
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            for futures in batch.futures.values():
+                _set(futures, exception=exc)
+            return
+
+        users_by_key = {batch.key_of(user): user for user in users}
+        for key, futures in batch.futures.items():
+            _set(futures, result=users_by_key.get(key))
+
+
+def _set(futures: List[asyncio.Future], result=None, exception: Exception = None):
+    for future in futures:
+        # the caller may have been cancelled in the meantime
+        if not future.done():
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+def _cancel(futures: List[asyncio.Future]):
+    for future in futures:
+        future.cancel()
+
+
+def _lower(value: Optional[str]) -> Optional[str]:
+    return value.lower() if value is not None else None
@@ -1,11 +1,13 @@
 import base64
-from typing import Union, AsyncGenerator
+from typing import Union, AsyncGenerator, Optional
 
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from symphony.bdk.core.service.pagination import offset_based_pagination, cursor_based_pagination
 from symphony.bdk.core.service.user.model.delegate_action_enum import DelegateActionEnum
 from symphony.bdk.core.service.user.model.role_id import RoleId
+from symphony.bdk.core.service.user.user_cache import UserCache, ID, EMAIL, USERNAME, order_users
+from symphony.bdk.core.service.user.user_loader import UserLoader
 from symphony.bdk.gen.agent_api.audit_trail_api import AuditTrailApi
 from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_list import V1AuditTrailInitiatorList
 from symphony.bdk.gen.pod_api.system_api import SystemApi
@@ -55,6 +57,17 @@ class OboUserService:
         self._users_api = users_api
         self._auth_session = auth_session
         self._retry_config = retry_config
+        self._loader = UserLoader(self)
+        self._user_cache = None
+
+    def loader(self) -> UserLoader:
+        """Returns the loader merging the lookups of single users made through this service within a short window
+        into batched calls to :py:meth:`list_users_by_ids`, :py:meth:`list_users_by_emails` and
+        :py:meth:`list_users_by_usernames`, e.g. ``await user_service.loader().load_by_id(user_id)``.
+
+        :return: the user loader of this service.
+        """
+        return self._loader
 
     @retry
     async def list_users_by_ids(
@@ -76,15 +89,7 @@ class OboUserService:
 
         :return: Users found by user ids.
         """
-        user_ids_str = ','.join(map(str, user_ids))
-        params = {
-            'uid': user_ids_str,
-            'local': local,
-            'session_token': await self._auth_session.session_token
-        }
-        if active is not None:
-            params['active'] = active
-        return await self._users_api.v3_users_get(**params)
+        return await self._lookup_users(ID, 'uid', user_ids, local, active)
 
     @retry
     async def list_users_by_emails(
@@ -106,15 +111,7 @@ class OboUserService:
 
         :return: Users found by emails.
         """
-        emails_str = ','.join(emails)
-        params = {
-            'email': emails_str,
-            'local': local,
-            'session_token': await self._auth_session.session_token
-        }
-        if active is not None:
-            params['active'] = active
-        return await self._users_api.v3_users_get(**params)
+        return await self._lookup_users(EMAIL, 'email', emails, local, active)
 
     @retry
     async def list_users_by_usernames(
@@ -132,15 +129,31 @@ class OboUserService:
 
         :return: Users found by usernames.
         """
-        usernames_str = ','.join(usernames)
+        return await self._lookup_users(USERNAME, 'username', usernames, True, active)
+
+    async def _lookup_users(self, kind: str, param: str, values: list, local: bool, active: bool) -> V2UserList:
+        # only the lookups not filtered on the user status are cached, the cached users not telling it
+        cached_users, missing_values = [], values
+        if self._user_cache is not None and active is None:
+            cached_users, missing_values = self._user_cache.get_users(kind, values, local)
+            if not missing_values:
+                return V2UserList(users=cached_users, errors=[])
+
         params = {
-            'username': usernames_str,
-            'local': True,
+            param: ','.join(map(str, missing_values)),
+            'local': local,
             'session_token': await self._auth_session.session_token
         }
         if active is not None:
             params['active'] = active
-        return await self._users_api.v3_users_get(**params)
+        user_list = await self._users_api.v3_users_get(**params)
+
+        if self._user_cache is not None and active is None:
+            self._user_cache.put_users(user_list.users or [], local)
+            if cached_users:
+                # in the order of the looked up values, as if none was cached
+                user_list.users = order_users(kind, values, cached_users + (user_list.users or []))
+        return user_list
 
     @retry
     async def search_users(
@@ -178,7 +191,8 @@ class OboUserService:
             query: UserSearchQuery,
             local: bool = False,
             chunk_size: int = 50,
-            max_number: int = None
+            max_number: int = None,
+            concurrency: int = 1
     ) -> AsyncGenerator[UserV2, None]:
         """Search for users by first name, last name, display name, and email; optionally, filter results by company,
         title, location, marketCoverage, responsibility, function, or instrument.
@@ -193,6 +207,7 @@ class OboUserService:
           to the calling user will also be returned.
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
         :param max_number: the total maximum number of elements to retrieve
+        :param concurrency: the maximum number of pages retrieved concurrently, in order.
         :return: an asynchronous generator of users
         """
 
@@ -200,7 +215,7 @@ class OboUserService:
             results = await self.search_users(query, local, skip, limit)
             return results.users if results else None
 
-        return offset_based_pagination(search_users_one_page, chunk_size, max_number)
+        return offset_based_pagination(search_users_one_page, chunk_size, max_number, concurrency=concurrency)
 
     @retry
     async def follow_user(
@@ -260,10 +275,21 @@ class UserService(OboUserService):
                  audit_trail_api: AuditTrailApi,
                  system_api: SystemApi,
                  auth_session: AuthSession,
-                 retry_config: BdkRetryConfig):
+                 retry_config: BdkRetryConfig,
+                 user_cache: UserCache = None):
         super().__init__(user_api, users_api, auth_session, retry_config)
         self._audit_trail_api = audit_trail_api
         self._system_api = system_api
+        self._user_cache = user_cache
+
+    def cache(self) -> Optional[UserCache]:
+        """Returns the cache of the users looked up by :py:meth:`list_users_by_ids`, :py:meth:`list_users_by_emails`
+        and :py:meth:`list_users_by_usernames` and of the user details retrieved by :py:meth:`get_user_detail`.
+        Its hits and misses counters can be used to size it.
+
+        :return: the user cache, None if the cache is disabled in the configuration.
+        """
+        return self._user_cache
 
     @retry
     async def get_user_detail(
@@ -276,11 +302,19 @@ class UserService(OboUserService):
         :param user_id: User Id
         :return: Details of the user.
         """
+        if self._user_cache is not None:
+            user_detail = self._user_cache.get_user_detail(user_id)
+            if user_detail is not None:
+                return user_detail
+
         params = {
             'uid': user_id,
             'session_token': await self._auth_session.session_token
         }
-        return await self._user_api.v2_admin_user_uid_get(**params)
+        user_detail = await self._user_api.v2_admin_user_uid_get(**params)
+        if self._user_cache is not None:
+            self._user_cache.put_user_detail(user_id, user_detail)
+        return user_detail
 
     @retry
     async def list_user_details(
@@ -306,7 +340,8 @@ class UserService(OboUserService):
     async def list_all_user_details(
             self,
             chunk_size: int = 50,
-            max_number: int = None
+            max_number: int = None,
+            prefetch: int = 0
     ) -> AsyncGenerator[V2UserDetail, None]:
         """Retrieve all users in the company (pod).
         Same as :func:`~list_user_details` but returns an asynchronous generator which performs the paginated calls with
@@ -316,9 +351,10 @@ class UserService(OboUserService):
         :param chunk_size: the maximum number of elements to retrieve in one underlying HTTP call
         :param max_number: the total maximum number of elements to retrieve. If set to None, we retrieve
                            all elements until the last page
+        :param prefetch: the number of pages to retrieve in the background ahead of the one being consumed.
         :return: an asynchronous generator of user details
         """
-        return offset_based_pagination(self.list_user_details, chunk_size, max_number)
+        return offset_based_pagination(self.list_user_details, chunk_size, max_number, prefetch)
 
     @retry
     async def list_user_details_by_filter(
@@ -385,6 +421,7 @@ class UserService(OboUserService):
             'session_token': await self._auth_session.session_token
         }
         await self._user_api.v1_admin_user_uid_roles_add_post(**params)
+        self._invalidate(user_id)
 
     @retry
     async def list_roles(self) -> [RoleDetail]:
@@ -417,6 +454,7 @@ class UserService(OboUserService):
             'session_token': await self._auth_session.session_token
         }
         await self._user_api.v1_admin_user_uid_roles_remove_post(**params)
+        self._invalidate(user_id)
 
     @retry
     async def get_avatar(
@@ -457,6 +495,7 @@ class UserService(OboUserService):
             'session_token': await self._auth_session.session_token
         }
         await self._user_api.v1_admin_user_uid_avatar_update_post(**params)
+        self._invalidate(user_id)
 
     @retry
     async def get_disclaimer(
@@ -621,6 +660,7 @@ class UserService(OboUserService):
             'session_token': await self._auth_session.session_token
         }
         await self._user_api.v1_admin_user_uid_status_update_post(**params)
+        self._invalidate(user_id)
 
     @retry
     async def list_user_followers(
@@ -757,7 +797,9 @@ class UserService(OboUserService):
             'payload': payload,
             'session_token': await self._auth_session.session_token
         }
-        return await self._user_api.v2_admin_user_uid_update_post(**params)
+        user_detail = await self._user_api.v2_admin_user_uid_update_post(**params)
+        self._invalidate(user_id)
+        return user_detail
 
     @retry
     async def list_audit_trail(
@@ -807,7 +849,8 @@ class UserService(OboUserService):
             initiator_id: int = None,
             role: RoleId = None,
             chunk_size: int = 100,
-            max_number: int = None
+            max_number: int = None,
+            prefetch: int = 0
     ) -> AsyncGenerator[V1AuditTrailInitiatorList, None]:
         """Returns an asynchronous generation of audit trail of actions performed by a privileged user in a given period
         of time.
@@ -820,6 +863,7 @@ class UserService(OboUserService):
         :param chunk_size:      This is the maximum number of audit trails to return in one HTTP call. Default: 100.
         :param max_number:      The total maximum number of audit trails to retrieve. If set to None, we retrieve
                                 all audit trails until the last page.
+        :param prefetch:        The number of pages to retrieve in the background ahead of the one being consumed.
         :return:                An async generator of audit trail.
         """
 
@@ -832,7 +876,7 @@ class UserService(OboUserService):
                                                  after=after)
             return result.items, getattr(result.pagination.cursors, 'after', None)
 
-        return cursor_based_pagination(audit_trail_one_page, chunk_size, max_number)
+        return cursor_based_pagination(audit_trail_one_page, chunk_size, max_number, prefetch)
 
     @retry
     async def suspend_user(
@@ -853,6 +897,7 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate(user_id)
 
     @retry
     async def suspend(
@@ -878,6 +923,7 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate(user_id)
 
     @retry
     async def unsuspend(
@@ -898,3 +944,8 @@ class UserService(OboUserService):
         }
 
         await self._user_api.v1_admin_user_user_id_suspension_update_put(**params)
+        self._invalidate(user_id)
+
+    def _invalidate(self, user_id: int):
+        if self._user_cache is not None:
+            self._user_cache.invalidate(user_id)
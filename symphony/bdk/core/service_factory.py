@@ -17,6 +17,7 @@ from symphony.bdk.core.service.presence.presence_service import PresenceService,
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import SignalService, OboSignalService
 from symphony.bdk.core.service.stream.stream_service import StreamService, OboStreamService
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.core.service.user.user_service import UserService, OboUserService
 from symphony.bdk.gen.agent_api.attachments_api import AttachmentsApi
 from symphony.bdk.gen.agent_api.audit_trail_api import AuditTrailApi
@@ -74,7 +75,9 @@ class ServiceFactory:
             AuditTrailApi(self._agent_client),
             PodSystemApi(self._pod_client),
             self._auth_session,
-            self._config.retry
+            self._config.retry,
+            UserCache(self._config.user_cache.max_size, self._config.user_cache.ttl)
+            if self._config.user_cache.enabled else None
         )
 
     def get_message_service(self) -> MessageService:
@@ -115,7 +118,9 @@ class ServiceFactory:
             RoomMembershipApi(self._pod_client),
             ShareApi(self._agent_client),
             self._auth_session,
-            self._config.retry)
+            self._config.retry,
+            self._config.room_membership_cache,
+            self._config.stream_cache)
 
     def get_application_service(self) -> ApplicationService:
         """Returns a fully initialized ApplicationService
@@ -8,6 +8,8 @@ from symphony.bdk.core.auth.auth_session import AuthSession, OboAuthSession
 from symphony.bdk.core.auth.authenticator_factory import AuthenticatorFactory
 from symphony.bdk.core.auth.exception import AuthInitializationError
 from symphony.bdk.core.auth.ext_app_authenticator import ExtensionAppAuthenticator
+from symphony.bdk.core.auth.obo_authenticator import OboAuthenticator
+from symphony.bdk.core.cache import LruCache
 from symphony.bdk.core.client.api_client_factory import ApiClientFactory
 from symphony.bdk.core.config.exception import BotNotConfiguredError, BdkConfigError
 from symphony.bdk.core.extension import ExtensionService
@@ -21,12 +23,16 @@ from symphony.bdk.core.service.obo_services import OboServices
 from symphony.bdk.core.service.presence.presence_service import PresenceService
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import SignalService
+from symphony.bdk.core.service.stream.room_membership_cache import RoomMembershipListener
+from symphony.bdk.core.service.stream.stream_cache import StreamCacheListener
 from symphony.bdk.core.service.stream.stream_service import StreamService
 from symphony.bdk.core.service.user.user_service import UserService
 from symphony.bdk.core.service_factory import ServiceFactory
 
 logger = logging.getLogger(__name__)
 
+OBO_SERVICES_CACHE_SIZE = 1000
+
 
 def bot_service(func):
     """Decorator to check if a bot service account is configured before making the actual function call.
@@ -84,6 +90,7 @@ class SymphonyBdk:
 
         self._bot_session = None
         self._ext_app_authenticator = None
+        self._obo_authenticator = None
         self._service_factory = None
         self._user_service = None
         self._message_service = None
@@ -97,6 +104,7 @@ class SymphonyBdk:
         self._health_service = None
         self._presence_service = None
         self._activity_registry = None
+        self._obo_services = LruCache(OBO_SERVICES_CACHE_SIZE)
 
         if self._config.bot.is_authentication_configured():
             self._initialize_bot_services()
@@ -105,7 +113,8 @@ class SymphonyBdk:
                          "You can however use services in OBO mode if app authentication is configured.")
 
     def _initialize_bot_services(self):
-        self._bot_session = AuthSession(self._authenticator_factory.get_bot_authenticator())
+        self._bot_session = AuthSession(self._authenticator_factory.get_bot_authenticator(),
+                                        self._config.bot.token_renewal)
         self._service_factory = ServiceFactory(self._api_client_factory, self._bot_session, self._config)
         self._user_service = self._service_factory.get_user_service()
         self._message_service = self._service_factory.get_message_service()
@@ -121,6 +130,10 @@ class SymphonyBdk:
         # creates ActivityRegistry that subscribes to DF Loop events
         self._activity_registry = ActivityRegistry(self._session_service)
         self._datafeed_loop.subscribe(self._activity_registry)
+        if self._stream_service.room_membership_cache() is not None:
+            self._datafeed_loop.subscribe(RoomMembershipListener(self._stream_service.room_membership_cache()))
+        if self._stream_service.stream_cache() is not None:
+            self._datafeed_loop.subscribe(StreamCacheListener(self._stream_service.stream_cache()))
         # initialises extension service and register decorated extensions
         self._extension_service = ExtensionService(self._api_client_factory, self._bot_session, self._config)
 
@@ -146,24 +159,38 @@ class SymphonyBdk:
     @app_service
     def obo(self, user_id: int = None, username: str = None) -> OboAuthSession:
         """Get the Obo authentication session.
+        The sessions are cached per user, so that the same session is returned for the same user as long as it is
+        cached, and its token is only retrieved once.
 
         :return: The obo authentication session
         """
         if user_id is not None:
-            return self._authenticator_factory.get_obo_authenticator().authenticate_by_user_id(user_id)
+            return self._get_obo_authenticator().authenticate_by_user_id(user_id)
         if username is not None:
-            return self._authenticator_factory.get_obo_authenticator().authenticate_by_username(username)
+            return self._get_obo_authenticator().authenticate_by_username(username)
         raise AuthInitializationError("At least user_id or username should be given to OBO authenticate the "
                                       "extension app")
 
+    def _get_obo_authenticator(self) -> OboAuthenticator:
+        if self._obo_authenticator is None:
+            self._obo_authenticator = self._authenticator_factory.get_obo_authenticator()
+        return self._obo_authenticator
+
     @app_service
     def obo_services(self, obo_session: OboAuthSession) -> OboServices:
         """Return the entry point of all OBO-enabled services and endpoints.
+        The returned services share the api clients of the BDK and are kept in a least recently used cache per user,
+        so that calling this method several times for the same user and OBO session returns the same instance.
 
         :param obo_session: the obo_session to use.
-        :return: a new OboServices instance.
+        :return: an OboServices instance.
         """
-        return OboServices(self._config, obo_session)
+        key = (obo_session.user_id, obo_session.username)
+        obo_services = self._obo_services.get(key)
+        if obo_services is None or obo_services.obo_session is not obo_session:
+            obo_services = OboServices(self._config, obo_session, self._api_client_factory)
+            self._obo_services.put(key, obo_services)
+        return obo_services
 
     @bot_service
     def messages(self) -> MessageService:
@@ -272,4 +299,11 @@ class SymphonyBdk:
     async def close_clients(self):
         """Close all the existing api clients created by the api client factory.
         """
+        for obo_services in self._obo_services.values():
+            await obo_services.users().loader().close()
+        self._obo_services.clear()
+        if self._user_service is not None:
+            await self._user_service.loader().close()
+        if self._bot_session is not None:
+            await self._bot_session.close()
         await self._api_client_factory.close_clients()
@@ -115,7 +115,8 @@ class SymphonyGroupService:
               self,
               status: Status = None,
               chunk_size: int = 100,
-              max_number: int = None
+              max_number: int = None,
+              prefetch: int = 0
     ) -> AsyncGenerator[ReadGroup, None]:
         """Returns an asynchronous generator of groups of type SDL
         See: `List all groups of specified type <https://developers.symphony.com/restapi/reference/listgroups>`_
@@ -124,6 +125,7 @@ class SymphonyGroupService:
         :param chunk_size:  the maximum number of groups to return in one HTTP call. Default: 100.
         :param max_number:  the total maximum number of groups to retrieve. If set to None, we retrieve
                             all groups until the last page.
+        :param prefetch:    the number of pages to retrieve in the background ahead of the one being consumed.
         :return:            an async generator of groups list.
         """
 
@@ -133,7 +135,7 @@ class SymphonyGroupService:
                                             after=after)
             return result.data, getattr(result.pagination.cursors, 'after', None)
 
-        return cursor_based_pagination(groups_one_page, chunk_size, max_number)
+        return cursor_based_pagination(groups_one_page, chunk_size, max_number, prefetch)
 
     @retry(retry=refresh_bearer_token_if_unauthorized)
     async def update_group(self, if_match: str, group_id: str, update_group: UpdateGroup) -> ReadGroup:
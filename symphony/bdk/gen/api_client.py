@@ -19,7 +19,7 @@ import typing
 from urllib.parse import quote
 from urllib3.fields import RequestField
 
-from symphony.bdk.gen import rest
+from symphony.bdk.gen import model_deserializer, rest
 from symphony.bdk.gen.configuration import Configuration
 from symphony.bdk.gen.exceptions import ApiTypeError, ApiValueError, ApiException
 from symphony.bdk.gen.model_utils import (
@@ -58,18 +58,20 @@ class ApiClient(object):
         to the API
     :param pool_threads: The number of threads to use for async requests
         to the API. More threads means more concurrent API requests.
+    :param connector_pool: optional pool of connectors shared between
+        several clients targeting the same host.
     """
 
     _pool = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
-                 cookie=None, pool_threads=1):
+                 cookie=None, pool_threads=1, connector_pool=None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = rest.RESTClientObject(configuration, connector_pool=connector_pool)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -166,12 +168,15 @@ class ApiClient(object):
                                                      collection_formats)
 
         # post parameters
+        upload_files = []
         if post_params or files:
             post_params = post_params if post_params else []
             post_params = self.sanitize_for_serialization(post_params)
             post_params = self.parameters_to_tuples(post_params,
                                                     collection_formats)
-            post_params.extend(self.files_parameters(files))
+            files_params = self.files_parameters(files)
+            upload_files.extend(v[1] for _, v in files_params if isinstance(v[1], io.IOBase))
+            post_params.extend(files_params)
             if header_params['Content-Type'].startswith("multipart"):
                 post_params = self.parameters_to_multipart(post_params,
                                                           (dict) )
@@ -201,6 +206,9 @@ class ApiClient(object):
         except ApiException as e:
             e.body = e.body.decode('utf-8')
             raise e
+        finally:
+            for upload_file in upload_files:
+                upload_file.close()
 
         self.last_response = response_data
 
@@ -214,7 +222,9 @@ class ApiClient(object):
             if _content_type is not None:
                 match = re.search(r"charset=([a-zA-Z\-\d]+)[\s\;]?", _content_type)
             encoding = match.group(1) if match else "utf-8"
-            response_data.data = response_data.data.decode(encoding)
+            if not (self.configuration.json_codec.decodes_bytes and encoding.lower().replace("-", "") == "utf8"):
+                # the stdlib codec is given a str, so that the response data keeps its type by default
+                response_data.data = response_data.data.decode(encoding)
 
         # deserialize response data
         if response_type and response_data.status != 204:
@@ -312,12 +322,16 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            received_data = json.loads(response.data)
+            received_data = self.configuration.json_codec.loads(response.data)
         except ValueError:
             received_data = response.data
+            if isinstance(received_data, bytes):
+                received_data = received_data.decode('utf-8')
 
         # store our data under the key of 'received_data' so users have some
         # context if they are deserializing a string and the data type is wrong
+        if _check_type and self.configuration.compiled_deserializers:
+            return model_deserializer.deserialize(received_data, response_type, ['received_data'], self.configuration)
         deserialized_data = validate_and_convert_types(
             received_data,
             response_type,
@@ -517,6 +531,12 @@ class ApiClient(object):
     def files_parameters(self, files: typing.Optional[typing.Dict[str, typing.List[io.IOBase]]] = None):
         """Builds form parameters.
 
+        Files stored on disk are not read in memory: a new read-only handle
+        on the same file is put in the form parameters so that its content
+        is streamed when sending the request. The passed file objects are
+        left open and untouched, so that they can be sent several times.
+        The other files are read, see :py:meth:`upload_file_data`.
+
         :param files: None or a dict with key=param_name and
             value is a list of open file objects
         :return: List of tuples of form parameters with file data
@@ -539,15 +559,44 @@ class ApiClient(object):
                         "for %s must be open." % param_name
                     )
                 filename = os.path.basename(file_instance.name)
-                filedata = file_instance.read()
+                filedata = self.upload_file_data(file_instance)
                 mimetype = (mimetypes.guess_type(filename)[0] or
                             'application/octet-stream')
                 params.append(
                     tuple([param_name, tuple([filename, filedata, mimetype])]))
-                file_instance.close()
 
         return params
 
+    @staticmethod
+    def upload_file_data(file_instance):
+        """Returns the data to upload for a file.
+
+        Files not stored on disk are read from their current position. If
+        they are seekable, they are then moved back to this position, so that
+        they can be sent again. Otherwise they are closed, as they cannot be
+        read again.
+
+        :param file_instance: an open file object.
+        :return: a new binary file object reading the same file from the
+            current position if the file is stored on disk, the file content
+            otherwise.
+        """
+        file_path = file_instance.name
+        if isinstance(file_path, (str, bytes, os.PathLike)) and os.path.isfile(file_path):
+            upload_file = open(file_path, 'rb')
+            if file_instance.seekable():
+                upload_file.seek(file_instance.tell())
+            return upload_file
+
+        if not file_instance.seekable():
+            file_data = file_instance.read()
+            file_instance.close()
+            return file_data
+        position = file_instance.tell()
+        file_data = file_instance.read()
+        file_instance.seek(position)
+        return file_data
+
     def select_header_accept(self, accepts):
         """Returns `Accept` based on an array of accepts provided.
 
@@ -16,6 +16,7 @@ import urllib3
 
 from http import client as http_client
 from symphony.bdk.gen.exceptions import ApiValueError
+from symphony.bdk.gen.json_codec import default_json_codec
 
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
@@ -197,13 +198,28 @@ class Configuration(object):
         # Options to pass down to the underlying urllib3 socket
         self.socket_options = None
 
+        self.json_codec = default_json_codec()
+        """JSON codec used to encode request bodies and decode response bodies,
+           see symphony.bdk.gen.json_codec
+        """
+        self.compiled_deserializers = True
+        """Whether responses are deserialized by the compiled per model deserializers,
+           see symphony.bdk.gen.model_deserializer
+        """
+        self.lazy_deserialization = False
+        """Whether the fields of the deserialized models are converted only when first read,
+           only used with compiled_deserializers, see symphony.bdk.gen.model_deserializer.LazyDataStore
+        """
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'json_codec'):
                 setattr(result, k, copy.deepcopy(v, memo))
+        # codecs are stateless, share them
+        result.json_codec = self.json_codec
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
         # use setters to configure loggers
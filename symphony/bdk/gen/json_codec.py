@@ -0,0 +1,133 @@
+"""JSON codecs used to encode request bodies and decode response bodies.
+
+The stdlib json codec is used by default. The orjson and msgspec codecs are faster but are only used when selected,
+see :func:`get_json_codec`, since they do not behave exactly as the stdlib:
+
+* orjson decodes the integers bigger than 64 bits as floats, losing their precision,
+* both encode NaN and Infinity as null.
+
+They are installed with the ``orjson`` and ``msgspec`` extras of the package.
+"""
+
+import json
+import typing
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JsonCodec(object):
+    """JSON codec based on the stdlib json module."""
+
+    name = 'json'
+    # the module the codec is based on, None if it is not installed
+    library = json
+    # whether the UTF-8 response bodies can be passed as bytes, without decoding them to a str first
+    decodes_bytes = False
+
+    def dumps(self, obj) -> typing.Union[str, bytes]:
+        """Encodes an object.
+
+        :param obj: the object to encode, made of JSON compatible types only.
+        :return: the JSON document.
+        """
+        return json.dumps(obj)
+
+    def loads(self, data: typing.Union[str, bytes]):
+        """Decodes a JSON document.
+
+        :param data: the JSON document, either as a str or as UTF-8 bytes.
+        :return: the decoded object.
+        :raise ValueError: if data is not a valid JSON document.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on orjson.
+    Integers bigger than 64 bits are decoded as floats, which never happens with Symphony ids.
+    """
+
+    name = 'orjson'
+    library = orjson
+    decodes_bytes = True
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers bigger than 64 bits
+            return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: typing.Union[str, bytes]):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib, e.g. it rejects NaN and Infinity
+            return json.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec based on msgspec."""
+
+    name = 'msgspec'
+    library = msgspec
+    decodes_bytes = True
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: typing.Union[str, bytes]):
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+
+# codec classes by name, the fastest first
+_JSON_CODEC_CLASSES = {codec_class.name: codec_class for codec_class in (OrjsonCodec, MsgspecCodec, JsonCodec)}
+
+
+def available_json_codecs() -> typing.List[JsonCodec]:
+    """Lists the codecs which can be used, the fastest first.
+
+    :return: the list of available codecs.
+    """
+    return [codec_class() for codec_class in _JSON_CODEC_CLASSES.values() if codec_class.library is not None]
+
+
+def default_json_codec() -> JsonCodec:
+    """Returns the codec used when none is selected, based on the stdlib json module.
+
+    :return: the codec to be used by default.
+    """
+    return JsonCodec()
+
+
+def get_json_codec(name: str) -> JsonCodec:
+    """Returns a codec from its name.
+
+    :param name: the name of the codec: 'json', 'orjson' or 'msgspec'.
+    :return: the codec.
+    :raise ValueError: if the codec is unknown or its library is not installed.
+    """
+    codec_class = _JSON_CODEC_CLASSES.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unknown JSON codec {name}")
+    if codec_class.library is None:
+        raise ValueError(f"JSON codec {name} requires the {name} library, install the {name} extra")
+    return codec_class()
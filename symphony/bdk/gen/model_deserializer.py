@@ -0,0 +1,399 @@
+"""Compiled deserializers turning decoded JSON responses into models.
+
+The generic :func:`symphony.bdk.gen.model_utils.validate_and_convert_types` re-derives, for every single value, the
+classes it may be converted to and the path of the value in the response. The deserializers of this module do this work
+once per model class and per value type, then cache it: converting a field only costs a dict lookup when its value
+already has the expected type.
+
+They build the exact same model instances as the generic path. Whatever they cannot build identically (composed models,
+discriminators, coercions between types, invalid payloads...) is delegated to the generic path, which also makes errors
+identical.
+
+When the ``lazy_deserialization`` field of the configuration is set, the model instances are built without converting
+their fields: nested models and lists are only converted, and checked, when they are first read. See
+:class:`LazyDataStore`.
+"""
+import inspect
+
+from symphony.bdk.gen.model_utils import (
+    ModelNormal,
+    OpenApiModel,
+    check_allowed_values,
+    check_validations,
+    get_required_type_classes,
+    get_simple_class,
+    is_valid_type,
+    order_response_types,
+    remove_uncoercible,
+    validate_and_convert_types,
+)
+
+# names used by the generated _from_openapi_data methods which only store the received properties,
+# those doing anything else (like setting default values) are left to the generic path
+GENERATED_FROM_OPENAPI_DATA_NAMES = frozenset((
+    'pop', 'super', 'OpenApiModel', '__new__', 'ApiTypeError', '__class__', '__name__', '_data_store', '_check_type',
+    '_spec_property_naming', '_path_to_item', '_configuration', '_visited_composed_classes', 'items', 'attribute_map',
+    'discard_unknown_keys', 'additional_properties_type', 'setattr',
+))
+
+_type_converters = {}
+_model_deserializers = {}
+
+
+def deserialize(received_data, response_type, path_to_item, configuration):
+    """Converts decoded JSON data to the response type, checking the types of the received values.
+    Equivalent to ``validate_and_convert_types(received_data, response_type, path_to_item, True, True, configuration)``.
+
+    :param received_data: the decoded JSON data.
+    :param response_type: the tuple of the valid classes, as passed to the generic path.
+    :param path_to_item: the path of the data, used in error messages.
+    :param configuration: the client configuration.
+    :return: the converted data.
+    """
+    return get_type_converter(response_type).convert(received_data, path_to_item[:-1], path_to_item[-1],
+                                                     configuration)
+
+
+def get_type_converter(required_types_mixed) -> 'TypeConverter':
+    """Gets the cached converter for a tuple of valid classes, creating it if needed.
+
+    :param required_types_mixed: the valid classes, like the values of the models' openapi_types.
+    :return: the converter.
+    """
+    key = _freeze(required_types_mixed)
+    converter = _type_converters.get(key)
+    if converter is None:
+        converter = _type_converters[key] = TypeConverter(required_types_mixed)
+    return converter
+
+
+def get_model_deserializer(model_class) -> 'ModelDeserializer':
+    """Gets the cached deserializer of a model class, creating it if needed.
+
+    :param model_class: the model class.
+    :return: the deserializer, None if the model cannot be deserialized by a compiled deserializer.
+    """
+    if model_class in _model_deserializers:
+        return _model_deserializers[model_class]
+    deserializer = ModelDeserializer(model_class) if ModelDeserializer.is_supported(model_class) else None
+    _model_deserializers[model_class] = deserializer
+    return deserializer
+
+
+def _freeze(required_types_mixed):
+    if isinstance(required_types_mixed, list):
+        return list, tuple(_freeze(t) for t in required_types_mixed)
+    if isinstance(required_types_mixed, dict):
+        return dict, tuple((k, _freeze(v)) for k, v in required_types_mixed.items())
+    if isinstance(required_types_mixed, tuple):
+        return tuple, tuple(_freeze(t) for t in required_types_mixed)
+    return required_types_mixed
+
+
+class TypeConverter:
+    """Converts values to one of the valid classes of a field or response.
+
+    The conversion depends only on the valid classes and on the type of the value, so it is resolved once per value
+    type, the first time a value of this type is converted.
+    """
+
+    def __init__(self, required_types_mixed):
+        self.required_types_mixed = required_types_mixed
+        self.valid_classes, self._child_types = get_required_type_classes(required_types_mixed, True)
+        self.identity_types = set()
+        """Types of the values returned as is"""
+        self._converters = {}
+
+    def convert(self, value, parent_path, key, configuration):
+        """Converts a value.
+
+        :param value: the value to convert.
+        :param parent_path: the path of the object holding the value.
+        :param key: the key or index of the value in its parent.
+        :param configuration: the client configuration.
+        :return: the converted value.
+        """
+        value_type = type(value)
+        if value_type in self.identity_types:
+            return value
+        converter = self._converters.get(value_type)
+        if converter is None:
+            converter = self._converters[value_type] = self._resolve(value)
+        return converter(value, parent_path, key, configuration)
+
+    def _resolve(self, value):
+        # follows the steps of validate_and_convert_types for a value of this type
+        value_class = get_simple_class(value)
+        if not is_valid_type(value_class, self.valid_classes):
+            coercible = remove_uncoercible(order_response_types(self.valid_classes), value, True)
+            if coercible and isinstance(value, dict) and inspect.isclass(coercible[0]) \
+                    and get_model_deserializer(coercible[0]) is not None:
+                return get_model_deserializer(coercible[0]).deserialize
+            return self._generic
+        if len(self.valid_classes) > 1 and remove_uncoercible(self.valid_classes, value, True, must_convert=False):
+            return self._generic
+
+        child_types = self._child_types.get(type(value))
+        if child_types is None:
+            self.identity_types.add(type(value))
+            return _identity
+        if isinstance(value, list):
+            return ListConverter(get_type_converter(child_types)).convert
+        if isinstance(value, dict):
+            return DictConverter(get_type_converter(child_types), self._generic).convert
+        return self._generic
+
+    def _generic(self, value, parent_path, key, configuration):
+        return validate_and_convert_types(value, self.required_types_mixed, parent_path + [key], True, True,
+                                          configuration=configuration)
+
+
+def _identity(value, parent_path, key, configuration):  # pylint: disable=unused-argument
+    return value
+
+
+class ListConverter:
+    """Converts the items of a list, in place like the generic path."""
+
+    def __init__(self, item_converter: TypeConverter):
+        self._item_converter = item_converter
+
+    def convert(self, value, parent_path, key, configuration):
+        item_converter = self._item_converter
+        identity_types = item_converter.identity_types
+        path = None
+        for index, item in enumerate(value):
+            if type(item) not in identity_types:
+                if path is None:
+                    path = parent_path + [key]
+                value[index] = item_converter.convert(item, path, index, configuration)
+        return value
+
+
+class DictConverter:
+    """Converts the values of a dict, in place like the generic path."""
+
+    def __init__(self, value_converter: TypeConverter, generic):
+        self._value_converter = value_converter
+        self._generic = generic
+
+    def convert(self, value, parent_path, key, configuration):
+        if any(type(k) is not str for k in value):
+            return self._generic(value, parent_path, key, configuration)
+        value_converter = self._value_converter
+        path = parent_path + [key]
+        for inner_key, inner_value in value.items():
+            value[inner_key] = value_converter.convert(inner_value, path, inner_key, configuration)
+        return value
+
+
+class ModelDeserializer:
+    """Builds instances of a model class from the dicts received from the server.
+
+    Does what ``model_class._new_from_openapi_data(_spec_property_naming=True, **data)`` does, looking the fields up
+    in tables computed once instead of setting them one by one with ``set_attribute``.
+    """
+
+    @staticmethod
+    def is_supported(model_class) -> bool:
+        """Checks whether a model class can be deserialized by a compiled deserializer: only the plain generated models
+        are, composed models and models with a discriminator are left to the generic path.
+
+        :param model_class: the model class.
+        :return: True if the model class is supported.
+        """
+        if not issubclass(model_class, ModelNormal) or model_class.discriminator is not None \
+                or model_class._composed_schemas or not hasattr(model_class, '_from_openapi_data'):
+            return False
+        from_openapi_data = inspect.unwrap(model_class._from_openapi_data)
+        required = ModelDeserializer._required_properties(model_class)
+        return set(from_openapi_data.__code__.co_names) <= GENERATED_FROM_OPENAPI_DATA_NAMES.union(required)
+
+    @staticmethod
+    def _required_properties(model_class):
+        parameters = inspect.signature(model_class._from_openapi_data).parameters.values()
+        return tuple(p.name for p in parameters if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+    def __init__(self, model_class):
+        self._model_class = model_class
+        self._required = self._required_properties(model_class)
+        self._python_names = {js_name: name for name, js_name in model_class.attribute_map.items()}
+        self._fields = {name: get_type_converter(types) for name, types in model_class.openapi_types.items()}
+        self._checked_fields = {name for name in self._fields
+                                if (name,) in model_class.allowed_values or (name,) in model_class.validations}
+        additional_properties_type = model_class.additional_properties_type
+        self._additional_properties = get_type_converter(additional_properties_type) \
+            if additional_properties_type is not None else None
+
+    def deserialize(self, data: dict, parent_path, key, configuration):
+        """Builds a model instance.
+
+        :param data: the received properties, keyed by their JSON names.
+        :param parent_path: the path of the object holding the data.
+        :param key: the key or index of the data in its parent.
+        :param configuration: the client configuration.
+        :return: the model instance.
+        """
+        model_class = self._model_class
+        path = parent_path + [key]
+        properties = {}
+        for js_name, value in data.items():
+            properties[self._python_names.get(js_name, js_name)] = value
+        if self._required and not all(name in properties for name in self._required):
+            return self._generic(data, path, configuration)
+
+        lazy = configuration.lazy_deserialization
+        pending = {}
+        data_store = {}
+        fields = self._fields
+        checked_fields = self._checked_fields
+        for name in self._required + tuple(properties):
+            if name in data_store:
+                continue
+            value = properties[name]
+            converter = fields.get(name)
+            if converter is None:
+                if self._additional_properties is None:
+                    if name not in model_class.attribute_map and configuration.discard_unknown_keys:
+                        continue
+                    return self._generic(data, path, configuration)
+                if name in model_class.required_properties:
+                    return self._generic(data, path, configuration)
+                converter = self._additional_properties
+            if type(value) not in converter.identity_types or name in checked_fields:
+                if lazy:
+                    pending[name] = converter
+                else:
+                    value = self.convert_field(name, value, converter, path, configuration)
+            data_store[name] = value
+        if pending:
+            data_store = LazyDataStore(data_store, pending, self, path, configuration)
+
+        instance = super(OpenApiModel, model_class).__new__(model_class)
+        instance.__dict__.update(
+            _data_store=data_store,
+            _check_type=True,
+            _spec_property_naming=True,
+            _path_to_item=path,
+            _configuration=configuration,
+            _visited_composed_classes=(model_class,),
+        )
+        return instance
+
+    def convert_field(self, name, value, converter: TypeConverter, path, configuration):
+        """Converts the value of a field and checks it against the allowed values and validations of the model.
+
+        :param name: the python name of the field.
+        :param value: the received value.
+        :param converter: the converter of the field.
+        :param path: the path of the model instance.
+        :param configuration: the client configuration.
+        :return: the converted value.
+        """
+        if type(value) not in converter.identity_types:
+            value = converter.convert(value, path, name, configuration)
+        if name in self._checked_fields:
+            self._check(name, value, configuration)
+        return value
+
+    def _check(self, name, value, configuration):
+        model_class = self._model_class
+        if (name,) in model_class.allowed_values and value is not None:
+            check_allowed_values(model_class.allowed_values, (name,), value)
+        if (name,) in model_class.validations:
+            check_validations(model_class.validations, (name,), value, configuration)
+
+    def _generic(self, data, path, configuration):
+        return self._model_class._new_from_openapi_data(_check_type=True, _path_to_item=path,
+                                                        _configuration=configuration, _spec_property_naming=True,
+                                                        **data)
+
+
+class LazyDataStore(dict):
+    """Data store of the model instances built in lazy mode: the received values are converted to models, and checked,
+    only when they are first read. Reading the values of the store, e.g. when comparing or serializing its model,
+    converts all of them.
+
+    Errors in received values which are never read are not raised.
+    """
+
+    def __init__(self, values: dict, pending: dict, deserializer: ModelDeserializer, path, configuration):
+        """
+
+        :param values: the values of the fields, the received ones for the fields not converted yet.
+        :param pending: the converters of the fields not converted yet, keyed by field name.
+        :param deserializer: the deserializer of the model.
+        :param path: the path of the model instance.
+        :param configuration: the client configuration.
+        """
+        super().__init__(values)
+        self._pending = pending
+        self._deserializer = deserializer
+        self._path = path
+        self._configuration = configuration
+
+    def _materialize(self, name):
+        value = self._deserializer.convert_field(name, dict.__getitem__(self, name), self._pending[name], self._path,
+                                                 self._configuration)
+        dict.__setitem__(self, name, value)
+        del self._pending[name]
+        return value
+
+    def materialize(self):
+        """Converts all the values not read yet."""
+        for name in list(self._pending):
+            self._materialize(name)
+
+    def __getitem__(self, name):
+        if name in self._pending:
+            return self._materialize(name)
+        return dict.__getitem__(self, name)
+
+    def get(self, name, default=None):
+        if name in self._pending:
+            return self._materialize(name)
+        return dict.get(self, name, default)
+
+    def __setitem__(self, name, value):
+        self._pending.pop(name, None)
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name):
+        self._pending.pop(name, None)
+        dict.__delitem__(self, name)
+
+    def pop(self, name, *default):
+        if name in self._pending:
+            self._materialize(name)
+        return dict.pop(self, name, *default)
+
+    def items(self):
+        self.materialize()
+        return dict.items(self)
+
+    def values(self):
+        self.materialize()
+        return dict.values(self)
+
+    def copy(self):
+        self.materialize()
+        return dict.copy(self)
+
+    def __eq__(self, other):
+        self.materialize()
+        if isinstance(other, LazyDataStore):
+            other.materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self.materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # copies and pickles are plain dicts
+        return dict, (self.copy(),)
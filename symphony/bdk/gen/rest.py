@@ -9,7 +9,6 @@
 
 
 import io
-import json
 import logging
 import re
 import ssl
@@ -39,31 +38,65 @@ class RESTResponse(io.IOBase):
         return self.aiohttp_response.headers.get(name, default)
 
 
-class RESTClientObject(object):
+def create_ssl_context(configuration):
+    """Builds the SSL context used to connect to the host of a given configuration.
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    :param configuration: the client configuration holding the trust store and client certificate.
+    :return: a new ssl.SSLContext instance.
+    """
+    ssl_context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH, cafile=configuration.ssl_ca_cert)
+    ssl_context.load_default_certs()
+    ssl_context.verify_mode = ssl.CERT_REQUIRED
 
-        # maxsize is number of requests to host that are allowed in parallel
-        if maxsize is None:
-            maxsize = configuration.connection_pool_maxsize
+    if configuration.cert_file:
+        ssl_context.load_cert_chain(
+            configuration.cert_file, keyfile=configuration.key_file
+        )
 
-        ssl_context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH, cafile=configuration.ssl_ca_cert)
-        ssl_context.load_default_certs()
-        ssl_context.verify_mode = ssl.CERT_REQUIRED
+    if not configuration.verify_ssl:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
 
-        if configuration.cert_file:
-            ssl_context.load_cert_chain(
-                configuration.cert_file, keyfile=configuration.key_file
-            )
+    return ssl_context
 
-        if not configuration.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
 
-        connector = aiohttp.TCPConnector(
-            limit=maxsize,
-            ssl=ssl_context
-        )
+def create_connector(configuration, maxsize=None):
+    """Builds the aiohttp connector holding the socket pool to the host of a given configuration.
+
+    :param configuration: the client configuration.
+    :param maxsize: number of requests to host that are allowed in parallel,
+                    defaults to configuration.connection_pool_maxsize.
+    :return: a new aiohttp.TCPConnector instance.
+    """
+    if maxsize is None:
+        maxsize = configuration.connection_pool_maxsize
+
+    return aiohttp.TCPConnector(
+        limit=maxsize,
+        ssl=create_ssl_context(configuration)
+    )
+
+
+class RESTClientObject(object):
+
+    def __init__(self, configuration, pools_size=4, maxsize=None, connector_pool=None):
+        """
+
+        :param configuration: the client configuration.
+        :param pools_size: non-applicable field for the AiohttpClient.
+        :param maxsize: number of requests to host that are allowed in parallel.
+        :param connector_pool: optional pool exposing `acquire(configuration)` and
+                               `release(configuration)` to share connectors between
+                               clients targeting the same host. If None, this client
+                               owns its own connector.
+        """
+        self._configuration = configuration
+        self._connector_pool = connector_pool
+
+        if connector_pool is None:
+            connector = create_connector(configuration, maxsize)
+        else:
+            connector = connector_pool.acquire(configuration)
 
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
@@ -71,11 +104,16 @@ class RESTClientObject(object):
         # https pool manager
         self.pool_manager = aiohttp.ClientSession(
             connector=connector,
+            connector_owner=connector_pool is None,
             trust_env=True
         )
 
     async def close(self):
+        if self.pool_manager.closed:
+            return
         await self.pool_manager.close()
+        if self._connector_pool is not None:
+            await self._connector_pool.release(self._configuration)
 
     async def request(self, method, url, query_params=None, headers=None,
                       body=None, post_params=None, _preload_content=True,
@@ -90,8 +128,10 @@ class RESTClientObject(object):
         :param post_params: request post parameters,
                             `application/x-www-form-urlencoded`
                             and `multipart/form-data`
-        :param _preload_content: this is a non-applicable field for
-                                 the AiohttpClient.
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 is returned without reading its body, so that
+                                 it can be streamed. The caller is responsible
+                                 for releasing it.
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -132,7 +172,7 @@ class RESTClientObject(object):
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = self._configuration.json_codec.dumps(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
                 args["data"] = aiohttp.FormData(post_params)
@@ -168,6 +208,12 @@ class RESTClientObject(object):
                 raise ApiException(status=0, reason=msg)
 
         r = await self.pool_manager.request(**args)
+        if not _preload_content and not 200 <= r.status <= 299:
+            # the body of an error response is small, read it so that the error is handled as usual
+            data = await r.read()
+            r.release()
+            raise ApiException(http_resp=RESTResponse(r, data))
+
         if _preload_content:
 
             data = await r.read()
@@ -0,0 +1,171 @@
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from symphony.bdk.gen import ApiClient, Configuration
+from symphony.bdk.gen.agent_model.room_tag import RoomTag
+from symphony.bdk.gen.exceptions import ApiValueError
+from symphony.bdk.gen.json_codec import JsonCodec, available_json_codecs
+
+
+@pytest.fixture(name="attachment_path")
+def fixture_attachment_path(tmp_path):
+    attachment_path = tmp_path / "attachment.txt"
+    attachment_path.write_bytes(b"attachment content")
+    return attachment_path
+
+
+@pytest.fixture(name="api_client")
+def fixture_api_client():
+    with patch("symphony.bdk.gen.rest.RESTClientObject"):
+        api_client = ApiClient(Configuration(host="https://acme.symphony.com/agent"))
+    api_client.rest_client.POST = AsyncMock(side_effect=lambda *args, **kwargs: MagicMock(status=204, data=b""))
+    return api_client
+
+
+def test_files_parameters_stream_file_from_disk(api_client, attachment_path):
+    with open(attachment_path, "rb") as attachment:
+        [(param_name, (filename, filedata, mimetype))] = api_client.files_parameters({"attachment": [attachment]})
+
+        assert (param_name, filename, mimetype) == ("attachment", "attachment.txt", "text/plain")
+        assert filedata is not attachment
+        assert attachment.tell() == 0
+        assert attachment.closed is False
+        assert filedata.read() == b"attachment content"
+        filedata.close()
+
+
+def test_files_parameters_stream_file_from_current_position(api_client, attachment_path):
+    with open(attachment_path, "rb") as attachment:
+        attachment.seek(11)
+        [(_, (_, filedata, _))] = api_client.files_parameters({"attachment": [attachment]})
+
+        assert filedata.read() == b"content"
+        filedata.close()
+
+
+def test_files_parameters_read_file_not_on_disk(api_client):
+    attachment = io.BytesIO(b"in memory content")
+    attachment.name = "attachment.bin"
+
+    [(_, (filename, filedata, mimetype))] = api_client.files_parameters({"attachment": [attachment]})
+
+    assert (filename, filedata, mimetype) == ("attachment.bin", b"in memory content", "application/octet-stream")
+
+
+def test_files_parameters_file_not_on_disk_rewound(api_client):
+    attachment = io.BytesIO(b"in memory content")
+    attachment.name = "attachment.bin"
+    attachment.seek(10)
+
+    for _ in range(2):
+        [(_, (_, filedata, _))] = api_client.files_parameters({"attachment": [attachment]})
+        assert filedata == b"content"
+
+    assert not attachment.closed
+    assert attachment.tell() == 10
+
+
+def test_files_parameters_not_seekable_file_not_on_disk_closed(api_client):
+    attachment = NotSeekableStream(b"streamed content")
+
+    [(_, (_, filedata, _))] = api_client.files_parameters({"attachment": [attachment]})
+
+    assert filedata == b"streamed content"
+    assert attachment.closed
+    with pytest.raises(ApiValueError):
+        api_client.files_parameters({"attachment": [attachment]})
+
+
+class NotSeekableStream(io.RawIOBase):
+    name = "attachment.bin"
+
+    def __init__(self, content):
+        super().__init__()
+        self._content = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._content.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def test_files_parameters_closed_file(api_client, attachment_path):
+    attachment = open(attachment_path, "rb")
+    attachment.close()
+
+    with pytest.raises(ApiValueError):
+        api_client.files_parameters({"attachment": [attachment]})
+
+
+def test_files_parameters_none(api_client):
+    assert api_client.files_parameters(None) == []
+    assert api_client.files_parameters({"attachment": None, "preview": [None]}) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_file_closed_after_request_and_can_be_sent_again(api_client, attachment_path):
+    with open(attachment_path, "rb") as attachment:
+        for _ in range(2):
+            await api_client.call_api("/v1/attachment", "POST", header_params={"Content-Type": "multipart/form-data"},
+                                      files={"attachment": [attachment]})
+
+            post_params = api_client.rest_client.POST.call_args.kwargs["post_params"]
+            [(_, (_, filedata, _))] = post_params
+            assert filedata.closed is True
+            assert attachment.closed is False
+
+
+def test_deserialize_with_stdlib_codec_by_default(api_client):
+    response = MagicMock(data='{"key": "value"}')
+
+    assert type(api_client.configuration.json_codec) is JsonCodec
+    assert api_client.deserialize(response, ({str: (str,)},), True) == {"key": "value"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", available_json_codecs(), ids=lambda codec: codec.name)
+@pytest.mark.parametrize("content_type", [None, "application/json; charset=UTF-8", "application/json; charset=latin-1"])
+async def test_call_api_decodes_utf8_bytes_with_codec(api_client, codec, content_type):
+    api_client.configuration.json_codec = codec
+    api_client.rest_client.POST = AsyncMock(return_value=MagicMock(status=200, data='{"key": "välue"}'.encode()))
+
+    # the content type is not forwarded by call_api
+    result = await api_client._ApiClient__call_api("/v1/tag", "POST", response_type=({str: (str,)},),
+                                                   _return_http_data_only=True, _content_type=content_type)
+
+    expects_bytes = codec.decodes_bytes and content_type != "application/json; charset=latin-1"
+    assert isinstance(api_client.last_response.data, bytes if expects_bytes else str)
+    if content_type != "application/json; charset=latin-1":
+        assert result == {"key": "välue"}
+
+
+def test_deserialize_non_json_bytes(api_client):
+    response = MagicMock(data=b"aGVsbG8gd29ybGQ=")
+
+    assert api_client.deserialize(response, (str,), True) == "aGVsbG8gd29ybGQ="
+
+
+def test_deserialize_model_with_compiled_deserializer(api_client):
+    response = MagicMock(data='{"key": "region", "value": "EMEA"}')
+
+    with patch("symphony.bdk.gen.api_client.validate_and_convert_types") as generic_deserialize:
+        room_tag = api_client.deserialize(response, (RoomTag,), True)
+
+    generic_deserialize.assert_not_called()
+    assert room_tag == RoomTag(key="region", value="EMEA")
+
+
+def test_deserialize_model_with_compiled_deserializers_disabled(api_client):
+    api_client.configuration.compiled_deserializers = False
+    response = MagicMock(data='{"key": "region", "value": "EMEA"}')
+
+    with patch("symphony.bdk.gen.api_client.model_deserializer") as model_deserializer:
+        room_tag = api_client.deserialize(response, (RoomTag,), True)
+
+    model_deserializer.deserialize.assert_not_called()
+    assert room_tag == RoomTag(key="region", value="EMEA")
@@ -0,0 +1,36 @@
+"""Benchmark of the JSON codecs on a recorded datafeed payload.
+
+Run it with: python -m tests.bdk.gen.json_codec_benchmark [number of events per batch]
+"""
+import json
+import sys
+import timeit
+
+from symphony.bdk.gen.json_codec import available_json_codecs
+from tests.utils.resource_utils import get_resource_content
+
+DEFAULT_BATCH_SIZE = 100
+REPEAT = 5
+
+
+def build_batch(batch_size):
+    recorded = json.loads(get_resource_content("datafeed/read_datafeed.json"))
+    events = recorded["events"]
+    recorded["events"] = [events[i % len(events)] for i in range(batch_size)]
+    return recorded
+
+
+def run(batch_size):
+    batch = build_batch(batch_size)
+    payload = json.dumps(batch).encode("utf-8")
+    print(f"Datafeed batch of {batch_size} events, {len(payload)} bytes")
+
+    for codec in available_json_codecs():
+        number = max(1, 10000 // batch_size)
+        loads = min(timeit.repeat(lambda: codec.loads(payload), number=number, repeat=REPEAT)) / number
+        dumps = min(timeit.repeat(lambda: codec.dumps(batch), number=number, repeat=REPEAT)) / number
+        print(f"{codec.name:>8}: loads {loads * 1e6:10.1f} us, dumps {dumps * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATCH_SIZE)
@@ -0,0 +1,80 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from symphony.bdk.gen import json_codec
+from symphony.bdk.gen.json_codec import JsonCodec, available_json_codecs, default_json_codec, get_json_codec
+from tests.utils.resource_utils import get_resource_content
+
+CODECS = available_json_codecs()
+
+
+@pytest.fixture(name="payload")
+def fixture_payload():
+    return get_resource_content("datafeed/read_datafeed.json")
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_loads_from_str_and_bytes(codec, payload):
+    expected = json.loads(payload)
+
+    assert codec.loads(payload) == expected
+    assert codec.loads(payload.encode("utf-8")) == expected
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_dumps(codec, payload):
+    decoded = json.loads(payload)
+
+    assert json.loads(codec.dumps(decoded)) == decoded
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_dumps_non_str_keys(codec):
+    assert json.loads(codec.dumps({1: "value"})) == {"1": "value"}
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_dumps_integer_bigger_than_64_bits(codec):
+    assert json.loads(codec.dumps({"id": 2 ** 70})) == {"id": 2 ** 70}
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_loads_invalid_json_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"aGVsbG8gd29ybGQ=")
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_loads_64_bits_integer(codec):
+    assert codec.loads(b'{"id": 9223372036854775807}') == {"id": 9223372036854775807}
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_loads_nan(codec):
+    assert codec.loads(b'{"value": NaN}')["value"] != 0
+
+
+def test_stdlib_codec_always_available():
+    assert isinstance(CODECS[-1], JsonCodec)
+    assert CODECS[-1].name == "json"
+
+
+def test_default_codec_is_stdlib():
+    assert default_json_codec().name == "json"
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+def test_get_json_codec(codec):
+    assert get_json_codec(codec.name).name == codec.name
+
+
+def test_get_json_codec_not_installed():
+    with patch.object(json_codec.OrjsonCodec, "library", None), pytest.raises(ValueError, match="orjson extra"):
+        get_json_codec("orjson")
+
+
+def test_get_json_codec_unknown():
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
@@ -0,0 +1,52 @@
+"""Benchmark of the compiled model deserializers, eager and lazy, against the generic path on a recorded datafeed
+payload.
+
+Run it with: python -m tests.bdk.gen.model_deserializer_benchmark [number of events per batch]
+"""
+import copy
+import sys
+import timeit
+
+from symphony.bdk.gen import Configuration
+from symphony.bdk.gen.agent_model.v5_event_list import V5EventList
+from symphony.bdk.gen.model_deserializer import deserialize
+from symphony.bdk.gen.model_utils import validate_and_convert_types
+from tests.bdk.gen.json_codec_benchmark import DEFAULT_BATCH_SIZE, REPEAT, build_batch
+
+
+def run(batch_size):
+    batch = build_batch(batch_size)
+    configuration = Configuration()
+    number = max(1, 1000 // batch_size)
+    print(f"Datafeed batch of {batch_size} events")
+
+    # conversions happen in place, each run gets its own copy of the batch
+    copy_time = min(timeit.repeat(lambda: copy.deepcopy(batch), number=number, repeat=REPEAT))
+    generic = min(timeit.repeat(
+        lambda: validate_and_convert_types(copy.deepcopy(batch), (V5EventList,), ["received_data"], True, True,
+                                           configuration=configuration),
+        number=number, repeat=REPEAT))
+    compiled = min(timeit.repeat(
+        lambda: deserialize(copy.deepcopy(batch), (V5EventList,), ["received_data"], configuration),
+        number=number, repeat=REPEAT))
+
+    lazy_configuration = Configuration()
+    lazy_configuration.lazy_deserialization = True
+    lazy = min(timeit.repeat(
+        lambda: read_message_ids(deserialize(copy.deepcopy(batch), (V5EventList,), ["received_data"],
+                                             lazy_configuration)),
+        number=number, repeat=REPEAT))
+
+    generic, compiled, lazy = [(t - copy_time) / number for t in (generic, compiled, lazy)]
+    print(f" generic: {generic * 1e3:8.2f} ms")
+    print(f"compiled: {compiled * 1e3:8.2f} ms ({generic / compiled:.1f} times faster)")
+    print(f"    lazy: {lazy * 1e3:8.2f} ms ({generic / lazy:.1f} times faster), reading the message ids only")
+
+
+def read_message_ids(event_list):
+    return [event.payload.message_sent.message.message_id for event in event_list.events
+            if event.type == "MESSAGESENT"]
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATCH_SIZE)
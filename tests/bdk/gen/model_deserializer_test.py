@@ -0,0 +1,188 @@
+import copy
+import json
+
+import pytest
+
+from symphony.bdk.gen import Configuration
+from symphony.bdk.gen.agent_model.room_tag import RoomTag
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_message_blast_response import V4MessageBlastResponse
+from symphony.bdk.gen.agent_model.v5_event_list import V5EventList
+from symphony.bdk.gen.exceptions import ApiTypeError, ApiValueError
+from symphony.bdk.gen.group_model.read_group import ReadGroup
+from symphony.bdk.gen.model_deserializer import LazyDataStore, ModelDeserializer, deserialize
+from symphony.bdk.gen.model_utils import validate_and_convert_types
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_list import V2UserList
+from tests.utils.resource_utils import get_resource_content
+
+
+@pytest.fixture(name="configuration")
+def fixture_configuration():
+    return Configuration()
+
+
+def generic_deserialize(data, response_type, configuration):
+    return validate_and_convert_types(data, response_type, ["received_data"], True, True, configuration=configuration)
+
+
+def assert_identical(compiled, generic):
+    assert type(compiled) is type(generic)
+    if hasattr(generic, "_data_store"):
+        assert compiled.__dict__.keys() == generic.__dict__.keys()
+        for name in generic.__dict__:
+            if name != "_data_store":
+                assert compiled.__dict__[name] == generic.__dict__[name]
+        assert compiled._data_store.keys() == generic._data_store.keys()
+        for name, value in generic._data_store.items():
+            assert_identical(compiled._data_store[name], value)
+    elif isinstance(generic, list):
+        assert len(compiled) == len(generic)
+        for compiled_item, generic_item in zip(compiled, generic):
+            assert_identical(compiled_item, generic_item)
+    else:
+        assert compiled == generic
+
+
+@pytest.mark.parametrize("response_type, resource", [
+    ((V5EventList,), "datafeed/read_datafeed.json"),
+    ((V2UserList,), "user/list_user.json"),
+])
+def test_deserialize_same_as_generic(configuration, response_type, resource):
+    data = json.loads(get_resource_content(resource))
+
+    compiled = deserialize(copy.deepcopy(data), response_type, ["received_data"], configuration)
+
+    assert_identical(compiled, generic_deserialize(data, response_type, configuration))
+
+
+def test_deserialize_nested_models(configuration):
+    events = deserialize(json.loads(get_resource_content("datafeed/read_datafeed.json")), (V5EventList,),
+                         ["received_data"], configuration)
+
+    message = events.events[2].payload.message_sent.message
+    assert message.stream.stream_id is not None
+    assert message.attachments[0]._path_to_item == ["received_data", "events", 2, "payload", "message_sent",
+                                                    "message", "attachments", 0]
+
+
+def test_deserialize_list_of_models(configuration):
+    data = [{"key": "region", "value": "EMEA"}, {"key": "desk", "value": "FX"}]
+
+    tags = deserialize(data, ([RoomTag],), ["received_data"], configuration)
+
+    assert tags == [RoomTag(key="region", value="EMEA"), RoomTag(key="desk", value="FX")]
+
+
+def test_deserialize_unknown_property(configuration):
+    data = {"key": "region", "value": "EMEA", "color": "blue", "weight": 3}
+
+    compiled = deserialize(copy.deepcopy(data), (RoomTag,), ["received_data"], configuration)
+
+    assert compiled.color == "blue"
+    assert compiled.weight == 3
+    assert_identical(compiled, generic_deserialize(data, (RoomTag,), configuration))
+
+
+def test_deserialize_converted_values(configuration):
+    # int to float and str to datetime conversions are left to the generic path
+    data = {"key": "region", "value": "EMEA", "price": 3, "created": "2021-06-01T12:30:00Z"}
+
+    compiled = deserialize(copy.deepcopy(data), (RoomTag,), ["received_data"], configuration)
+
+    assert_identical(compiled, generic_deserialize(data, (RoomTag,), configuration))
+
+
+def test_deserialize_missing_required_property(configuration):
+    with pytest.raises(TypeError):
+        deserialize({"key": "region"}, (RoomTag,), ["received_data"], configuration)
+
+
+def test_deserialize_wrong_type(configuration):
+    with pytest.raises(ApiTypeError):
+        deserialize({"key": "region", "value": 12}, (RoomTag,), ["received_data"], configuration)
+
+
+def test_deserialize_not_allowed_value(configuration):
+    with pytest.raises(ApiValueError):
+        deserialize({"id": 1234, "accountType": "ROBOT"}, (UserV2,), ["received_data"], configuration)
+
+
+def test_deserialize_allowed_value(configuration):
+    user = deserialize({"id": 1234, "accountType": "SYSTEM"}, (UserV2,), ["received_data"], configuration)
+
+    assert user.account_type == "SYSTEM"
+
+
+@pytest.mark.parametrize("model_class, supported", [
+    (RoomTag, True),
+    (UserV2, True),
+    (V4MessageBlastResponse, False),  # sets a default value in _from_openapi_data
+    (ReadGroup, False),  # composed schema
+])
+def test_is_supported(model_class, supported):
+    assert ModelDeserializer.is_supported(model_class) == supported
+
+
+@pytest.fixture(name="lazy_configuration")
+def fixture_lazy_configuration():
+    configuration = Configuration()
+    configuration.lazy_deserialization = True
+    return configuration
+
+
+def test_lazy_deserialize_converts_on_access(lazy_configuration):
+    events = deserialize(json.loads(get_resource_content("datafeed/read_datafeed.json")), (V5EventList,),
+                         ["received_data"], lazy_configuration)
+
+    assert isinstance(events._data_store, LazyDataStore)
+    assert isinstance(dict.__getitem__(events._data_store, "events")[0], dict)
+
+    message = events.events[2].payload.message_sent.message
+    assert isinstance(dict.__getitem__(events._data_store, "events")[0], V4Event)
+    assert message.message_id is not None
+    assert message.attachments[0]._path_to_item == ["received_data", "events", 2, "payload", "message_sent",
+                                                    "message", "attachments", 0]
+
+
+@pytest.mark.parametrize("response_type, resource", [
+    ((V5EventList,), "datafeed/read_datafeed.json"),
+    ((V2UserList,), "user/list_user.json"),
+])
+def test_lazy_deserialize_same_as_generic(configuration, lazy_configuration, response_type, resource):
+    data = json.loads(get_resource_content(resource))
+
+    lazy = deserialize(copy.deepcopy(data), response_type, ["received_data"], lazy_configuration)
+    generic = generic_deserialize(data, response_type, configuration)
+
+    assert lazy == generic
+    assert lazy.to_dict() == generic.to_dict()
+
+
+def test_lazy_deserialize_errors_raised_on_access(lazy_configuration):
+    user = deserialize({"id": 1234, "accountType": "ROBOT"}, (UserV2,), ["received_data"], lazy_configuration)
+
+    assert user.id == 1234
+    with pytest.raises(ApiValueError):
+        _ = user.account_type
+
+
+def test_lazy_deserialize_set_field(lazy_configuration):
+    tag = deserialize({"key": "region", "value": "EMEA", "tags": [1]}, (RoomTag,), ["received_data"],
+                      lazy_configuration)
+
+    tag.value = "APAC"
+
+    assert tag.value == "APAC"
+    assert tag == RoomTag(key="region", value="APAC", tags=[1])
+
+
+def test_lazy_deserialize_deepcopy(lazy_configuration):
+    user = deserialize({"id": 1234, "accountType": "NORMAL", "tags": ["a", "b"]}, (UserV2,), ["received_data"],
+                       lazy_configuration)
+
+    copied = copy.deepcopy(user)
+
+    assert type(copied._data_store) is dict
+    assert copied == user
+    assert copied.tags == ["a", "b"]
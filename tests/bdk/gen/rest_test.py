@@ -1,6 +1,9 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from symphony.bdk.gen import rest, Configuration
+from symphony.bdk.gen.exceptions import ApiException
 
 
 @pytest.mark.asyncio
@@ -11,3 +14,36 @@ async def test_system_certs_are_loaded():
     response = await rest_client.GET("https://google.fr")
 
     assert response.status == 200
+
+
+def mock_aiohttp_response(status, data=b""):
+    response = MagicMock()
+    response.status = status
+    response.read = AsyncMock(return_value=data)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_not_preloaded_response_returned_unread():
+    rest_client = rest.RESTClientObject(Configuration())
+    response = mock_aiohttp_response(200)
+    rest_client.pool_manager.request = AsyncMock(return_value=response)
+
+    assert await rest_client.GET("https://acme.symphony.com", _preload_content=False) is response
+    response.read.assert_not_called()
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_not_preloaded_error_response_raises():
+    rest_client = rest.RESTClientObject(Configuration())
+    response = mock_aiohttp_response(401, b"unauthorized")
+    rest_client.pool_manager.request = AsyncMock(return_value=response)
+
+    with pytest.raises(ApiException) as exception:
+        await rest_client.GET("https://acme.symphony.com", _preload_content=False)
+
+    assert exception.value.status == 401
+    assert exception.value.body == b"unauthorized"
+    response.release.assert_called_once()
+    await rest_client.close()
@@ -1,11 +1,13 @@
+import asyncio
 from datetime import datetime, timezone
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession, OboAuthSession, AppAuthSession
 from symphony.bdk.core.auth.exception import AuthInitializationError
+from symphony.bdk.core.config.model.bdk_token_renewal_config import BdkTokenRenewalConfig
 from symphony.bdk.gen.login_model.token import Token
 from symphony.bdk.gen.login_model.extension_app_tokens import ExtensionAppTokens
 
@@ -22,6 +24,215 @@ async def test_refresh():
     assert await auth_session.key_manager_token == "km_token"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_authenticate_once():
+    mock_bot_authenticator = AsyncMock()
+    mock_bot_authenticator.retrieve_session_token.side_effect = slow_return("session_token")
+    mock_bot_authenticator.retrieve_key_manager_token.return_value = "km_token"
+    auth_session = AuthSession(mock_bot_authenticator)
+
+    await asyncio.gather(*(auth_session.refresh() for _ in range(10)))
+
+    mock_bot_authenticator.retrieve_session_token.assert_called_once()
+    mock_bot_authenticator.retrieve_key_manager_token.assert_called_once()
+    assert auth_session.generation == 1
+    assert await auth_session.session_token == "session_token"
+
+
+@pytest.mark.asyncio
+async def test_refresh_of_stale_generation_skipped():
+    mock_bot_authenticator = AsyncMock()
+    auth_session = AuthSession(mock_bot_authenticator)
+    stale_generation = auth_session.generation
+
+    await auth_session.refresh(stale_generation)
+    await auth_session.refresh(stale_generation)
+
+    mock_bot_authenticator.retrieve_session_token.assert_called_once()
+    assert auth_session.generation == stale_generation + 1
+
+    await auth_session.refresh(auth_session.generation)
+
+    assert mock_bot_authenticator.retrieve_session_token.call_count == 2
+    assert auth_session.generation == stale_generation + 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_raised_to_all_callers_and_retried():
+    mock_bot_authenticator = AsyncMock()
+    mock_bot_authenticator.retrieve_session_token.side_effect = [ValueError("failure"), "session_token"]
+    auth_session = AuthSession(mock_bot_authenticator)
+
+    results = await asyncio.gather(auth_session.refresh(), auth_session.refresh(), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert auth_session.generation == 0
+
+    await auth_session.refresh(0)
+
+    assert auth_session.generation == 1
+    assert await auth_session.session_token == "session_token"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_refresh():
+    mock_bot_authenticator = AsyncMock()
+    mock_bot_authenticator.retrieve_session_token.side_effect = slow_return("session_token")
+    auth_session = AuthSession(mock_bot_authenticator)
+
+    cancelled = asyncio.ensure_future(auth_session.refresh())
+    other = asyncio.ensure_future(auth_session.refresh())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await other
+
+    mock_bot_authenticator.retrieve_session_token.assert_called_once()
+    assert auth_session.generation == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_retrieves_tokens_concurrently():
+    retrieving = set()
+    concurrent = []
+
+    def retrieve(token):
+        async def side_effect():
+            retrieving.add(token)
+            await asyncio.sleep(0.01)
+            concurrent.append(len(retrieving))
+            return token
+
+        return side_effect
+
+    mock_bot_authenticator = AsyncMock()
+    mock_bot_authenticator.retrieve_session_token.side_effect = retrieve("session_token")
+    mock_bot_authenticator.retrieve_key_manager_token.side_effect = retrieve("km_token")
+    auth_session = AuthSession(mock_bot_authenticator)
+
+    await auth_session.refresh()
+
+    assert concurrent == [2, 2]
+    assert await auth_session.session_token == "session_token"
+    assert await auth_session.key_manager_token == "km_token"
+
+
+@pytest.mark.asyncio
+async def test_tokens_renewed_before_configured_lifetime():
+    mock_bot_authenticator = AsyncMock()
+    renewal_config = BdkTokenRenewalConfig({"enabled": True, "tokenLifetimeSeconds": 0.1,
+                                            "renewalMarginSeconds": 0.02})
+    auth_session = AuthSession(mock_bot_authenticator, renewal_config)
+
+    await auth_session.refresh()
+    await asyncio.sleep(0.03)
+    assert auth_session.generation == 1
+
+    await asyncio.sleep(0.1)
+    assert auth_session.generation == 2
+
+    await auth_session.close()
+    await asyncio.sleep(0.1)
+    assert auth_session.generation == 2
+
+
+@pytest.mark.asyncio
+async def test_tokens_renewed_after_first_lazy_retrieval():
+    mock_bot_authenticator = AsyncMock()
+    renewal_config = BdkTokenRenewalConfig({"enabled": True, "tokenLifetimeSeconds": 0.02})
+    auth_session = AuthSession(mock_bot_authenticator, renewal_config)
+
+    await auth_session.session_token
+    await asyncio.sleep(0.05)
+
+    assert auth_session.generation >= 1
+    await auth_session.close()
+
+
+@pytest.mark.asyncio
+@patch("symphony.bdk.core.auth.auth_session.MIN_LEARNT_TOKEN_LIFETIME_SECONDS", 0.05)
+async def test_tokens_lifetime_learned_from_unauthorized_refresh():
+    mock_bot_authenticator = AsyncMock()
+    auth_session = AuthSession(mock_bot_authenticator, BdkTokenRenewalConfig({"enabled": True}))
+
+    await auth_session.refresh()
+    await asyncio.sleep(0.1)
+    assert auth_session.generation == 1
+
+    # the tokens have been rejected, their lifetime is about 0.1 second
+    await auth_session.refresh(auth_session.generation)
+    await asyncio.sleep(0.08)
+    assert auth_session.generation == 3
+
+    await auth_session.close()
+
+
+@pytest.mark.asyncio
+async def test_tokens_lifetime_not_learned_from_early_unauthorized_refresh():
+    mock_bot_authenticator = AsyncMock()
+    auth_session = AuthSession(mock_bot_authenticator, BdkTokenRenewalConfig({"enabled": True}))
+
+    await auth_session.refresh()
+    await auth_session.refresh(auth_session.generation)
+
+    assert auth_session._token_lifetime is None
+    assert auth_session._time_to_renewal() is None
+    await auth_session.close()
+
+
+@pytest.mark.asyncio
+@patch("symphony.bdk.core.auth.auth_session.MIN_LEARNT_TOKEN_LIFETIME_SECONDS", 0.01)
+async def test_tokens_lifetime_not_shortened_by_earlier_unauthorized_refresh():
+    mock_bot_authenticator = AsyncMock()
+    auth_session = AuthSession(mock_bot_authenticator, BdkTokenRenewalConfig({"enabled": True}))
+
+    await auth_session.refresh()
+    await asyncio.sleep(0.05)
+    await auth_session.refresh(auth_session.generation)
+    learnt_lifetime = auth_session._token_lifetime
+    await asyncio.sleep(0.02)
+    await auth_session.refresh(auth_session.generation)
+
+    assert learnt_lifetime.total_seconds() >= 0.05
+    assert auth_session._token_lifetime == learnt_lifetime
+    await auth_session.close()
+
+
+@pytest.mark.asyncio
+async def test_tokens_not_renewed_when_disabled():
+    mock_bot_authenticator = AsyncMock()
+    renewal_config = BdkTokenRenewalConfig({"tokenLifetimeSeconds": 0.01})
+    auth_session = AuthSession(mock_bot_authenticator, renewal_config)
+
+    await auth_session.refresh()
+    await asyncio.sleep(0.05)
+
+    assert auth_session.generation == 1
+    assert auth_session._renewal_task is None
+
+
+@pytest.mark.asyncio
+@patch("symphony.bdk.core.auth.auth_session.FAILED_RENEWAL_RETRY_SECONDS", 0.01)
+async def test_failed_renewal_retried():
+    mock_bot_authenticator = AsyncMock()
+    renewal_config = BdkTokenRenewalConfig({"enabled": True, "tokenLifetimeSeconds": 0.02})
+    auth_session = AuthSession(mock_bot_authenticator, renewal_config)
+    await auth_session.refresh()
+    mock_bot_authenticator.retrieve_session_token.side_effect = [ValueError("failure"), "session_token"]
+
+    await asyncio.sleep(0.05)
+
+    assert auth_session.generation == 2
+    await auth_session.close()
+
+
+def slow_return(value):
+    async def side_effect(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return value
+
+    return side_effect
+
+
 @pytest.mark.asyncio
 async def test_auth_token():
     mock_bot_authenticator = AsyncMock()
@@ -69,6 +280,8 @@ async def test_refresh_obo():
     assert await obo_session.session_token == "session_token2"
     assert await obo_session.key_manager_token == ""
 
+    assert obo_session.generation == 2
+
     obo_session = OboAuthSession(mock_obo_authenticator, username="username")
 
     assert await obo_session.session_token == "session_token3"
@@ -79,6 +292,18 @@ async def test_refresh_obo():
     assert await obo_session.key_manager_token == ""
 
 
+@pytest.mark.asyncio
+async def test_concurrent_obo_session_token_reads_authenticate_once():
+    mock_obo_authenticator = AsyncMock()
+    mock_obo_authenticator.retrieve_obo_session_token_by_user_id.side_effect = slow_return("session_token")
+    obo_session = OboAuthSession(mock_obo_authenticator, user_id=1234)
+
+    tokens = await asyncio.gather(*(obo_session.session_token for _ in range(5)))
+
+    assert tokens == ["session_token"] * 5
+    mock_obo_authenticator.retrieve_obo_session_token_by_user_id.assert_called_once_with(1234)
+
+
 def test_obo_init_failed():
     with pytest.raises(AuthInitializationError):
         OboAuthSession(None, user_id=1234, username="username")
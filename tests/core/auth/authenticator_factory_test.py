@@ -114,6 +114,15 @@ def test_get_ext_app_authenticator_rsa(config, api_client_factory):
 
     assert extension_app_authenticator is not None
     assert isinstance(extension_app_authenticator, ExtensionAppAuthenticatorRsa)
+    assert extension_app_authenticator._validated_jwts is None
+
+
+def test_get_ext_app_authenticator_with_validated_jwt_cache(config, api_client_factory):
+    config.app.validated_jwt_cache_size = 100
+    authenticator_factory = AuthenticatorFactory(config, api_client_factory)
+    extension_app_authenticator = authenticator_factory.get_extension_app_authenticator()
+
+    assert extension_app_authenticator._validated_jwts is not None
 
 
 def test_get_ext_app_authenticator_cert(app_cert_config, api_client_factory):
@@ -1,9 +1,13 @@
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from jwt import InvalidSignatureError
 
 from symphony.bdk.core.auth.auth_session import AppAuthSession
+from symphony.bdk.core.auth.exception import AuthInitializationError
 from symphony.bdk.core.auth.ext_app_authenticator import ExtensionAppAuthenticatorRsa, ExtensionAppAuthenticatorCert
+from symphony.bdk.core.auth.tokens_repository import InMemoryTokensRepository, TokensRepository
 from symphony.bdk.core.config.model.bdk_rsa_key_config import BdkRsaKeyConfig
 from symphony.bdk.gen import ApiException
 from symphony.bdk.gen.auth_model.extension_app_authenticate_request import ExtensionAppAuthenticateRequest
@@ -11,6 +15,8 @@ from symphony.bdk.gen.login_model.extension_app_tokens import ExtensionAppTokens
 from symphony.bdk.gen.pod_model.pod_certificate import PodCertificate
 from tests.core.config import minimal_retry_config
 
+TOKENS_EXPIRE_AT = 4102444800000  # 2100-01-01, in milliseconds
+
 
 @pytest.fixture(name="ext_app_authenticator")
 def fixture_ext_app_authenticator():
@@ -37,7 +43,7 @@ async def test_authenticate_extension_app(ext_app_authenticator):
     retrieved_app_token = "out_app_token"
     symphony_token = "sym_token"
     tokens = ExtensionAppTokens(app_id="app_id", app_token=retrieved_app_token, symphony_token=symphony_token,
-                                expire_at=12345)
+                                expire_at=TOKENS_EXPIRE_AT)
     ext_app_authenticator.authenticate_and_retrieve_tokens = AsyncMock(return_value=tokens)
 
     auth_session = await ext_app_authenticator.authenticate_extension_app(app_token)
@@ -60,7 +66,7 @@ async def test_authenticate_and_retrieve_tokens():
         mock_create_jwt.return_value = signed_jwt
         extension_app_tokens = ExtensionAppTokens(app_id="my_app_id", app_token=out_app_token,
                                                   symphony_token=symphony_token,
-                                                  expire_at=12345)
+                                                  expire_at=TOKENS_EXPIRE_AT)
         mock_authentication_api = AsyncMock()
         mock_authentication_api.v1_pubkey_app_authenticate_extension_app_post = AsyncMock(
             return_value=extension_app_tokens)
@@ -83,6 +89,61 @@ async def test_authenticate_and_retrieve_tokens():
         assert call_args.auth_token == signed_jwt
 
 
+@pytest.mark.asyncio
+async def test_authenticate_and_retrieve_tokens_with_repository_without_expiry():
+    class LegacyTokensRepository(TokensRepository):
+        def __init__(self):
+            self.tokens = {}
+
+        async def save(self, app_token, symphony_token):
+            self.tokens[app_token] = symphony_token
+
+        async def get(self, app_token):
+            return self.tokens.get(app_token)
+
+    extension_app_tokens = ExtensionAppTokens(app_id="my_app_id", app_token="out_app_token",
+                                              symphony_token="symphony_token", expire_at=TOKENS_EXPIRE_AT)
+    mock_authentication_api = AsyncMock()
+    mock_authentication_api.v1_authenticate_extension_app_post = AsyncMock(return_value=extension_app_tokens)
+    tokens_repository = LegacyTokensRepository()
+
+    extension_app_authenticator = ExtensionAppAuthenticatorCert(mock_authentication_api, None, "app_id",
+                                                                minimal_retry_config(), tokens_repository)
+    await extension_app_authenticator.authenticate_and_retrieve_tokens("app_token")
+    await extension_app_authenticator.authenticate_and_retrieve_tokens("app_token")
+
+    assert tokens_repository.tokens == {"out_app_token": "symphony_token"}
+    assert extension_app_authenticator._repository_supports_expiry is False
+
+
+@pytest.mark.asyncio
+async def test_authenticate_and_retrieve_tokens_with_wrapping_repository():
+    class WrappingTokensRepository(TokensRepository):
+        def __init__(self):
+            self.repository = InMemoryTokensRepository()
+            self.save_kwargs = []
+
+        async def save(self, *args, **kwargs):
+            self.save_kwargs.append(kwargs)
+            await self.repository.save(*args, **kwargs)
+
+        async def get(self, app_token):
+            return await self.repository.get(app_token)
+
+    extension_app_tokens = ExtensionAppTokens(app_id="my_app_id", app_token="out_app_token",
+                                              symphony_token="symphony_token", expire_at=TOKENS_EXPIRE_AT)
+    mock_authentication_api = AsyncMock()
+    mock_authentication_api.v1_authenticate_extension_app_post = AsyncMock(return_value=extension_app_tokens)
+    tokens_repository = WrappingTokensRepository()
+
+    extension_app_authenticator = ExtensionAppAuthenticatorCert(mock_authentication_api, None, "app_id",
+                                                                minimal_retry_config(), tokens_repository)
+    await extension_app_authenticator.authenticate_and_retrieve_tokens("app_token")
+
+    assert tokens_repository.save_kwargs == [{"expire_at": TOKENS_EXPIRE_AT}]
+    assert await tokens_repository.get("out_app_token") == "symphony_token"
+
+
 @pytest.mark.asyncio
 async def test_authenticate_and_retrieve_tokens_failure():
     with patch("symphony.bdk.core.auth.ext_app_authenticator.create_signed_jwt") as mock_create_jwt:
@@ -133,6 +194,82 @@ async def test_validate_jwt():
         mock_validate.assert_called_once_with(jwt, certificate_content, app_id)
 
 
+def invalid_signature_error():
+    try:
+        raise AuthInitializationError("Unable to validate the jwt") from InvalidSignatureError()
+    except AuthInitializationError as exc:
+        return exc
+
+
+@pytest.fixture(name="mock_pod_api")
+def fixture_mock_pod_api():
+    mock_pod_api = AsyncMock()
+    mock_pod_api.v1_podcert_get = AsyncMock(side_effect=[PodCertificate(certificate="certificate"),
+                                                         PodCertificate(certificate="new certificate")])
+    return mock_pod_api
+
+
+@pytest.mark.asyncio
+async def test_validate_jwt_pod_certificate_cached(mock_pod_api):
+    with patch("symphony.bdk.core.auth.ext_app_authenticator.validate_jwt") as mock_validate:
+        ext_app_authenticator = ExtensionAppAuthenticatorRsa(None, mock_pod_api, "app-id", None,
+                                                             minimal_retry_config())
+
+        await ext_app_authenticator.validate_jwt("my-jwt")
+        await ext_app_authenticator.validate_jwt("other-jwt")
+
+        mock_pod_api.v1_podcert_get.assert_called_once()
+        mock_validate.assert_called_with("other-jwt", "certificate", "app-id")
+
+        ext_app_authenticator._pod_certificate_loaded_at -= 3600
+        await ext_app_authenticator.validate_jwt("my-jwt")
+
+        assert mock_pod_api.v1_podcert_get.call_count == 2
+        mock_validate.assert_called_with("my-jwt", "new certificate", "app-id")
+
+
+@pytest.mark.asyncio
+async def test_validate_jwt_pod_certificate_reloaded_on_signature_mismatch(mock_pod_api):
+    with patch("symphony.bdk.core.auth.ext_app_authenticator.validate_jwt") as mock_validate:
+        mock_validate.side_effect = [invalid_signature_error(), {"sub": "user"}]
+        ext_app_authenticator = ExtensionAppAuthenticatorRsa(None, mock_pod_api, "app-id", None,
+                                                             minimal_retry_config())
+        await ext_app_authenticator._get_cached_pod_certificate()
+        ext_app_authenticator._pod_certificate_loaded_at -= 60
+
+        assert await ext_app_authenticator.validate_jwt("my-jwt") == {"sub": "user"}
+        assert mock_pod_api.v1_podcert_get.call_count == 2
+        mock_validate.assert_called_with("my-jwt", "new certificate", "app-id")
+
+
+@pytest.mark.asyncio
+async def test_validate_jwt_pod_certificate_just_loaded_not_reloaded(mock_pod_api):
+    with patch("symphony.bdk.core.auth.ext_app_authenticator.validate_jwt") as mock_validate:
+        mock_validate.side_effect = invalid_signature_error()
+        ext_app_authenticator = ExtensionAppAuthenticatorRsa(None, mock_pod_api, "app-id", None,
+                                                             minimal_retry_config())
+
+        with pytest.raises(AuthInitializationError):
+            await ext_app_authenticator.validate_jwt("my-jwt")
+        mock_pod_api.v1_podcert_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_validated_jwt_cached_until_expiry(mock_pod_api):
+    with patch("symphony.bdk.core.auth.ext_app_authenticator.validate_jwt") as mock_validate:
+        mock_validate.side_effect = lambda jwt, *args: {"sub": jwt, "exp": time.time() + (60 if jwt == "jwt" else -1)}
+        ext_app_authenticator = ExtensionAppAuthenticatorRsa(None, mock_pod_api, "app-id", None,
+                                                             minimal_retry_config(), validated_jwt_cache_size=10)
+
+        claims = await ext_app_authenticator.validate_jwt("jwt")
+        claims["sub"] = "modified"
+        await ext_app_authenticator.validate_jwt("expired-jwt")
+        await ext_app_authenticator.validate_jwt("expired-jwt")
+
+        assert (await ext_app_authenticator.validate_jwt("jwt"))["sub"] == "jwt"
+        assert mock_validate.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_cert_authenticate_and_retrieve_tokens():
     app_token = "app_token"
@@ -142,7 +279,7 @@ async def test_cert_authenticate_and_retrieve_tokens():
 
     extension_app_tokens = ExtensionAppTokens(app_id="my_app_id", app_token=out_app_token,
                                               symphony_token=symphony_token,
-                                              expire_at=12345)
+                                              expire_at=TOKENS_EXPIRE_AT)
     mock_authentication_api = AsyncMock()
     mock_authentication_api.v1_authenticate_extension_app_post = AsyncMock(return_value=extension_app_tokens)
 
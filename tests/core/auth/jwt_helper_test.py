@@ -42,6 +42,30 @@ def test_create_signed_jwt_from_content(key_config, rsa_key):
     assert create_signed_jwt(key_config, "test_bot") is not None
 
 
+def test_create_signed_jwt_loads_key_once(key_config, rsa_key, certificate):
+    key_config.path = "private_key_path/private_key.pem"
+    mock_open = mock.mock_open(read_data=rsa_key)
+
+    with mock.patch('builtins.open', mock_open):
+        first_jwt = create_signed_jwt(key_config, "test_bot")
+        second_jwt = create_signed_jwt(key_config, "other_bot")
+
+    mock_open.assert_called_once()
+    assert validate_jwt(first_jwt, certificate, None)["sub"] == "test_bot"
+    assert validate_jwt(second_jwt, certificate, None)["sub"] == "other_bot"
+
+
+def test_private_key_reloaded_when_config_changed(key_config, rsa_key):
+    key_config.content = rsa_key
+    private_key = key_config.get_private_key()
+
+    assert key_config.get_private_key() is private_key
+
+    key_config.content = rsa_key
+
+    assert key_config.get_private_key() is not private_key
+
+
 def test_validate_jwt(jwt_payload, certificate, rsa_key):
     signed_jwt = create_signed_jwt_with_claims(rsa_key, jwt_payload)
 
@@ -1,8 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from symphony.bdk.core.auth.exception import AuthUnauthorizedError
 from symphony.bdk.core.auth.obo_authenticator import OboAuthenticatorRsa, OboAuthenticatorCert
+from symphony.bdk.core.cache import LruCache
 from symphony.bdk.core.config.model.bdk_app_config import BdkAppConfig
 from symphony.bdk.gen.auth_model.obo_auth_response import OboAuthResponse
 from symphony.bdk.gen.exceptions import ApiException
@@ -264,3 +267,79 @@ async def test_authenticate_by_user_id_cert_authentication():
         assert await obo_session.session_token == session_token
         auth_api.v1_app_authenticate_post.assert_called_once()
         auth_api.v1_app_user_uid_authenticate_post.assert_called_once_with(session_token=app_token, uid=user_id)
+
+
+@pytest.mark.asyncio
+async def test_app_session_token_reused(config):
+    with patch("symphony.bdk.core.auth.obo_authenticator.create_signed_jwt", return_value="signed_jwt") as create_jwt, \
+            patch("symphony.bdk.core.auth.obo_authenticator.AuthenticationApi") as auth_api:
+        auth_api.pubkey_app_authenticate_post = AsyncMock(return_value=Token(token="app_token"))
+        auth_api.pubkey_app_user_user_id_authenticate_post = AsyncMock(return_value=Token(token="session_token"))
+
+        obo_authenticator = OboAuthenticatorRsa(config, auth_api, minimal_retry_config())
+        await asyncio.gather(*(obo_authenticator.retrieve_obo_session_token_by_user_id(user_id)
+                               for user_id in range(5)))
+
+        create_jwt.assert_called_once()
+        auth_api.pubkey_app_authenticate_post.assert_called_once()
+        assert auth_api.pubkey_app_user_user_id_authenticate_post.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_expired_app_session_token_renewed(config):
+    with patch("symphony.bdk.core.auth.obo_authenticator.create_signed_jwt", return_value="signed_jwt"), \
+            patch("symphony.bdk.core.auth.obo_authenticator.AuthenticationApi") as auth_api:
+        auth_api.pubkey_app_authenticate_post = AsyncMock(
+            side_effect=[Token(token="app_token"), Token(token="new_app_token")])
+        auth_api.pubkey_app_user_user_id_authenticate_post = AsyncMock(
+            side_effect=[Token(token="session_token"), ApiException(401), Token(token="other_session_token")])
+
+        obo_authenticator = OboAuthenticatorRsa(config, auth_api, minimal_retry_config())
+
+        assert await obo_authenticator.retrieve_obo_session_token_by_user_id(1234) == "session_token"
+        assert await obo_authenticator.retrieve_obo_session_token_by_user_id(5678) == "other_session_token"
+        auth_api.pubkey_app_user_user_id_authenticate_post.assert_called_with(session_token="new_app_token",
+                                                                              user_id=5678)
+
+
+@pytest.mark.asyncio
+async def test_new_app_session_token_not_renewed_on_unauthorized(config):
+    with patch("symphony.bdk.core.auth.obo_authenticator.create_signed_jwt", return_value="signed_jwt"), \
+            patch("symphony.bdk.core.auth.obo_authenticator.AuthenticationApi") as auth_api:
+        auth_api.pubkey_app_authenticate_post = AsyncMock(return_value=Token(token="app_token"))
+        auth_api.pubkey_app_user_user_id_authenticate_post = AsyncMock(side_effect=ApiException(401))
+
+        obo_authenticator = OboAuthenticatorRsa(config, auth_api, minimal_retry_config())
+
+        with pytest.raises(AuthUnauthorizedError):
+            await obo_authenticator.retrieve_obo_session_token_by_user_id(1234)
+        auth_api.pubkey_app_authenticate_post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_obo_sessions_cached_per_user(config):
+    with patch("symphony.bdk.core.auth.obo_authenticator.create_signed_jwt", return_value="signed_jwt"), \
+            patch("symphony.bdk.core.auth.obo_authenticator.AuthenticationApi") as auth_api:
+        auth_api.pubkey_app_authenticate_post = AsyncMock(return_value=Token(token="app_token"))
+        auth_api.pubkey_app_user_user_id_authenticate_post = AsyncMock(return_value=Token(token="session_token"))
+
+        obo_authenticator = OboAuthenticatorRsa(config, auth_api, minimal_retry_config())
+        obo_session = obo_authenticator.authenticate_by_user_id(1234)
+
+        assert obo_authenticator.authenticate_by_user_id(1234) is obo_session
+        assert obo_authenticator.authenticate_by_username("username") is not obo_session
+
+        tokens = await asyncio.gather(*(obo_authenticator.authenticate_by_user_id(1234).session_token
+                                        for _ in range(5)))
+
+        assert tokens == ["session_token"] * 5
+        auth_api.pubkey_app_user_user_id_authenticate_post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_expired_obo_session_not_reused():
+    with patch("symphony.bdk.core.auth.obo_authenticator.CertificateAuthenticationApi") as auth_api:
+        obo_authenticator = OboAuthenticatorCert(auth_api, minimal_retry_config())
+        obo_authenticator._obo_sessions = LruCache(10, ttl=0)
+
+        assert obo_authenticator.authenticate_by_user_id(1234) is not obo_authenticator.authenticate_by_user_id(1234)
@@ -0,0 +1,117 @@
+import time
+
+import pytest
+
+from symphony.bdk.core.auth.tokens_repository import InMemoryTokensRepository, SqliteTokensRepository
+
+
+def in_millis(seconds):
+    return int((time.time() + seconds) * 1000)
+
+
+@pytest.fixture(name="sqlite_repository")
+def fixture_sqlite_repository(tmp_path):
+    repository = SqliteTokensRepository(tmp_path / "tokens.db")
+    yield repository
+    repository.close()
+
+
+@pytest.fixture(name="repository", params=["in_memory", "sqlite"])
+def fixture_repository(request, tmp_path):
+    if request.param == "in_memory":
+        yield InMemoryTokensRepository()
+    else:
+        repository = SqliteTokensRepository(tmp_path / "tokens.db")
+        yield repository
+        repository.close()
+
+
+@pytest.mark.asyncio
+async def test_save_and_get(repository):
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(60))
+    await repository.save("other_app_token", "other_symphony_token")
+
+    assert await repository.get("app_token") == "symphony_token"
+    assert await repository.get("other_app_token") == "other_symphony_token"
+    assert await repository.get("unknown_app_token") is None
+
+
+@pytest.mark.asyncio
+async def test_save_overrides_tokens(repository):
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(60))
+    await repository.save("app_token", "new_symphony_token", expire_at=in_millis(60))
+
+    assert await repository.get("app_token") == "new_symphony_token"
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_not_returned(repository):
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(-1))
+
+    assert await repository.get("app_token") is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_expired_tokens_removed_on_save():
+    repository = InMemoryTokensRepository()
+    await repository.save("expired_app_token", "symphony_token", expire_at=in_millis(-1))
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(60))
+
+    assert repository._tokens == {"app_token": "symphony_token"}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_expired_tokens_removed_whatever_their_save_order():
+    repository = InMemoryTokensRepository()
+    await repository.save("app_token_without_expiry", "symphony_token")
+    await repository.save("long_lived_app_token", "symphony_token", expire_at=in_millis(60))
+    await repository.save("short_lived_app_token", "symphony_token", expire_at=in_millis(0.01))
+    time.sleep(0.02)
+
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(60))
+
+    assert list(repository._tokens) == ["app_token_without_expiry", "long_lived_app_token", "app_token"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_token_saved_again_not_removed_at_previous_expiry():
+    repository = InMemoryTokensRepository()
+    await repository.save("app_token", "symphony_token", expire_at=in_millis(0.01))
+    await repository.save("app_token", "new_symphony_token", expire_at=in_millis(60))
+    time.sleep(0.02)
+
+    await repository.save("other_app_token", "symphony_token", expire_at=in_millis(60))
+
+    assert await repository.get("app_token") == "new_symphony_token"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_outdated_expiries_dropped():
+    repository = InMemoryTokensRepository(max_tokens=2)
+    for i in range(10):
+        await repository.save("app_token", f"symphony_token_{i}", expire_at=in_millis(60 + i))
+
+    assert len(repository._expiries) <= 4
+    assert (repository._expire_at["app_token"], "app_token") in repository._expiries
+
+
+@pytest.mark.asyncio
+async def test_in_memory_oldest_tokens_evicted():
+    repository = InMemoryTokensRepository(max_tokens=2)
+    for i in range(3):
+        await repository.save(f"app_token_{i}", f"symphony_token_{i}", expire_at=in_millis(60))
+
+    assert await repository.get("app_token_0") is None
+    assert await repository.get("app_token_1") == "symphony_token_1"
+    assert await repository.get("app_token_2") == "symphony_token_2"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tokens_shared_between_repositories(sqlite_repository, tmp_path):
+    other_repository = SqliteTokensRepository(tmp_path / "tokens.db")
+    try:
+        await sqlite_repository.save("app_token", "symphony_token", expire_at=in_millis(60))
+
+        assert await other_repository.get("app_token") == "symphony_token"
+    finally:
+        other_repository.close()
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from symphony.bdk.core.cache import LruCache
+
+
+def test_get_missing_key():
+    cache = LruCache(2)
+
+    assert cache.get("key") is None
+    assert cache.get("key", "default") == "default"
+
+
+def test_put_and_get():
+    cache = LruCache(2)
+    cache.put("key", "value")
+
+    assert cache.get("key") == "value"
+    assert "key" in cache
+    assert len(cache) == 1
+
+
+def test_least_recently_used_evicted():
+    cache = LruCache(2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+    cache.get("first")
+    cache.put("third", 3)
+
+    assert "second" not in cache
+    assert cache.values() == [1, 3]
+
+
+def test_pop_and_clear():
+    cache = LruCache(2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+
+    assert cache.pop("first") == 1
+    assert cache.pop("first") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_expired_entry_removed():
+    cache = LruCache(2, ttl=10)
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=100):
+        cache.put("key", "value")
+
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=109):
+        assert cache.get("key") == "value"
+
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=110):
+        assert cache.get("key") is None
+        assert "key" not in cache
+        assert len(cache) == 0
+
+
+def test_entry_ttl_overrides_cache_ttl():
+    cache = LruCache(2, ttl=10)
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=100):
+        cache.put("short", 1, ttl=1)
+        cache.put("long", 2)
+
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=105):
+        assert cache.values() == [2]
+
+
+def test_hits_and_misses():
+    cache = LruCache(2)
+    cache.put("key", "value")
+
+    cache.get("key")
+    cache.get("key")
+    cache.get("missing")
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_remove_if():
+    cache = LruCache(3)
+    cache.put("first", 1)
+    cache.put("second", 2)
+    cache.put("third", 1)
+
+    assert cache.remove_if(lambda value: value == 1) == 2
+    assert cache.values() == [2]
+
+
+def test_peek():
+    cache = LruCache(2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+
+    assert cache.peek("first") == 1
+    assert cache.peek("missing", "default") == "default"
+    cache.put("third", 3)
+    assert "first" not in cache
+    assert cache.hits == 0
+    assert cache.misses == 0
@@ -5,6 +5,7 @@ import pytest
 
 from symphony.bdk.core.client.api_client_factory import ApiClientFactory, POD, LOGIN, AGENT, SESSION_AUTH, RELAY, \
     KEY_AUTH
+from symphony.bdk.core.config.exception import BdkConfigError
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.config.model.bdk_server_config import BdkProxyConfig
 from symphony.bdk.core.config.model.bdk_ssl_config import BdkSslConfig
@@ -335,6 +336,49 @@ def test_trust_store_configured(config):
         assert client_factory.get_pod_client().configuration.ssl_ca_cert == truststore_path
 
 
+def test_lazy_deserialization_disabled_by_default(config):
+    with patch("symphony.bdk.gen.rest.RESTClientObject"):
+        client_factory = ApiClientFactory(config)
+
+        assert client_factory.get_agent_client().configuration.lazy_deserialization is False
+
+
+def test_lazy_deserialization_configured(config):
+    with patch("symphony.bdk.gen.rest.RESTClientObject"):
+        config.lazy_deserialization = True
+
+        client_factory = ApiClientFactory(config)
+
+        assert client_factory.get_agent_client().configuration.lazy_deserialization is True
+        assert client_factory.get_pod_client().configuration.lazy_deserialization is True
+
+
+def test_stdlib_json_codec_by_default(config):
+    with patch("symphony.bdk.gen.rest.RESTClientObject"):
+        client_factory = ApiClientFactory(config)
+
+        assert client_factory.get_agent_client().configuration.json_codec.name == "json"
+
+
+def test_json_codec_configured(config):
+    with patch("symphony.bdk.gen.rest.RESTClientObject"), \
+            patch("symphony.bdk.core.client.api_client_factory.get_json_codec") as get_json_codec:
+        config.json_codec = "orjson"
+
+        client_factory = ApiClientFactory(config)
+
+        assert client_factory.get_pod_client().configuration.json_codec == get_json_codec.return_value
+        get_json_codec.assert_called_with("orjson")
+
+
+def test_json_codec_unknown(config):
+    with patch("symphony.bdk.gen.rest.RESTClientObject"):
+        config.json_codec = "simplejson"
+
+        with pytest.raises(BdkConfigError):
+            ApiClientFactory(config)
+
+
 def assert_host_configured_only(client, url_suffix):
     configuration = client.configuration
 
@@ -370,3 +414,47 @@ def assert_host_and_proxy_credentials_configured(client, url_suffix, proxy_host,
 
 def assert_default_user_agent_configured(user_agent):
     assert re.match(r"^Symphony-BDK-Python/\S+ Python/3\.\S+$", user_agent) is not None
+
+
+@pytest.mark.asyncio
+async def test_clients_targeting_same_origin_share_connector(config):
+    client_factory = ApiClientFactory(config)
+
+    pod_connector = client_factory.get_pod_client().rest_client.pool_manager.connector
+
+    assert client_factory.get_login_client().rest_client.pool_manager.connector is pod_connector
+    assert client_factory.get_relay_client().rest_client.pool_manager.connector is pod_connector
+    assert client_factory.get_agent_client().rest_client.pool_manager.connector is pod_connector
+    assert client_factory.get_client("/custom").rest_client.pool_manager.connector is pod_connector
+
+
+@pytest.mark.asyncio
+async def test_clients_targeting_different_origins_do_not_share_connector(config):
+    config.agent._host = "agent.symphony.com"
+    client_factory = ApiClientFactory(config)
+
+    assert client_factory.get_agent_client().rest_client.pool_manager.connector \
+           is not client_factory.get_pod_client().rest_client.pool_manager.connector
+
+
+@pytest.mark.asyncio
+async def test_clients_with_client_cert_do_not_share_connector(client_certificate_path, config):
+    config.bot.certificate.path = client_certificate_path
+    client_factory = ApiClientFactory(config)
+
+    session_auth_connector = client_factory.get_session_auth_client().rest_client.pool_manager.connector
+
+    assert session_auth_connector is client_factory.get_key_auth_client().rest_client.pool_manager.connector
+    assert session_auth_connector is not client_factory.get_pod_client().rest_client.pool_manager.connector
+    assert session_auth_connector is not client_factory.get_app_session_auth_client().rest_client.pool_manager.connector
+
+
+@pytest.mark.asyncio
+async def test_close_clients_closes_shared_connectors(config):
+    client_factory = ApiClientFactory(config)
+    connector = client_factory.get_pod_client().rest_client.pool_manager.connector
+
+    await client_factory.close_clients()
+
+    assert connector.closed is True
+    assert len(client_factory._connector_pool) == 0
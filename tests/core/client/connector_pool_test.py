@@ -0,0 +1,77 @@
+import pytest
+
+from symphony.bdk.core.client.connector_pool import ConnectorPool
+from symphony.bdk.gen import Configuration
+
+
+def configuration(host, cert_file=None):
+    config = Configuration(host=host)
+    config.cert_file = cert_file
+    return config
+
+
+def test_connector_key_default_port():
+    assert ConnectorPool.connector_key(configuration("https://acme.symphony.com/pod"))[:3] == \
+           ("https", "acme.symphony.com", 443)
+    assert ConnectorPool.connector_key(configuration("http://acme.symphony.com/pod"))[:3] == \
+           ("http", "acme.symphony.com", 80)
+
+
+def test_connector_key_ignores_context_path():
+    assert ConnectorPool.connector_key(configuration("https://acme.symphony.com:443/pod")) == \
+           ConnectorPool.connector_key(configuration("https://acme.symphony.com/login"))
+
+
+def test_connector_key_depends_on_client_certificate():
+    assert ConnectorPool.connector_key(configuration("https://acme.symphony.com/sessionauth", "bot.pem")) != \
+           ConnectorPool.connector_key(configuration("https://acme.symphony.com/sessionauth", "app.pem"))
+
+
+@pytest.mark.asyncio
+async def test_acquire_same_origin_returns_same_connector():
+    pool = ConnectorPool()
+
+    first = pool.acquire(configuration("https://acme.symphony.com/pod"))
+    second = pool.acquire(configuration("https://acme.symphony.com/login"))
+
+    assert first is second
+    assert len(pool) == 1
+    await pool.release(configuration("https://acme.symphony.com/pod"))
+    await pool.release(configuration("https://acme.symphony.com/login"))
+
+
+@pytest.mark.asyncio
+async def test_acquire_different_origins_returns_different_connectors():
+    pool = ConnectorPool()
+
+    first = pool.acquire(configuration("https://acme.symphony.com/pod"))
+    second = pool.acquire(configuration("https://agent.symphony.com/agent"))
+
+    assert first is not second
+    assert len(pool) == 2
+    await pool.release(configuration("https://acme.symphony.com/pod"))
+    await pool.release(configuration("https://agent.symphony.com/agent"))
+
+
+@pytest.mark.asyncio
+async def test_release_closes_connector_when_no_more_referenced():
+    pool = ConnectorPool()
+    connector = pool.acquire(configuration("https://acme.symphony.com/pod"))
+    pool.acquire(configuration("https://acme.symphony.com/login"))
+
+    await pool.release(configuration("https://acme.symphony.com/pod"))
+    assert connector.closed is False
+    assert len(pool) == 1
+
+    await pool.release(configuration("https://acme.symphony.com/login"))
+    assert connector.closed is True
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_release_unknown_connector():
+    pool = ConnectorPool()
+
+    await pool.release(configuration("https://acme.symphony.com/pod"))
+
+    assert len(pool) == 0
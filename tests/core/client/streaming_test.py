@@ -0,0 +1,88 @@
+import base64
+from unittest.mock import MagicMock
+
+import pytest
+
+from symphony.bdk.core.client.streaming import Base64StreamDecoder, decode_base64_chunks, iter_response_chunks, \
+    write_chunks
+
+CONTENT = b"attachment content spanning several base64 quanta"
+
+
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def mock_response(chunks):
+    response = MagicMock()
+    response.content.iter_chunked.return_value = async_iter(chunks)
+    return response
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 7, 100])
+def test_base64_decoder_chunked(chunk_size):
+    decoder = Base64StreamDecoder()
+
+    decoded = b"".join(decoder.decode(chunk) for chunk in split(base64.b64encode(CONTENT), chunk_size))
+
+    assert decoded + decoder.flush() == CONTENT
+
+
+def test_base64_decoder_ignores_quotes_and_new_lines():
+    encoded = base64.b64encode(CONTENT)
+    decoder = Base64StreamDecoder()
+
+    decoded = decoder.decode(b'"' + encoded[:10] + b"\r\n") + decoder.decode(encoded[10:] + b'"')
+
+    assert decoded + decoder.flush() == CONTENT
+
+
+def test_base64_decoder_flush_without_padding():
+    decoder = Base64StreamDecoder()
+
+    decoded = decoder.decode(base64.b64encode(b"ab").rstrip(b"="))
+
+    assert decoded + decoder.flush() == b"ab"
+
+
+@pytest.mark.asyncio
+async def test_iter_response_chunks_releases_response():
+    response = mock_response([b"first", b"second"])
+
+    assert await collect(iter_response_chunks(response, 10)) == [b"first", b"second"]
+    response.content.iter_chunked.assert_called_once_with(10)
+    response.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_iter_response_chunks_releases_response_when_stopped_early():
+    response = mock_response([b"first", b"second"])
+
+    chunks = iter_response_chunks(response)
+    assert await chunks.__anext__() == b"first"
+    await chunks.aclose()
+
+    response.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_decode_base64_chunks():
+    chunks = decode_base64_chunks(async_iter(split(base64.b64encode(CONTENT), 5)))
+
+    assert b"".join(await collect(chunks)) == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_write_chunks(tmp_path):
+    file_path = await write_chunks(async_iter([b"first", b"second"]), tmp_path / "file.bin")
+
+    assert file_path.read_bytes() == b"firstsecond"
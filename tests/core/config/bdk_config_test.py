@@ -1,9 +1,12 @@
 import sys
+from pathlib import Path
 from datetime import timedelta
 
 import pytest
 
+from symphony.bdk.core.config.exception import BdkConfigError
 from symphony.bdk.core.config.loader import BdkConfigLoader
+from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.config.model.bdk_retry_config import BdkRetryConfig
 from tests.utils.resource_utils import get_config_resource_filepath
 
@@ -28,6 +31,128 @@ def test_update_certificate(simple_config_path):
     assert config.bot.certificate._path == certificate_path
 
 
+def test_lazy_deserialization_configuration():
+    assert BdkConfig(host="acme.symphony.com").lazy_deserialization is False
+    assert BdkConfig(host="acme.symphony.com", lazyDeserialization=True).lazy_deserialization is True
+
+
+def test_json_codec_configuration():
+    assert BdkConfig(host="acme.symphony.com").json_codec == "json"
+    assert BdkConfig(host="acme.symphony.com", jsonCodec="orjson").json_codec == "orjson"
+
+
+def test_token_renewal_configuration():
+    config = BdkConfig(host="acme.symphony.com", bot={"username": "bot", "tokenRenewal": {
+        "enabled": True, "tokenLifetimeSeconds": 3600, "renewalMarginSeconds": 120}})
+
+    assert config.bot.token_renewal.enabled is True
+    assert config.bot.token_renewal.token_lifetime == timedelta(hours=1)
+    assert config.bot.token_renewal.renewal_margin == timedelta(minutes=2)
+
+
+def test_token_renewal_default_configuration():
+    config = BdkConfig(host="acme.symphony.com", bot={"username": "bot"})
+
+    assert config.bot.token_renewal.enabled is False
+    assert config.bot.token_renewal.token_lifetime is None
+    assert config.bot.token_renewal.renewal_margin == timedelta(seconds=60)
+
+
+def test_validated_jwt_cache_configuration():
+    assert BdkConfig(host="acme.symphony.com", app={"appId": "app"}).app.validated_jwt_cache_size == 0
+    config = BdkConfig(host="acme.symphony.com", app={"appId": "app", "validatedJwtCacheSize": 100})
+
+    assert config.app.validated_jwt_cache_size == 100
+
+
+def test_user_cache_configuration():
+    config = BdkConfig(host="acme.symphony.com", userCache={"enabled": True, "maxSize": 100, "ttlSeconds": 60})
+
+    assert config.user_cache.enabled is True
+    assert config.user_cache.max_size == 100
+    assert config.user_cache.ttl == 60
+
+
+def test_user_cache_default_configuration():
+    config = BdkConfig(host="acme.symphony.com")
+
+    assert config.user_cache.enabled is False
+    assert config.user_cache.max_size == 10000
+    assert config.user_cache.ttl == 300
+
+
+def test_room_membership_cache_configuration():
+    assert BdkConfig(host="acme.symphony.com").room_membership_cache.enabled is False
+    config = BdkConfig(host="acme.symphony.com", roomMembershipCache={"enabled": True, "ttlSeconds": 600})
+
+    assert config.room_membership_cache.enabled is True
+    assert config.room_membership_cache.max_size == 10000
+    assert config.room_membership_cache.ttl == 600
+
+
+def test_stream_cache_configuration():
+    assert BdkConfig(host="acme.symphony.com").stream_cache.enabled is False
+    config = BdkConfig(host="acme.symphony.com", streamCache={"enabled": True, "maxSize": 500})
+
+    assert config.stream_cache.enabled is True
+    assert config.stream_cache.max_size == 500
+    assert config.stream_cache.ttl == 300
+
+
+def test_max_concurrent_listener_tasks_configuration():
+    assert BdkConfig(host="acme.symphony.com").datafeed.max_concurrent_listener_tasks is None
+    config = BdkConfig(host="acme.symphony.com", datafeed={"maxConcurrentListenerTasks": 10},
+                       datahose={"maxConcurrentListenerTasks": 20})
+
+    assert config.datafeed.max_concurrent_listener_tasks == 10
+    assert config.datahose.max_concurrent_listener_tasks == 20
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, "10", True])
+def test_invalid_max_concurrent_listener_tasks_configuration(value):
+    with pytest.raises(BdkConfigError):
+        BdkConfig(host="acme.symphony.com", datafeed={"maxConcurrentListenerTasks": value})
+    with pytest.raises(BdkConfigError):
+        BdkConfig(host="acme.symphony.com", datahose={"maxConcurrentListenerTasks": value})
+
+
+def test_max_unacked_batches_configuration():
+    assert BdkConfig(host="acme.symphony.com").datafeed.max_unacked_batches is None
+    config = BdkConfig(host="acme.symphony.com", datafeed={"maxUnackedBatches": 3},
+                       datahose={"maxUnackedBatches": 4})
+
+    assert config.datafeed.max_unacked_batches == 3
+    assert config.datahose.max_unacked_batches == 4
+
+
+def test_event_deduplication_configuration():
+    assert BdkConfig(host="acme.symphony.com").datafeed.event_deduplication.enabled is False
+    config = BdkConfig(host="acme.symphony.com",
+                       datafeed={"eventDeduplication": {"enabled": True, "maxSize": 100, "ttlSeconds": 60}},
+                       datahose={"eventDeduplication": {"enabled": True}})
+
+    assert config.datafeed.event_deduplication.enabled is True
+    assert config.datafeed.event_deduplication.max_size == 100
+    assert config.datafeed.event_deduplication.ttl == 60
+    assert config.datahose.event_deduplication.enabled is True
+    assert config.datahose.event_deduplication.max_size == 10000
+
+
+def test_spool_configuration():
+    assert BdkConfig(host="acme.symphony.com").datafeed.spool.enabled is False
+    config = BdkConfig(host="acme.symphony.com",
+                       datafeed={"spool": {"path": "/tmp/datafeed.spool", "fsync": False, "maxPendingEvents": 100}},
+                       datahose={"spool": {"path": "/tmp/datahose.spool"}})
+
+    assert config.datafeed.spool.enabled is True
+    assert config.datafeed.spool.path == Path("/tmp/datafeed.spool")
+    assert config.datafeed.spool.fsync is False
+    assert config.datafeed.spool.max_pending_events == 100
+    assert config.datahose.spool.path == Path("/tmp/datahose.spool")
+    assert config.datahose.spool.fsync is True
+    assert config.datahose.spool.max_pending_events == 10000
+
+
 def test_retry_configuration():
     config_path = get_config_resource_filepath("retry_config.yaml")
     config = BdkConfigLoader.load_from_file(config_path)
@@ -4,6 +4,7 @@ import pytest
 import symphony.bdk.core.retry.strategy as strategy
 
 from unittest.mock import Mock, AsyncMock
+from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.auth.exception import AuthUnauthorizedError
 from symphony.bdk.core.retry import retry
 from symphony.bdk.gen import ApiException
@@ -57,6 +58,29 @@ class TestRefreshSessionStrategy:
         self._auth_session.refresh.assert_called_once()
         assert value is True
 
+    @pytest.mark.asyncio
+    async def test_unauthorized_error_refreshes_generation_used_by_attempt(self):
+        self._auth_session = AuthSession(AsyncMock())
+        self._auth_session._generation = 3
+        self._auth_session.refresh = AsyncMock()
+        thing = NoApiExceptionAfterCount(1, status=401)
+
+        await self._retryable_coroutine(thing)
+
+        self._auth_session.refresh.assert_called_once_with(3)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_unauthorized_errors_refresh_session_once(self):
+        authenticator = AsyncMock()
+        self._auth_session = AuthSession(authenticator)
+        things = [NoApiExceptionAfterCount(1, status=401) for _ in range(5)]
+
+        values = await asyncio.gather(*(self._retryable_coroutine(thing) for thing in things))
+
+        assert values == [True] * 5
+        authenticator.retrieve_session_token.assert_called_once()
+        assert self._auth_session.generation == 1
+
 
 class TestReadDatafeedStrategy:
     """Testing read_datafeed_retry strategy"""
@@ -131,6 +155,18 @@ class TestReadDatahoseStrategy:
         self._auth_session.refresh.assert_called_once()
         assert value is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('status, expected_args', [(401, (3,)), (500, ())])
+    async def test_only_unauthorized_error_refreshes_generation_used_by_attempt(self, status, expected_args):
+        self._retry_config = minimal_retry_config_with_attempts(2)
+        self._auth_session = AuthSession(AsyncMock())
+        self._auth_session._generation = 3
+        self._auth_session.refresh = AsyncMock()
+
+        await self._retryable_coroutine(NoApiExceptionAfterCount(1, status=status))
+
+        self._auth_session.refresh.assert_called_once_with(*expected_args)
+
     @pytest.mark.asyncio
     async def test_unexpected_api_exception_is_raised(self):
         self._retry_config = minimal_retry_config_with_attempts(1)
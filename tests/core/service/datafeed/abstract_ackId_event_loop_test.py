@@ -8,7 +8,19 @@ from tests.core.service.datafeed.test_fixtures import fixture_initiator_userid,
 from symphony.bdk.gen.agent_model.v5_event_list import V5EventList
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.service.datafeed.abstract_ackId_event_loop import AbstractAckIdEventLoop
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import RealTimeEvent
+from symphony.bdk.core.service.datafeed.event_spool import EventSpool
+from symphony.bdk.core.service.datafeed.exception import EventError
+from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
 
 
 @pytest.fixture(name="read_events_side_effect")
@@ -38,3 +50,318 @@ async def test_run_loop_iteration(bare_ackid_event_loop, read_events_side_effect
     bare_ackid_event_loop._read_events.side_effect = read_events_side_effect
     await bare_ackid_event_loop._run_loop_iteration()
     assert bare_ackid_event_loop._ack_id == "testing_ack_id"
+
+
+@pytest.fixture(name="pipelined_event_loop")
+def fixture_pipelined_event_loop(session_service):
+    with patch.multiple(AbstractAckIdEventLoop, __abstractmethods__=set()):
+        event_loop = AbstractAckIdEventLoop(DatafeedApi(AsyncMock()), session_service, None,
+                                            BdkConfig(datafeed={"maxUnackedBatches": 2}))
+        event_loop._read_events = AsyncMock(side_effect=[V5EventList(events=[], ack_id=f"ack_id_{i}")
+                                                         for i in range(5)])
+        return event_loop
+
+
+class BatchHandler:
+    """Replaces _run_all_listener_tasks with batches completed by the tests.
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, events):
+        batch = asyncio.get_running_loop().create_future()
+        self.batches.append(batch)
+        return await batch
+
+
+@pytest.mark.asyncio
+async def test_pipelined_read_while_batch_handled(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+
+    await pipelined_event_loop._run_loop_iteration()
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    assert pipelined_event_loop._read_events.call_count == 2
+    assert len(batch_handler.batches) == 2
+    assert pipelined_event_loop._ack_id == ""
+
+
+@pytest.mark.asyncio
+async def test_pipelined_read_waits_when_too_many_unacked_batches(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    iteration = asyncio.create_task(pipelined_event_loop._run_loop_iteration())
+    await asyncio.sleep(0.001)
+    assert pipelined_event_loop._read_events.call_count == 2
+
+    batch_handler.batches[0].set_result(True)
+    await iteration
+
+    assert pipelined_event_loop._read_events.call_count == 3
+    assert pipelined_event_loop._ack_id == "ack_id_0"
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batches_acked_in_read_order(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    batch_handler.batches[1].set_result(True)
+    await asyncio.sleep(0)
+    pipelined_event_loop._ack_handled_batches()
+    assert pipelined_event_loop._ack_id == ""
+
+    batch_handler.batches[0].set_result(True)
+    await asyncio.sleep(0)
+    pipelined_event_loop._ack_handled_batches()
+    assert pipelined_event_loop._ack_id == "ack_id_1"
+
+
+@pytest.mark.asyncio
+async def test_pipelined_failed_batch_not_acked(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    batch_handler.batches[0].set_result(True)
+    batch_handler.batches[1].set_result(False)
+    await asyncio.sleep(0)
+    pipelined_event_loop._ack_handled_batches()
+
+    assert pipelined_event_loop._ack_id == "ack_id_0"
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batches_not_acked_after_reset(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    pipelined_event_loop._reset_ack_id()
+    batch_handler.batches[0].set_result(True)
+    await asyncio.sleep(0)
+    pipelined_event_loop._ack_handled_batches()
+
+    assert pipelined_event_loop._ack_id == ""
+
+
+@pytest.mark.asyncio
+async def test_pipelined_stop_waits_for_batches(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    stop = asyncio.create_task(pipelined_event_loop._stop_listener_tasks())
+    await asyncio.sleep(0.001)
+    assert not stop.done()
+
+    batch_handler.batches[0].set_result(True)
+    await stop
+
+    assert not pipelined_event_loop._unacked_batches
+
+
+@pytest.mark.asyncio
+async def test_pipelined_hard_kill_cancels_batches(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+    pipelined_event_loop._hard_kill = True
+
+    await pipelined_event_loop._stop_listener_tasks()
+
+    assert batch_handler.batches[0].cancelled()
+
+
+class SlowAcceptingListener(RealTimeEventListener):
+    def __init__(self):
+        self.finished = []
+
+    async def is_accepting_event(self, event: V4Event, bot_info: UserV2) -> bool:
+        await asyncio.sleep(0.001)
+        return True
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        await asyncio.sleep(0.001)
+        self.finished.append(event.message.message_id)
+
+
+def message_sent_in(stream_id, message_id):
+    message = V4Message(attachments=[], message="message", message_id=message_id, stream=V4Stream(stream_id=stream_id))
+    return V4Event(type=RealTimeEvent.MESSAGESENT.name, payload=V4Payload(message_sent=V4MessageSent(message=message)),
+                   initiator=V4Initiator(user=V4User(user_id=67890)))
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batches_keep_events_of_stream_ordered(session_service):
+    with patch.multiple(AbstractAckIdEventLoop, __abstractmethods__=set()):
+        event_loop = AbstractAckIdEventLoop(DatafeedApi(AsyncMock()), session_service, None,
+                                            BdkConfig(datafeed={"maxUnackedBatches": 2,
+                                                                "maxConcurrentListenerTasks": 2}))
+    event_loop._bot_info = UserV2(id=12345)
+    listener = SlowAcceptingListener()
+    event_loop.subscribe(listener)
+    event_loop.order_events_by()
+    event_loop._read_events = AsyncMock(side_effect=[
+        V5EventList(events=[message_sent_in("t", "0"), message_sent_in("s", "1"), message_sent_in("s", "2")],
+                    ack_id="ack_id_0"),
+        V5EventList(events=[message_sent_in("s", "3")], ack_id="ack_id_1")])
+
+    await event_loop._run_loop_iteration()
+    await event_loop._run_loop_iteration()
+    await asyncio.gather(*[batch_task for batch_task, _ in event_loop._unacked_batches])
+
+    assert [message_id for message_id in listener.finished if message_id != "0"] == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batch_handling_error_propagated(pipelined_event_loop):
+    batch_handler = BatchHandler()
+    pipelined_event_loop._run_all_listener_tasks = batch_handler
+    await pipelined_event_loop._run_loop_iteration()
+    await asyncio.sleep(0)
+
+    batch_handler.batches[0].set_exception(ValueError("error"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ValueError):
+        await pipelined_event_loop._run_loop_iteration()
+
+
+def message_sent(message_id):
+    payload = V4Payload(message_sent=V4MessageSent(message=V4Message(attachments=[], message="message",
+                                                                      message_id=message_id)))
+    return V4Event(id=message_id, type=RealTimeEvent.MESSAGESENT.name, payload=payload,
+                   initiator=V4Initiator(user=V4User(user_id=67890)))
+
+
+class BlockingListener(RealTimeEventListener):
+    def __init__(self, error=None):
+        self.release = asyncio.Event()
+        self.error = error
+        self.handled = []
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        self.handled.append(event.message.message_id)
+
+
+def spooled_event_loop(session_service, spool_path, listener, batches, **spool_config):
+    """Creates a loop reading the given batches of events, then stopping.
+    """
+    with patch.multiple(AbstractAckIdEventLoop, __abstractmethods__=set()):
+        event_loop = AbstractAckIdEventLoop(DatafeedApi(AsyncMock()), session_service, None,
+                                            BdkConfig(datafeed={"spool": {"path": str(spool_path), **spool_config}}))
+    event_loop._bot_info = UserV2(id=12345)
+    event_loop.subscribe(listener)
+    event_loop.read_ack_ids = []
+
+    async def read_events():
+        event_loop.read_ack_ids.append(event_loop._ack_id)
+        index = len(event_loop.read_ack_ids) - 1
+        if index >= len(batches):
+            await event_loop.stop(hard_kill=event_loop.hard_kill_at_end)
+            return V5EventList(events=[], ack_id="last_ack_id")
+        return V5EventList(events=batches[index], ack_id=f"ack_id_{index}")
+
+    event_loop.hard_kill_at_end = False
+    event_loop._read_events = read_events
+    return event_loop
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_acked_before_being_handled(session_service, tmp_path):
+    listener = BlockingListener()
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener,
+                                    [[message_sent("msg_1"), message_sent("msg_2")], []])
+
+    start = asyncio.create_task(event_loop.start())
+    await asyncio.sleep(0.01)
+
+    assert event_loop.read_ack_ids == ["", "ack_id_0", "ack_id_1"]
+    assert listener.handled == []
+    listener.release.set()
+    await start
+
+    assert sorted(listener.handled) == ["msg_1", "msg_2"]
+    spool = EventSpool(tmp_path / "spool")
+    assert spool.open() == []
+    spool.close()
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_replayed_after_hard_stop(session_service, tmp_path):
+    listener = BlockingListener()
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener,
+                                    [[message_sent("msg_1"), message_sent("msg_2")]])
+    event_loop.hard_kill_at_end = True
+    await event_loop.start()
+    assert listener.handled == []
+
+    listener = BlockingListener()
+    listener.release.set()
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener, [])
+    await event_loop.start()
+
+    assert listener.handled == ["msg_1", "msg_2"]
+    spool = EventSpool(tmp_path / "spool")
+    assert spool.open() == []
+    spool.close()
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_failed_kept_in_spool(session_service, tmp_path):
+    listener = BlockingListener(error=EventError("error"))
+    listener.release.set()
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener, [[message_sent("msg_1")]])
+
+    await event_loop.start()
+
+    spool = EventSpool(tmp_path / "spool")
+    assert [event.id for _, event in spool.open()] == ["msg_1"]
+    spool.close()
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_read_paused_when_too_many_pending(session_service, tmp_path):
+    listener = BlockingListener()
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener,
+                                    [[message_sent("msg_1")], [message_sent("msg_2")]], maxPendingEvents=1)
+
+    start = asyncio.create_task(event_loop.start())
+    await asyncio.sleep(0.01)
+
+    assert event_loop.read_ack_ids == [""]
+    listener.release.set()
+    await start
+
+    assert event_loop.read_ack_ids == ["", "ack_id_0", "ack_id_1"]
+    assert listener.handled == ["msg_1", "msg_2"]
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_dispatch_error_propagated(session_service, tmp_path):
+    listener = BlockingListener()
+    listener.is_accepting_event = AsyncMock(side_effect=ValueError("error"))
+    event_loop = spooled_event_loop(session_service, tmp_path / "spool", listener,
+                                    [[message_sent("msg_1")], [], []])
+
+    with pytest.raises(ValueError):
+        await event_loop.start()
@@ -7,7 +7,10 @@ from tests.core.service.datafeed.test_fixtures import fixture_initiator_userid,
     fixture_message_sent_v4_event
 
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
-from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop, RealTimeEvent
+from symphony.bdk.core.service.datafeed.abstract_datafeed_loop import AbstractDatafeedLoop, RealTimeEvent, \
+    event_stream_id
+from symphony.bdk.core.service.datafeed.exception import EventError
+from symphony.bdk.core.service.datafeed.handled_events_repository import InMemoryHandledEventsRepository
 from symphony.bdk.core.service.datafeed.real_time_event_listener import RealTimeEventListener
 from symphony.bdk.gen.agent_api.datafeed_api import DatafeedApi
 from symphony.bdk.gen.agent_model.v4_connection_accepted import V4ConnectionAccepted
@@ -26,6 +29,7 @@ from symphony.bdk.gen.agent_model.v4_room_member_promoted_to_owner import V4Room
 from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
 from symphony.bdk.gen.agent_model.v4_room_updated import V4RoomUpdated
 from symphony.bdk.gen.agent_model.v4_shared_post import V4SharedPost
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
 from symphony.bdk.gen.agent_model.v4_symphony_elements_action import V4SymphonyElementsAction
 from symphony.bdk.gen.agent_model.v4_user import V4User
 from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
@@ -120,6 +124,378 @@ async def test_unexpected_error_should_be_propagated_and_call_stop_tasks(bare_df
     bare_df_loop._stop_listener_tasks.assert_called_once()
 
 
+@pytest.fixture(name="bounded_df_loop")
+def fixture_bounded_df_loop(session_service):
+    with patch.multiple(AbstractDatafeedLoop, __abstractmethods__=set()):
+        df_loop = AbstractDatafeedLoop(DatafeedApi(AsyncMock()), session_service, None,
+                                       BdkConfig(datafeed={"maxConcurrentListenerTasks": 2}))
+        df_loop._bot_info = BOT_INFO
+        return df_loop
+
+
+class ConcurrencyTrackingListener(RealTimeEventListener):
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.handled = 0
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        self.handled += 1
+
+
+@pytest.mark.asyncio
+async def test_listener_tasks_bounded(bounded_df_loop, message_sent_v4_event):
+    listener = ConcurrencyTrackingListener()
+    bounded_df_loop.subscribe(listener)
+
+    done_tasks = await bounded_df_loop._run_listener_tasks([message_sent_v4_event] * 10)
+
+    assert len(done_tasks) == 10
+    assert listener.handled == 10
+    assert listener.max_running == 2
+    assert len(bounded_df_loop._tasks) == 0
+
+
+@pytest.mark.asyncio
+async def test_listener_tasks_not_bounded_by_default(df_loop, message_sent_v4_event):
+    listener = ConcurrencyTrackingListener()
+    df_loop.subscribe(listener)
+
+    await df_loop._run_listener_tasks([message_sent_v4_event] * 10)
+
+    assert listener.max_running == 10
+
+
+@pytest.mark.asyncio
+async def test_bounded_listener_task_slot_released_on_cancel(bounded_df_loop, message_sent_v4_event):
+    bounded_df_loop.subscribe(ConcurrencyTrackingListener())
+    tasks = await bounded_df_loop._create_listener_tasks([message_sent_v4_event] * 2)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    done_tasks = await bounded_df_loop._run_listener_tasks([message_sent_v4_event] * 2)
+
+    assert len(done_tasks) == 2
+
+
+class BlockingListener(RealTimeEventListener):
+    def __init__(self):
+        self.started = 0
+        self.release = asyncio.Event()
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        self.started += 1
+        await self.release.wait()
+
+
+@pytest.mark.asyncio
+async def test_bounded_listener_tasks_delay_dispatch_of_next_events(bounded_df_loop, message_sent_v4_event):
+    listener = BlockingListener()
+    bounded_df_loop.subscribe(listener)
+    tasks_count = len(asyncio.all_tasks())
+
+    creation = asyncio.create_task(bounded_df_loop._create_listener_tasks([message_sent_v4_event] * 100))
+    await asyncio.sleep(0.01)
+
+    # 2 running calls and 2 waiting in the queue, the other events are not dispatched yet
+    assert not creation.done()
+    assert listener.started == 2
+    assert len(bounded_df_loop._listener_workers) == 2
+    assert len(asyncio.all_tasks()) == tasks_count + 3
+
+    listener.release.set()
+    tasks = await creation
+    await asyncio.gather(*tasks)
+    assert listener.started == 100
+    assert not bounded_df_loop._listener_workers
+
+
+@pytest.mark.asyncio
+async def test_bounded_listener_tasks_cancelled_on_hard_kill(bounded_df_loop, message_sent_v4_event):
+    bounded_df_loop.subscribe(BlockingListener())
+    tasks = await bounded_df_loop._create_listener_tasks([message_sent_v4_event] * 4)
+
+    await bounded_df_loop.stop(hard_kill=True)
+    await bounded_df_loop._stop_listener_tasks()
+
+    assert all(task.cancelled() for task in tasks)
+    assert not bounded_df_loop._listener_workers
+
+
+@pytest.mark.asyncio
+async def test_bounded_listener_task_error(bounded_df_loop, message_sent_v4_event):
+    listener = AsyncMock(wraps=RealTimeEventListener())
+    listener.on_message_sent.side_effect = EventError("failure")
+    bounded_df_loop.subscribe(listener)
+
+    [done_task] = await bounded_df_loop._run_listener_tasks([message_sent_v4_event])
+
+    assert isinstance(done_task.exception(), EventError)
+
+
+def message_sent_in(stream_id, message_id):
+    message = V4Message(attachments=[], message="message", message_id=message_id, stream=V4Stream(stream_id=stream_id))
+    payload = V4Payload(message_sent=V4MessageSent(message=message))
+    return V4Event(type=RealTimeEvent.MESSAGESENT.name, payload=payload, initiator=V4Initiator(user=V4User(user_id=1)))
+
+
+class OrderTrackingListener(RealTimeEventListener):
+    def __init__(self):
+        self.started = []
+        self.finished = []
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        self.started.append(event.message.message_id)
+        # the first messages take longer to handle
+        await asyncio.sleep(0.01 * (5 - len(self.started)))
+        self.finished.append(event.message.message_id)
+
+
+def test_event_stream_id():
+    room_created = V4Event(type=RealTimeEvent.ROOMCREATED.name,
+                           payload=V4Payload(room_created=V4RoomCreated(stream=V4Stream(stream_id="ab/c+dA=="))))
+
+    assert event_stream_id(message_sent_in("stream_id", "msg")) == "stream_id"
+    assert event_stream_id(room_created) == "ab_c-dA"
+    assert event_stream_id(V4Event(type=RealTimeEvent.MESSAGESENT.name, payload=V4Payload())) is None
+    assert event_stream_id(V4Event(type="unknown", payload=V4Payload())) is None
+
+
+@pytest.mark.asyncio
+async def test_events_of_same_stream_handled_in_order(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.order_events_by()
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(4)])
+
+    assert listener.started == ["0", "1", "2", "3"]
+    assert listener.finished == ["0", "1", "2", "3"]
+    assert df_loop._lanes == {}
+
+
+@pytest.mark.asyncio
+async def test_events_of_same_stream_handled_in_order_across_batches(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.order_events_by()
+
+    first_tasks = await df_loop._create_listener_tasks([message_sent_in("stream_id", "0")])
+    second_tasks = await df_loop._create_listener_tasks([message_sent_in("stream_id", "1")])
+    await asyncio.gather(*first_tasks, *second_tasks)
+
+    assert listener.finished == ["0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_events_of_different_streams_handled_concurrently(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.order_events_by()
+
+    await df_loop._run_listener_tasks([message_sent_in(f"stream_{i}", str(i)) for i in range(4)])
+
+    assert listener.started == ["0", "1", "2", "3"]
+    assert listener.finished == ["3", "2", "1", "0"]
+
+
+@pytest.mark.asyncio
+async def test_events_not_ordered_by_default(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(4)])
+
+    assert listener.finished == ["3", "2", "1", "0"]
+
+
+@pytest.mark.asyncio
+async def test_events_ordered_by_custom_key(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.order_events_by(lambda event: int(event.payload.message_sent.message.message_id) % 2)
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(4)])
+
+    assert listener.finished.index("0") < listener.finished.index("2")
+    assert listener.finished.index("1") < listener.finished.index("3")
+    assert listener.finished.index("1") < listener.finished.index("0")
+
+
+@pytest.mark.asyncio
+async def test_events_without_key_not_ordered(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.order_events_by(lambda event: None)
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(4)])
+
+    assert listener.finished == ["3", "2", "1", "0"]
+    assert df_loop._lanes == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_event_does_not_block_stream(df_loop):
+    listener = OrderTrackingListener()
+    failing_listener = AsyncMock(wraps=RealTimeEventListener())
+    failing_listener.on_message_sent.side_effect = [ValueError("error"), None]
+    df_loop.subscribe(failing_listener)
+    df_loop.subscribe(listener)
+    df_loop.order_events_by()
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(2)])
+
+    assert listener.finished == ["0", "1"]
+    assert failing_listener.on_message_sent.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ordered_events_with_bounded_listener_tasks(bounded_df_loop):
+    listener = OrderTrackingListener()
+    bounded_df_loop.subscribe(listener)
+    bounded_df_loop.order_events_by()
+
+    await bounded_df_loop._run_listener_tasks([message_sent_in("stream_id", str(i)) for i in range(4)])
+
+    assert listener.finished == ["0", "1", "2", "3"]
+
+
+class StreamBlockingListener(RealTimeEventListener):
+    def __init__(self, blocked_stream_id):
+        self.blocked_stream_id = blocked_stream_id
+        self.release = asyncio.Event()
+        self.finished = []
+
+    async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
+        if event.message.stream.stream_id == self.blocked_stream_id:
+            await self.release.wait()
+        self.finished.append(event.message.message_id)
+
+
+@pytest.mark.asyncio
+async def test_busy_stream_does_not_starve_other_streams(bounded_df_loop):
+    listener = StreamBlockingListener("busy")
+    bounded_df_loop.subscribe(listener)
+    bounded_df_loop.order_events_by()
+    events = [message_sent_in("busy", str(i)) for i in range(3)] + [message_sent_in("other", "3")]
+
+    tasks = await bounded_df_loop._create_listener_tasks(events)
+    await asyncio.sleep(0.01)
+
+    assert listener.finished == ["3"]
+    listener.release.set()
+    await asyncio.gather(*tasks)
+    assert listener.finished == ["3", "0", "1", "2"]
+
+
+def message_sent_with_id(event_id):
+    event = message_sent_in("stream_id", event_id)
+    event.id = event_id
+    return event
+
+
+@pytest.mark.asyncio
+async def test_handled_events_not_dispatched_again(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.deduplicate_events(InMemoryHandledEventsRepository())
+
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1"), message_sent_with_id("event_2")])
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1"), message_sent_with_id("event_3")])
+
+    assert sorted(listener.finished) == ["event_1", "event_2", "event_3"]
+
+
+@pytest.mark.asyncio
+async def test_handled_events_saved_with_their_batch(df_loop):
+    df_loop.subscribe(OrderTrackingListener())
+    handled_events = InMemoryHandledEventsRepository()
+    saved_event_ids = []
+
+    async def save(event_id):
+        await asyncio.sleep(0.01)
+        saved_event_ids.append(event_id)
+
+    handled_events.save = save
+    df_loop.deduplicate_events(handled_events)
+
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1"), message_sent_with_id("event_2")])
+
+    assert sorted(saved_event_ids) == ["event_1", "event_2"]
+    assert not df_loop._tasks
+
+
+@pytest.mark.asyncio
+async def test_failed_events_dispatched_again(df_loop):
+    listener = OrderTrackingListener()
+    failing_listener = AsyncMock(wraps=RealTimeEventListener())
+    failing_listener.on_message_sent.side_effect = [EventError("error"), ValueError("error"), None, None, None]
+    df_loop.subscribe(failing_listener)
+    df_loop.subscribe(listener)
+    df_loop.deduplicate_events(InMemoryHandledEventsRepository())
+    events = [message_sent_with_id("event_1"), message_sent_with_id("event_2"), message_sent_with_id("event_3")]
+
+    await df_loop._run_listener_tasks(events)
+    await df_loop._run_listener_tasks(events)
+    await df_loop._run_listener_tasks(events)
+
+    assert sorted(listener.finished) == ["event_1", "event_1", "event_2", "event_2", "event_3"]
+    assert failing_listener.on_message_sent.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_events_without_id_always_dispatched(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    df_loop.deduplicate_events(InMemoryHandledEventsRepository())
+
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", "msg")])
+    await df_loop._run_listener_tasks([message_sent_in("stream_id", "msg")])
+
+    assert listener.finished == ["msg", "msg"]
+
+
+@pytest.mark.asyncio
+async def test_events_dispatched_when_handled_events_not_retrieved(df_loop):
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+    handled_events = AsyncMock()
+    handled_events.filter_handled.side_effect = ValueError("error")
+    handled_events.save.side_effect = ValueError("error")
+    df_loop.deduplicate_events(handled_events)
+
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1")])
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1")])
+
+    assert listener.finished == ["event_1", "event_1"]
+
+
+@pytest.mark.asyncio
+async def test_events_deduplicated_from_configuration(session_service):
+    with patch.multiple(AbstractDatafeedLoop, __abstractmethods__=set()):
+        df_loop = AbstractDatafeedLoop(DatafeedApi(AsyncMock()), session_service, None,
+                                       BdkConfig(datafeed={"eventDeduplication": {"enabled": True, "maxSize": 10}}))
+    df_loop._bot_info = BOT_INFO
+    listener = OrderTrackingListener()
+    df_loop.subscribe(listener)
+
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1")])
+    await df_loop._run_listener_tasks([message_sent_with_id("event_1")])
+
+    assert isinstance(df_loop._handled_events, InMemoryHandledEventsRepository)
+    assert listener.finished == ["event_1"]
+
+
+@pytest.mark.asyncio
+async def test_events_not_deduplicated_by_default(df_loop):
+    assert df_loop._handled_events is None
+
+
 @pytest.mark.asyncio
 async def test_create_listener_tasks_none(df_loop, listener):
     tasks = await df_loop._create_listener_tasks(None)
@@ -189,13 +565,56 @@ async def test_create_listener_tasks_list(df_loop, listener, message_sent_v4_eve
 
 @pytest.mark.asyncio
 async def test_create_listener_tasks_list_several_listeners(df_loop, message_sent_v4_event, bot_message_sent_event):
-    df_loop.subscribe(RealTimeEventListener())
+    df_loop.subscribe(ConcurrencyTrackingListener())
 
     tasks = await df_loop._create_listener_tasks([message_sent_v4_event, bot_message_sent_event])
 
     assert len(tasks) == 2
 
 
+@pytest.mark.asyncio
+async def test_create_listener_tasks_only_for_handling_listeners(bare_df_loop, message_sent_v4_event,
+                                                                 initiator_userid):
+    bare_df_loop._bot_info = BOT_INFO
+    listener = ConcurrencyTrackingListener()
+    listener.is_accepting_event = AsyncMock(return_value=True)
+    bare_df_loop.subscribe(RealTimeEventListener())
+    bare_df_loop.subscribe(listener)
+    room_created_event = V4Event(type=RealTimeEvent.ROOMCREATED.name,
+                                 payload=V4Payload(room_created=V4RoomCreated()), initiator=initiator_userid)
+
+    tasks = await bare_df_loop._create_listener_tasks([message_sent_v4_event, room_created_event])
+    await asyncio.gather(*tasks)
+
+    assert len(tasks) == 1
+    assert listener.handled == 1
+    listener.is_accepting_event.assert_awaited_once_with(message_sent_v4_event, BOT_INFO)
+
+
+@pytest.mark.asyncio
+async def test_create_listener_tasks_for_handler_set_on_instance(bare_df_loop, message_sent_v4_event):
+    bare_df_loop._bot_info = BOT_INFO
+    listener = RealTimeEventListener()
+    listener.on_message_sent = AsyncMock()
+    bare_df_loop.subscribe(listener)
+
+    await create_and_await_tasks(bare_df_loop, [message_sent_v4_event])
+
+    listener.on_message_sent.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_listener_tasks_unsubscribed_listener(bare_df_loop, message_sent_v4_event):
+    bare_df_loop._bot_info = BOT_INFO
+    listener = ConcurrencyTrackingListener()
+    bare_df_loop.subscribe(listener)
+    bare_df_loop.unsubscribe(listener)
+
+    tasks = await bare_df_loop._create_listener_tasks([message_sent_v4_event])
+
+    assert tasks == []
+
+
 @pytest.mark.asyncio
 async def test_handle_message_sent(df_loop, listener, initiator_userid):
     payload = V4Payload(message_sent=V4MessageSent())
@@ -0,0 +1,139 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from symphony.bdk.core.service.datafeed.event_spool import EventSpool
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_message import V4Message
+from symphony.bdk.gen.agent_model.v4_message_sent import V4MessageSent
+from symphony.bdk.gen.agent_model.v4_payload import V4Payload
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from symphony.bdk.gen.agent_model.v4_user import V4User
+
+
+def message_sent(event_id):
+    message = V4Message(attachments=[], message="<p>message</p>", message_id=event_id,
+                        stream=V4Stream(stream_id="stream_id"))
+    return V4Event(id=event_id, type="MESSAGESENT", timestamp=1234,
+                   payload=V4Payload(message_sent=V4MessageSent(message=message)),
+                   initiator=V4Initiator(user=V4User(user_id=1)))
+
+
+@pytest.fixture(name="spool_path")
+def fixture_spool_path(tmp_path):
+    return tmp_path / "datafeed.spool"
+
+
+@pytest.fixture(name="spool")
+def fixture_spool(spool_path):
+    spool = EventSpool(spool_path)
+    spool.open()
+    yield spool
+    spool.close()
+
+
+def reopen(spool, spool_path):
+    spool.close()
+    reopened_spool = EventSpool(spool_path)
+    return reopened_spool, reopened_spool.open()
+
+
+@pytest.mark.asyncio
+async def test_append(spool):
+    entries = await spool.append([message_sent("event_1"), message_sent("event_2")])
+
+    assert [sequence for sequence, _ in entries] == [0, 1]
+    assert [event.id for _, event in entries] == ["event_1", "event_2"]
+    assert spool.pending_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_events_returned_when_reopened(spool, spool_path):
+    await spool.append([message_sent("event_1"), message_sent("event_2"), message_sent("event_3")])
+    await spool.mark_handled(1)
+
+    reopened_spool, entries = reopen(spool, spool_path)
+
+    assert [sequence for sequence, _ in entries] == [0, 2]
+    assert [event for _, event in entries] == [message_sent("event_1"), message_sent("event_3")]
+    assert reopened_spool.pending_count == 2
+    assert (await reopened_spool.append([message_sent("event_4")]))[0][0] == 3
+    reopened_spool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_events_returned_when_reopened(spool, spool_path):
+    await spool.append([message_sent("event_1"), message_sent("event_2")])
+    spool.mark_failed(0)
+    await spool.mark_handled(1)
+
+    assert spool.pending_count == 0
+    reopened_spool, entries = reopen(spool, spool_path)
+
+    assert [event.id for _, event in entries] == ["event_1"]
+    reopened_spool.close()
+
+
+@pytest.mark.asyncio
+async def test_spool_file_not_compacted_when_no_event_pending(spool, spool_path):
+    await spool.append([message_sent("event_1"), message_sent("event_2")])
+    await spool.mark_handled(0)
+    await spool.mark_handled(1)
+
+    assert len(spool_path.read_text().splitlines()) == 4
+    reopened_spool, entries = reopen(spool, spool_path)
+    assert entries == []
+    assert spool_path.read_text() == ""
+    reopened_spool.close()
+
+
+@pytest.mark.asyncio
+async def test_spool_file_compacted(spool, spool_path):
+    await spool.append([message_sent(f"event_{i}") for i in range(4)])
+
+    with patch("symphony.bdk.core.service.datafeed.event_spool.COMPACTION_THRESHOLD", 2):
+        await spool.mark_handled(0)
+        assert len(spool_path.read_text().splitlines()) == 5
+        await spool.mark_handled(1)
+
+    assert len(spool_path.read_text().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "O_DIRECTORY"), reason="directories cannot be opened")
+async def test_spool_directory_flushed_when_compacted(spool, spool_path):
+    await spool.append([message_sent("event_1")])
+
+    with patch("symphony.bdk.core.service.datafeed.event_spool.COMPACTION_THRESHOLD", 1), \
+            patch("os.fsync") as fsync:
+        await spool.mark_handled(0)
+
+    # the compacted file, then the directory it is renamed in
+    assert fsync.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_line_ignored(spool, spool_path):
+    await spool.append([message_sent("event_1")])
+    spool.close()
+    with spool_path.open("a") as spool_file:
+        spool_file.write('{"sequence": 1, "ev')
+
+    reopened_spool, entries = reopen(spool, spool_path)
+
+    assert [event.id for _, event in entries] == ["event_1"]
+    reopened_spool.close()
+
+
+@pytest.mark.asyncio
+async def test_append_without_fsync(spool_path):
+    spool = EventSpool(spool_path, fsync=False)
+    spool.open()
+
+    with patch("os.fsync") as fsync:
+        await spool.append([message_sent("event_1")])
+
+    fsync.assert_not_called()
+    spool.close()
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from symphony.bdk.core.service.datafeed.handled_events_repository import InMemoryHandledEventsRepository, \
+    SqliteHandledEventsRepository
+
+
+@pytest.fixture(name="repository", params=["in_memory", "sqlite"])
+def fixture_repository(request, tmp_path):
+    if request.param == "in_memory":
+        yield InMemoryHandledEventsRepository(max_events=3, ttl=60)
+    else:
+        repository = SqliteHandledEventsRepository(tmp_path / "handled_events.db", max_events=3, ttl=60)
+        # prunes the database on each save, as the in-memory repository
+        with patch("symphony.bdk.core.service.datafeed.handled_events_repository._SQLITE_PRUNING_INTERVAL", 1):
+            yield repository
+        repository.close()
+
+
+@pytest.mark.asyncio
+async def test_save_and_filter_handled(repository):
+    await repository.save("event_1")
+    await repository.save("event_2")
+
+    assert await repository.filter_handled(["event_1", "event_2", "event_3"]) == {"event_1", "event_2"}
+    assert await repository.filter_handled([]) == set()
+
+
+@pytest.mark.asyncio
+async def test_oldest_events_evicted(repository):
+    for i in range(5):
+        await repository.save(f"event_{i}")
+
+    assert await repository.filter_handled([f"event_{i}" for i in range(5)]) == {"event_2", "event_3", "event_4"}
+
+
+@pytest.mark.asyncio
+async def test_expired_events_not_returned(repository):
+    await repository.save("event_1")
+
+    with patch("time.monotonic", return_value=10 ** 9), patch("time.time", return_value=10 ** 11):
+        assert await repository.filter_handled(["event_1"]) == set()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_events_shared_between_repositories(tmp_path):
+    repository = SqliteHandledEventsRepository(tmp_path / "handled_events.db")
+    other_repository = SqliteHandledEventsRepository(tmp_path / "handled_events.db")
+    try:
+        await repository.save("event_1")
+
+        assert await other_repository.filter_handled(["event_1", "event_2"]) == {"event_1"}
+    finally:
+        repository.close()
+        other_repository.close()
+
+
+@pytest.mark.asyncio
+@patch("symphony.bdk.core.service.datafeed.handled_events_repository._SQLITE_PRUNING_INTERVAL", 3)
+async def test_sqlite_oldest_events_evicted_every_pruning_interval(tmp_path):
+    repository = SqliteHandledEventsRepository(tmp_path / "handled_events.db", max_events=3)
+    event_ids = [f"event_{i}" for i in range(6)]
+    try:
+        for event_id in event_ids[:5]:
+            await repository.save(event_id)
+        assert await repository.filter_handled(event_ids) == set(event_ids[:5])
+
+        await repository.save(event_ids[5])
+        assert await repository.filter_handled(event_ids) == set(event_ids[3:])
+    finally:
+        repository.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_filter_many_events(tmp_path):
+    repository = SqliteHandledEventsRepository(tmp_path / "handled_events.db")
+    try:
+        await repository.save("event_1500")
+
+        assert await repository.filter_handled([f"event_{i}" for i in range(2000)]) == {"event_1500"}
+    finally:
+        repository.close()
@@ -1,3 +1,4 @@
+import base64
 import json
 from unittest.mock import MagicMock, AsyncMock
 
@@ -242,6 +243,38 @@ async def test_get_attachment(mocked_api_client, message_service):
     assert attachment == "attachment-string"
 
 
+def mock_streamed_response(content, chunk_size):
+    async def iter_chunked(_):
+        for i in range(0, len(content), chunk_size):
+            yield content[i:i + chunk_size]
+
+    response = MagicMock()
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+@pytest.mark.asyncio
+async def test_stream_attachment(mocked_api_client, message_service):
+    response = mock_streamed_response(base64.b64encode(b"attachment-content"), 5)
+    mocked_api_client.call_api.return_value = response
+
+    chunks = [chunk async for chunk in message_service.stream_attachment("stream-id", "message-id", "attachment-id")]
+
+    assert b"".join(chunks) == b"attachment-content"
+    assert mocked_api_client.call_api.call_args.kwargs["_preload_content"] is False
+    response.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_attachment(mocked_api_client, message_service, tmp_path):
+    mocked_api_client.call_api.return_value = mock_streamed_response(base64.b64encode(b"attachment-content"), 3)
+
+    file_path = await message_service.download_attachment("stream-id", "message-id", "attachment-id",
+                                                          tmp_path / "attachment.bin")
+
+    assert file_path.read_bytes() == b"attachment-content"
+
+
 @pytest.mark.asyncio
 async def test_suppress_message(mocked_api_client, message_service):
     mocked_api_client.call_api.return_value = \
@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import AsyncMock, call
 
 import pytest
 
-from symphony.bdk.core.service.pagination import offset_based_pagination, cursor_based_pagination
+from symphony.bdk.core.service.pagination import offset_based_pagination, cursor_based_pagination, _read_ahead
 
 AFTER = "after"
 
@@ -13,11 +14,13 @@ class TestOffsetBasedPagination:
 
     @staticmethod
     async def assert_generator_produces(func_responses, max_number, expected_output, expected_calls):
-        mock_func = AsyncMock()
-        mock_func.side_effect = func_responses
+        for prefetch in (0, 2):
+            mock_func = AsyncMock()
+            mock_func.side_effect = func_responses
 
-        assert [x async for x in offset_based_pagination(mock_func, CHUNK_SIZE, max_number)] == expected_output
-        mock_func.assert_has_awaits(expected_calls)
+            assert [x async for x in offset_based_pagination(mock_func, CHUNK_SIZE, max_number, prefetch)] \
+                   == expected_output
+            assert mock_func.await_args_list == expected_calls
 
     @pytest.mark.asyncio
     async def test_empty_answer(self):
@@ -164,3 +167,201 @@ class TestCursorBasedPagination:
 
         assert [x async for x in cursor_based_pagination(mock_func, CHUNK_SIZE, 3)] == ["one", "two", "three"]
         mock_func.assert_has_awaits([call(CHUNK_SIZE, None), call(CHUNK_SIZE, AFTER)])
+
+
+class TestReadAhead:
+
+    @staticmethod
+    def endless_pages(calls):
+        async def one_page(skip, limit):
+            calls.append(skip)
+            await asyncio.sleep(0)
+            return list(range(skip, skip + limit))
+
+        return one_page
+
+    @pytest.mark.asyncio
+    async def test_next_pages_retrieved_while_consuming(self):
+        calls = []
+        generator = offset_based_pagination(self.endless_pages(calls), CHUNK_SIZE, prefetch=2)
+
+        assert await generator.__anext__() == 0
+        await asyncio.sleep(0.01)
+
+        # the page being consumed and the 2 pages retrieved ahead of it
+        assert calls == [0, 2, 4]
+        await generator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_single_page_retrieved_ahead(self):
+        calls = []
+        generator = offset_based_pagination(self.endless_pages(calls), CHUNK_SIZE, prefetch=1)
+
+        assert await generator.__anext__() == 0
+        await asyncio.sleep(0.01)
+
+        assert calls == [0, 2]
+        await generator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retrieval_stopped_when_generator_closed(self):
+        calls = []
+        generator = offset_based_pagination(self.endless_pages(calls), CHUNK_SIZE, prefetch=2)
+
+        assert [await generator.__anext__() for _ in range(3)] == [0, 1, 2]
+        await generator.aclose()
+        await asyncio.sleep(0.01)
+
+        assert len(calls) <= 5
+        assert calls == [0, 2, 4, 6, 8][:len(calls)]
+
+    @pytest.mark.asyncio
+    async def test_pages_generator_closed_when_generator_closed(self):
+        closed = asyncio.Event()
+
+        async def pages():
+            try:
+                while True:
+                    await asyncio.sleep(0)
+                    yield [0, 1]
+            finally:
+                closed.set()
+
+        generator = _read_ahead(pages(), 2)
+
+        assert await generator.__anext__() == [0, 1]
+        await generator.aclose()
+
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_pages_after_max_number_not_retrieved(self):
+        calls = []
+
+        items = [x async for x in offset_based_pagination(self.endless_pages(calls), CHUNK_SIZE, 5, prefetch=10)]
+
+        assert items == [0, 1, 2, 3, 4]
+        assert calls == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_error_raised_after_previous_pages(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [["one", "two"], ValueError("failure")]
+        items = []
+
+        with pytest.raises(ValueError):
+            async for item in offset_based_pagination(mock_func, CHUNK_SIZE, prefetch=2):
+                items.append(item)
+
+        assert items == ["one", "two"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_based_read_ahead(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [(["one", "two"], AFTER), (["three", "four"], "after_two"), (["five"], None)]
+
+        items = [x async for x in cursor_based_pagination(mock_func, CHUNK_SIZE, prefetch=1)]
+
+        assert items == ["one", "two", "three", "four", "five"]
+        assert mock_func.await_args_list == [call(CHUNK_SIZE, None), call(CHUNK_SIZE, AFTER),
+                                             call(CHUNK_SIZE, "after_two")]
+
+    @pytest.mark.asyncio
+    async def test_cursor_based_pages_after_max_number_not_retrieved(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [(["one", "two"], AFTER), (["three", "four"], "after_two")]
+
+        items = [x async for x in cursor_based_pagination(mock_func, CHUNK_SIZE, 3, prefetch=2)]
+
+        assert items == ["one", "two", "three"]
+        assert mock_func.await_count == 2
+
+
+class TestParallelOffsetBasedPagination:
+
+    @staticmethod
+    def pages(total, calls, delays=None):
+        async def one_page(skip, limit):
+            calls.append(skip)
+            await asyncio.sleep((delays or {}).get(skip, 0))
+            return list(range(skip, min(skip + limit, total)))
+
+        return one_page
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("total", [0, 1, 2, 5, 6, 20])
+    async def test_same_items_as_sequential(self, total):
+        calls = []
+
+        items = [x async for x in offset_based_pagination(self.pages(total, calls), CHUNK_SIZE, concurrency=3)]
+
+        assert items == list(range(total))
+        assert calls == list(range(0, len(calls) * CHUNK_SIZE, CHUNK_SIZE))
+        assert len(calls) <= total // CHUNK_SIZE + 3
+
+    @pytest.mark.asyncio
+    async def test_pages_requested_concurrently(self):
+        in_flight = []
+        max_in_flight = []
+
+        async def one_page(skip, limit):
+            in_flight.append(skip)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(skip)
+            return list(range(skip, min(skip + limit, 20)))
+
+        items = [x async for x in offset_based_pagination(one_page, CHUNK_SIZE, concurrency=4)]
+
+        assert items == list(range(20))
+        assert max(max_in_flight) == 4
+
+    @pytest.mark.asyncio
+    async def test_ordered_despite_slow_pages(self):
+        calls = []
+        delays = {0: 0.03, 4: 0.02}
+
+        items = [x async for x in offset_based_pagination(self.pages(9, calls, delays), CHUNK_SIZE, concurrency=3)]
+
+        assert items == list(range(9))
+
+    @pytest.mark.asyncio
+    async def test_unordered_yields_pages_as_received(self):
+        calls = []
+        delays = {0: 0.03}
+
+        items = [x async for x in offset_based_pagination(self.pages(9, calls, delays), CHUNK_SIZE, concurrency=3,
+                                                          ordered=False)]
+
+        assert sorted(items) == list(range(9))
+        assert items[:2] != [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_max_number(self):
+        calls = []
+
+        items = [x async for x in offset_based_pagination(self.pages(20, calls), CHUNK_SIZE, 5, concurrency=4)]
+
+        assert items == [0, 1, 2, 3, 4]
+        assert calls == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_error_raised_and_other_pages_cancelled(self):
+        cancelled = []
+
+        async def one_page(skip, limit):
+            if skip == 2:
+                raise ValueError("failure")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(skip)
+                raise
+            return [skip] * limit
+
+        with pytest.raises(ValueError):
+            async for _ in offset_based_pagination(one_page, CHUNK_SIZE, concurrency=3, ordered=False):
+                pass
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == [0, 4]
@@ -73,6 +73,20 @@ async def test_list_all_signals(signals_api, signal_service):
     assert signal_list[0].id == "signal_id1"
 
 
+@pytest.mark.asyncio
+async def test_list_all_signals_concurrently(signals_api, signal_service):
+    signals_api.v1_signals_list_get = AsyncMock()
+    signals_api.v1_signals_list_get.side_effect = \
+        [get_deserialized_object_from_resource(SignalList, "signal/list_signals.json"), SignalList(value=[]),
+         SignalList(value=[])]
+
+    signal_list_gen = await signal_service.list_all_signals(chunk_size=2, concurrency=3)
+    signal_list = [s async for s in signal_list_gen]
+
+    assert [call.kwargs["skip"] for call in signals_api.v1_signals_list_get.call_args_list] == [0, 2, 4]
+    assert [s.id for s in signal_list] == ["signal_id1", "signal_id2"]
+
+
 @pytest.mark.asyncio
 async def test_list_signals_with_skip_and_limit(signals_api, signal_service):
     signals_api.v1_signals_list_get = AsyncMock()
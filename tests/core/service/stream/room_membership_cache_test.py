@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from symphony.bdk.core.service.stream.room_membership_cache import RoomMembershipCache, RoomMembershipListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_member_demoted_from_owner import V4RoomMemberDemotedFromOwner
+from symphony.bdk.gen.agent_model.v4_room_member_promoted_to_owner import V4RoomMemberPromotedToOwner
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.agent_model.v4_user_joined_room import V4UserJoinedRoom
+from symphony.bdk.gen.agent_model.v4_user_left_room import V4UserLeftRoom
+from symphony.bdk.gen.pod_model.member_info import MemberInfo
+from symphony.bdk.gen.pod_model.membership_list import MembershipList
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+ROOM_ID = "XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ"
+
+
+@pytest.fixture(name="list_room_members")
+def fixture_list_room_members():
+    return AsyncMock(return_value=MembershipList(value=[MemberInfo(id=1, owner=True), MemberInfo(id=2, owner=False)]))
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(list_room_members):
+    return RoomMembershipCache(list_room_members, 10, 60)
+
+
+@pytest.fixture(name="listener")
+def fixture_listener(cache):
+    return RoomMembershipListener(cache)
+
+
+def affected_user_event(event_class, user_id, room_id=ROOM_ID):
+    return event_class(stream=V4Stream(stream_id=room_id), affected_user=V4User(user_id=user_id))
+
+
+@pytest.mark.asyncio
+async def test_members_loaded_once(cache, list_room_members):
+    assert await cache.is_member(ROOM_ID, 1)
+    assert await cache.is_owner(ROOM_ID, 1)
+    assert not await cache.is_owner(ROOM_ID, 2)
+    assert not await cache.is_member(ROOM_ID, 3)
+    assert sorted(await cache.list_member_ids(ROOM_ID)) == [1, 2]
+
+    list_room_members.assert_awaited_once_with(ROOM_ID)
+    assert cache.hits == 4
+    assert cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_load_members_once(cache, list_room_members):
+    results = await asyncio.gather(cache.is_member(ROOM_ID, 1), cache.is_member(ROOM_ID, 3))
+
+    assert results == [True, False]
+    list_room_members.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_id_normalized(cache, list_room_members):
+    await cache.is_member("XlU3OH9eVMzq+yss7M/xyn///oxwgbtGbQ==", 1)
+
+    assert await cache.is_member(ROOM_ID, 1)
+    list_room_members.assert_awaited_once_with(ROOM_ID)
+
+
+@pytest.mark.asyncio
+async def test_members_reloaded_once_expired(cache, list_room_members):
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=100):
+        await cache.is_member(ROOM_ID, 1)
+    list_room_members.return_value = MembershipList(value=[MemberInfo(id=2, owner=False)])
+
+    with patch("symphony.bdk.core.cache.time.monotonic", return_value=161):
+        assert not await cache.is_member(ROOM_ID, 1)
+    assert list_room_members.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listener_updates_cached_members(cache, listener):
+    await cache.is_member(ROOM_ID, 1)
+    initiator = V4Initiator()
+
+    await listener.on_user_joined_room(initiator, affected_user_event(V4UserJoinedRoom, 3))
+    await listener.on_room_member_promoted_to_owner(initiator, affected_user_event(V4RoomMemberPromotedToOwner, 3))
+    assert await cache.is_owner(ROOM_ID, 3)
+
+    await listener.on_room_demoted_from_owner(initiator, affected_user_event(V4RoomMemberDemotedFromOwner, 1))
+    assert not await cache.is_owner(ROOM_ID, 1)
+
+    await listener.on_user_left_room(initiator, affected_user_event(V4UserLeftRoom, 2))
+    assert sorted(await cache.list_member_ids(ROOM_ID)) == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_listener_ignores_rooms_not_cached(cache, listener, list_room_members):
+    await listener.on_user_joined_room(V4Initiator(), affected_user_event(V4UserJoinedRoom, 3))
+
+    assert not await cache.is_member(ROOM_ID, 3)
+    list_room_members.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_members_changed_while_loading_not_cached(cache, listener, list_room_members):
+    loaded = asyncio.Event()
+
+    async def list_members(room_id):
+        await loaded.wait()
+        return MembershipList(value=[MemberInfo(id=1, owner=True)])
+
+    list_room_members.side_effect = list_members
+    lookup = asyncio.ensure_future(cache.is_member(ROOM_ID, 3))
+    await asyncio.sleep(0)
+    await listener.on_user_joined_room(V4Initiator(), affected_user_event(V4UserJoinedRoom, 3))
+    loaded.set()
+    await lookup
+
+    list_room_members.side_effect = None
+    list_room_members.return_value = MembershipList(value=[MemberInfo(id=1, owner=True), MemberInfo(id=3)])
+    assert await cache.is_member(ROOM_ID, 3)
+    assert list_room_members.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_error_raised(cache, list_room_members):
+    list_room_members.side_effect = ValueError("failure")
+
+    with pytest.raises(ValueError):
+        await cache.is_member(ROOM_ID, 1)
+
+    list_room_members.side_effect = None
+    assert await cache.is_member(ROOM_ID, 1)
+
+
+@pytest.mark.asyncio
+async def test_invalidate(cache, list_room_members):
+    await cache.is_member(ROOM_ID, 1)
+
+    cache.invalidate(ROOM_ID)
+    await cache.is_member(ROOM_ID, 1)
+
+    assert list_room_members.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listener_accepts_bot_events(listener):
+    event = V4Event(initiator=V4Initiator(user=V4User(user_id=1)))
+
+    assert await listener.is_accepting_event(event, UserV2(id=1))
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from symphony.bdk.core.service.stream.stream_cache import StreamCache, StreamCacheListener
+from symphony.bdk.gen.agent_model.v4_event import V4Event
+from symphony.bdk.gen.agent_model.v4_initiator import V4Initiator
+from symphony.bdk.gen.agent_model.v4_room_created import V4RoomCreated
+from symphony.bdk.gen.agent_model.v4_room_deactivated import V4RoomDeactivated
+from symphony.bdk.gen.agent_model.v4_room_reactivated import V4RoomReactivated
+from symphony.bdk.gen.agent_model.v4_room_updated import V4RoomUpdated
+from symphony.bdk.gen.agent_model.v4_stream import V4Stream
+from symphony.bdk.gen.agent_model.v4_user import V4User
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+
+STREAM_ID = "XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ"
+
+
+@pytest.fixture(name="cache")
+def fixture_cache():
+    cache = StreamCache(10, 60)
+    cache.put("stream", STREAM_ID, "stream")
+    cache.put("room", STREAM_ID, "room")
+    cache.put("room", "other_room_id", "other room")
+    return cache
+
+
+def test_get(cache):
+    assert cache.get("stream", STREAM_ID) == "stream"
+    assert cache.get("room", "XlU3OH9eVMzq+yss7M/xyn///oxwgbtGbQ==") == "room"
+    assert cache.get("im", STREAM_ID) is None
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_invalidate(cache):
+    cache.invalidate(STREAM_ID)
+
+    assert cache.get("stream", STREAM_ID) is None
+    assert cache.get("room", STREAM_ID) is None
+    assert cache.get("room", "other_room_id") == "other room"
+
+
+@pytest.mark.asyncio
+async def test_load(cache):
+    async def loader():
+        return "im"
+
+    assert await cache.load("stream", STREAM_ID, loader) == "stream"
+    assert await cache.load("im", STREAM_ID, loader) == "im"
+    assert cache.get("im", STREAM_ID) == "im"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("invalidate", [
+    lambda cache: cache.invalidate(STREAM_ID),
+    lambda cache: cache.clear(),
+])
+async def test_load_not_cached_when_invalidated_while_loading(cache, invalidate):
+    loaded = asyncio.Event()
+
+    async def loader():
+        await loaded.wait()
+        return "outdated room"
+
+    cache.invalidate(STREAM_ID)
+    loading = asyncio.ensure_future(cache.load("room", STREAM_ID, loader))
+    await asyncio.sleep(0)
+    invalidate(cache)
+    loaded.set()
+
+    assert await loading == "outdated room"
+    assert cache.get("room", STREAM_ID) is None
+
+    assert await cache.load("room", STREAM_ID, lambda: asyncio.sleep(0, "room")) == "room"
+    assert cache.get("room", STREAM_ID) == "room"
+
+
+@pytest.mark.asyncio
+async def test_load_failure(cache):
+    async def loader():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        await cache.load("im", STREAM_ID, loader)
+
+    cache.invalidate(STREAM_ID)
+    assert await cache.load("im", STREAM_ID, lambda: asyncio.sleep(0, "im")) == "im"
+    assert cache.get("im", STREAM_ID) == "im"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, event_class", [
+    ("on_room_created", V4RoomCreated),
+    ("on_room_updated", V4RoomUpdated),
+    ("on_room_deactivated", V4RoomDeactivated),
+    ("on_room_reactivated", V4RoomReactivated),
+])
+async def test_listener_invalidates_room(cache, method, event_class):
+    listener = StreamCacheListener(cache)
+
+    await getattr(listener, method)(V4Initiator(), event_class(stream=V4Stream(stream_id=STREAM_ID)))
+
+    assert cache.get("room", STREAM_ID) is None
+    assert cache.get("room", "other_room_id") == "other room"
+
+
+@pytest.mark.asyncio
+async def test_listener_accepts_bot_events(cache):
+    event = V4Event(initiator=V4Initiator(user=V4User(user_id=1)))
+
+    assert await StreamCacheListener(cache).is_accepting_event(event, UserV2(id=1))
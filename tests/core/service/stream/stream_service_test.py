@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, AsyncMock, Mock
 import pytest
 
 from symphony.bdk.core.auth.auth_session import AuthSession
+from symphony.bdk.core.config.model.bdk_cache_config import BdkCacheConfig
 from symphony.bdk.core.service.stream.stream_service import StreamService
 from symphony.bdk.gen import ApiClient, Configuration
 from symphony.bdk.gen.agent_api.share_api import ShareApi
@@ -420,3 +421,110 @@ async def test_list_room_members(mocked_api_client, stream_service, room_members
     assert len(members) == 2
     assert members[0].id == 13056700579872
     assert members[1].id == 13056700579891
+
+
+@pytest.fixture(name="cached_stream_service")
+def fixture_cached_stream_service(streams_api, room_membership_api, share_api, auth_session):
+    return StreamService(streams_api, room_membership_api, share_api, auth_session, minimal_retry_config(),
+                         BdkCacheConfig({"enabled": True}), BdkCacheConfig({"enabled": True}))
+
+
+def test_caches_disabled(stream_service):
+    assert stream_service.room_membership_cache() is None
+    assert stream_service.stream_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_room_membership_cache(mocked_api_client, cached_stream_service, room_membership_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(MembershipList,
+                                                                                    "stream/list_room_members.json")
+    cache = cached_stream_service.room_membership_cache()
+
+    assert await cache.is_member("room_id", 13056700579872)
+    assert await cache.is_owner("room_id", 13056700579891)
+    assert not await cache.is_member("room_id", 1234)
+    room_membership_api.v2_room_id_membership_list_get.assert_called_once_with(id="room_id",
+                                                                                session_token=SESSION_TOKEN)
+
+
+@pytest.mark.asyncio
+async def test_room_membership_cache_updated_by_service(mocked_api_client, cached_stream_service):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(MembershipList,
+                                                                                    "stream/list_room_members.json")
+    cache = cached_stream_service.room_membership_cache()
+    await cache.is_member("room_id", 1234)
+
+    await cached_stream_service.add_member_to_room(1234, "room_id")
+    await cached_stream_service.promote_user_to_room_owner(1234, "room_id")
+    assert await cache.is_owner("room_id", 1234)
+
+    await cached_stream_service.demote_owner_to_room_participant(1234, "room_id")
+    assert not await cache.is_owner("room_id", 1234)
+
+    await cached_stream_service.remove_member_from_room(1234, "room_id")
+    assert not await cache.is_member("room_id", 1234)
+
+
+@pytest.mark.asyncio
+async def test_get_stream_cached(mocked_api_client, cached_stream_service, streams_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V2StreamAttributes,
+                                                                                    "stream/get_stream.json")
+
+    await cached_stream_service.get_stream("stream_id")
+    stream = await cached_stream_service.get_stream("stream_id")
+
+    streams_api.v2_streams_sid_info_get.assert_called_once_with(sid="stream_id", session_token=SESSION_TOKEN)
+    assert stream is mocked_api_client.call_api.return_value
+
+
+@pytest.mark.asyncio
+async def test_get_im_info_cached(mocked_api_client, cached_stream_service, streams_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V1IMDetail,
+                                                                                    "stream/get_im_info.json")
+
+    await cached_stream_service.get_im_info("im_id")
+    await cached_stream_service.get_im_info("im_id")
+
+    streams_api.v1_im_id_info_get.assert_called_once()
+    assert cached_stream_service.stream_cache().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_update_room_updates_cache(mocked_api_client, cached_stream_service, streams_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V3RoomDetail,
+                                                                                    "stream/get_room_info.json")
+    await cached_stream_service.get_room_info("room_id")
+    await cached_stream_service.get_stream("room_id")
+
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V3RoomDetail,
+                                                                                    "stream/update_room.json")
+    await cached_stream_service.update_room("room_id", V3RoomAttributes())
+    room_detail = await cached_stream_service.get_room_info("room_id")
+    await cached_stream_service.get_stream("room_id")
+
+    streams_api.v3_room_id_info_get.assert_called_once()
+    assert room_detail.room_attributes.name == "Test bot room"
+    assert streams_api.v2_streams_sid_info_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_set_room_active_invalidates_cache(mocked_api_client, cached_stream_service, streams_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V3RoomDetail,
+                                                                                    "stream/get_room_info.json")
+    await cached_stream_service.get_room_info("room_id")
+
+    await cached_stream_service.set_room_active("room_id", False)
+    await cached_stream_service.get_room_info("room_id")
+
+    assert streams_api.v3_room_id_info_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_im_updates_cache(mocked_api_client, cached_stream_service, streams_api):
+    mocked_api_client.call_api.return_value = get_deserialized_object_from_resource(V1IMDetail,
+                                                                                    "stream/get_im_info.json")
+
+    im_detail = await cached_stream_service.update_im("im_id", V1IMAttributes())
+
+    assert await cached_stream_service.get_im_info("im_id") is im_detail
+    streams_api.v1_im_id_info_get.assert_not_called()
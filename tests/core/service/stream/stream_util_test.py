@@ -1,4 +1,5 @@
-from symphony.bdk.core.service.stream.stream_util import to_url_safe_stream_id, from_url_safe_stream_id
+from symphony.bdk.core.service.stream.stream_util import to_url_safe_stream_id, from_url_safe_stream_id, \
+    normalize_stream_id
 
 
 def test_to_url_safe_stream_id():
@@ -11,3 +12,8 @@ def test_from_url_safe_stream_id():
     url_safe_stream_id = "XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ"
     stream_id = from_url_safe_stream_id(url_safe_stream_id)
     assert stream_id == "XlU3OH9eVMzq+yss7M/xyn///oxwgbtGbQ=="
+
+
+def test_normalize_stream_id():
+    assert normalize_stream_id("XlU3OH9eVMzq+yss7M/xyn///oxwgbtGbQ==") == "XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ"
+    assert normalize_stream_id("XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ") == "XlU3OH9eVMzq-yss7M_xyn___oxwgbtGbQ"
@@ -0,0 +1,78 @@
+from symphony.bdk.core.service.user.user_cache import UserCache, order_users
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
+
+
+def test_get_users():
+    cache = UserCache(10, 60)
+    user = UserV2(id=1, email_address="John.Doe@symphony.com", username="john")
+    cache.put_users([user], local=False)
+
+    assert cache.get_users("id", [1, 2], local=False) == ([user], [2])
+    assert cache.get_users("email", ["john.doe@symphony.com"], local=False) == ([user], [])
+    assert cache.get_users("username", ["john"], local=False) == ([user], [])
+    assert cache.get_users("id", [1], local=True) == ([], [1])
+    assert cache.hits == 3
+    assert cache.misses == 2
+
+
+def test_max_size_counted_in_users():
+    cache = UserCache(2, 60)
+    users = [UserV2(id=i, email_address=f"user{i}@symphony.com", username=f"user{i}") for i in range(3)]
+    cache.put_users(users, local=False)
+
+    assert cache.get_users("id", [0, 1, 2], local=False) == (users[1:], [0])
+    assert cache.get_users("username", ["user0", "user1", "user2"], local=False) == (users[1:], ["user0"])
+
+
+def test_get_users_by_changed_username():
+    cache = UserCache(10, 60)
+    cache.put_users([UserV2(id=1, username="john")], local=False)
+    cache.put_users([UserV2(id=1, username="johndoe")], local=False)
+
+    assert cache.get_users("username", ["john"], local=False)[1] == ["john"]
+    assert cache.get_users("username", ["johndoe"], local=False)[1] == []
+
+
+def test_order_users():
+    users = [UserV2(id=2, email_address="jane@symphony.com"), UserV2(id=1, email_address="John@symphony.com"),
+             UserV2(id=3)]
+
+    assert order_users("email", ["john@symphony.com", "jane@symphony.com"], users) == [users[1], users[0], users[2]]
+    assert order_users("id", [3, 1, 2], users) == [users[2], users[1], users[0]]
+
+
+def test_get_user_detail():
+    cache = UserCache(10, 60)
+    user_detail = V2UserDetail()
+    cache.put_user_detail(1, user_detail)
+
+    assert cache.get_user_detail(1) is user_detail
+    assert cache.get_user_detail(2) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_invalidate():
+    cache = UserCache(10, 60)
+    cache.put_users([UserV2(id=1, email_address="john.doe@symphony.com"), UserV2(id=2)], local=False)
+    cache.put_users([UserV2(id=1)], local=True)
+    cache.put_user_detail(1, V2UserDetail())
+
+    cache.invalidate(1)
+
+    assert cache.get_users("id", [1, 2], local=False)[1] == [1]
+    assert cache.get_users("email", ["john.doe@symphony.com"], local=False)[1] == ["john.doe@symphony.com"]
+    assert cache.get_users("id", [1], local=True)[1] == [1]
+    assert cache.get_user_detail(1) is None
+
+
+def test_clear():
+    cache = UserCache(10, 60)
+    cache.put_users([UserV2(id=1)], local=False)
+    cache.put_user_detail(1, V2UserDetail())
+
+    cache.clear()
+
+    assert cache.get_users("id", [1], local=False)[1] == [1]
+    assert cache.get_user_detail(1) is None
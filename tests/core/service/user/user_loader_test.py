@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from symphony.bdk.core.service.user.user_loader import UserLoader
+from symphony.bdk.core.service.user.user_service import OboUserService
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
+from symphony.bdk.gen.pod_model.v2_user_list import V2UserList
+
+
+def user_list(*users):
+    return V2UserList(users=list(users))
+
+
+@pytest.fixture(name="user_service")
+def fixture_user_service():
+    user_service = MagicMock(OboUserService)
+    user_service.list_users_by_ids = AsyncMock()
+    user_service.list_users_by_emails = AsyncMock()
+    user_service.list_users_by_usernames = AsyncMock()
+    return user_service
+
+
+@pytest.fixture(name="loader")
+def fixture_loader(user_service):
+    return UserLoader(user_service, batch_window=0.001)
+
+
+@pytest.mark.asyncio
+async def test_load_by_id_batched(loader, user_service):
+    user_service.list_users_by_ids.return_value = user_list(UserV2(id=1), UserV2(id=2))
+
+    users = await asyncio.gather(loader.load_by_id(1), loader.load_by_id(2), loader.load_by_id(1),
+                                 loader.load_by_id(3))
+
+    assert [user.id if user else None for user in users] == [1, 2, 1, None]
+    user_service.list_users_by_ids.assert_called_once_with([1, 2, 3], local=False, active=None)
+
+
+@pytest.mark.asyncio
+async def test_load_by_id_batched_per_parameters(loader, user_service):
+    user_service.list_users_by_ids.side_effect = [user_list(UserV2(id=1)), user_list(UserV2(id=2))]
+
+    await asyncio.gather(loader.load_by_id(1), loader.load_by_id(2, local=True))
+
+    user_service.list_users_by_ids.assert_has_calls([call([1], local=False, active=None),
+                                                     call([2], local=True, active=None)])
+
+
+@pytest.mark.asyncio
+async def test_load_by_id_max_batch_size(user_service):
+    loader = UserLoader(user_service, batch_window=0.001, max_batch_size=2)
+    user_service.list_users_by_ids.side_effect = [user_list(UserV2(id=1), UserV2(id=2)), user_list(UserV2(id=3))]
+
+    users = await asyncio.gather(loader.load_by_id(1), loader.load_by_id(2), loader.load_by_id(3))
+
+    assert [user.id for user in users] == [1, 2, 3]
+    user_service.list_users_by_ids.assert_has_calls([call([1, 2], local=False, active=None),
+                                                     call([3], local=False, active=None)])
+
+
+@pytest.mark.asyncio
+async def test_load_by_id_consecutive_batches(loader, user_service):
+    user_service.list_users_by_ids.side_effect = [user_list(UserV2(id=1)), user_list(UserV2(id=1))]
+
+    assert (await loader.load_by_id(1)).id == 1
+    assert (await loader.load_by_id(1)).id == 1
+    assert user_service.list_users_by_ids.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_by_id_error_raised_to_all_callers(loader, user_service):
+    user_service.list_users_by_ids.side_effect = ValueError("failure")
+
+    results = await asyncio.gather(loader.load_by_id(1), loader.load_by_id(2), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    user_service.list_users_by_ids.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_send_task_released_once_done(loader, user_service):
+    user_service.list_users_by_ids.return_value = user_list(UserV2(id=1))
+
+    await loader.load_by_id(1)
+    await asyncio.sleep(0)
+
+    assert not loader._send_tasks
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_lookups(user_service):
+    loader = UserLoader(user_service, batch_window=60, max_batch_size=2)
+    lookup_started = asyncio.Event()
+
+    async def endless_lookup(*args, **kwargs):
+        lookup_started.set()
+        await asyncio.sleep(60)
+
+    user_service.list_users_by_ids.side_effect = endless_lookup
+    sent = [asyncio.ensure_future(loader.load_by_id(1)), asyncio.ensure_future(loader.load_by_id(2))]
+    waiting = asyncio.ensure_future(loader.load_by_email("john@symphony.com"))
+    await lookup_started.wait()
+
+    await loader.close()
+
+    results = await asyncio.gather(*sent, waiting, return_exceptions=True)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not loader._send_tasks
+    user_service.list_users_by_emails.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_by_email_case_insensitive(loader, user_service):
+    user_service.list_users_by_emails.return_value = user_list(UserV2(id=1, email_address="John@symphony.com"))
+
+    users = await asyncio.gather(loader.load_by_email("john@symphony.com"), loader.load_by_email("jane@symphony.com"),
+                                 loader.load_by_email("JOHN@symphony.com", active=True))
+
+    assert users[0].id == 1
+    assert users[1] is None
+    user_service.list_users_by_emails.assert_has_calls([
+        call(["john@symphony.com", "jane@symphony.com"], local=False, active=None),
+        call(["JOHN@symphony.com"], local=False, active=True)])
+
+
+@pytest.mark.asyncio
+async def test_load_by_username(loader, user_service):
+    user_service.list_users_by_usernames.return_value = user_list(UserV2(id=1, username="john"))
+
+    users = await asyncio.gather(loader.load_by_username("john"), loader.load_by_username("jane"))
+
+    assert users[0].id == 1
+    assert users[1] is None
+    user_service.list_users_by_usernames.assert_called_once_with(["john", "jane"], active=None)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock, AsyncMock
 
 import base64
@@ -6,6 +7,7 @@ import pytest
 from symphony.bdk.core.auth.auth_session import AuthSession
 from symphony.bdk.core.service.user.model.delegate_action_enum import DelegateActionEnum
 from symphony.bdk.core.service.user.model.role_id import RoleId
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.core.service.user.user_service import UserService
 from symphony.bdk.gen.agent_api.audit_trail_api import AuditTrailApi
 from symphony.bdk.gen.agent_model.v1_audit_trail_initiator_list import V1AuditTrailInitiatorList
@@ -27,6 +29,7 @@ from symphony.bdk.gen.pod_model.user_id_list import UserIdList
 from symphony.bdk.gen.pod_model.user_search_filter import UserSearchFilter
 from symphony.bdk.gen.pod_model.user_search_query import UserSearchQuery
 from symphony.bdk.gen.pod_model.user_search_results import UserSearchResults
+from symphony.bdk.gen.pod_model.user_v2 import UserV2
 from symphony.bdk.gen.pod_model.v2_user_detail import V2UserDetail
 from symphony.bdk.gen.pod_model.v2_user_detail_list import V2UserDetailList
 from symphony.bdk.gen.pod_model.delegate_action import DelegateAction
@@ -83,6 +86,29 @@ def fixture_user_service(user_api, users_api, audit_trail_api, system_api, auth_
     return service
 
 
+@pytest.fixture(name="cached_user_service")
+def fixture_cached_user_service(user_api, users_api, audit_trail_api, system_api, auth_session):
+    return UserService(user_api, users_api, audit_trail_api, system_api, auth_session, minimal_retry_config(),
+                       UserCache(100, 60))
+
+
+@pytest.mark.asyncio
+async def test_loader_load_by_id(users_api, user_service):
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+
+    users = await asyncio.gather(user_service.loader().load_by_id(15942919536460),
+                                 user_service.loader().load_by_id(15942919536461))
+
+    users_api.v3_users_get.assert_called_once_with(
+        uid="15942919536460,15942919536461",
+        local=False,
+        session_token="session_token"
+    )
+    assert users[0].username == "tw"
+    assert users[1].username == "SA"
+
+
 @pytest.mark.asyncio
 async def test_list_users_by_ids(users_api, user_service):
     users_api.v3_users_get = AsyncMock()
@@ -774,3 +800,98 @@ async def test_unsuspend(user_api, user_service):
         payload=user_suspension,
         session_token="session_token"
     )
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_cached(users_api, cached_user_service):
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+    await cached_user_service.list_users_by_ids([15942919536460, 15942919536461])
+
+    users_api.v3_users_get.return_value = V2UserList(users=[], errors=[])
+    users_list = await cached_user_service.list_users_by_ids([15942919536460, 1234])
+
+    users_api.v3_users_get.assert_called_with(uid="1234", local=False, session_token="session_token")
+    assert [user.id for user in users_list.users] == [15942919536460]
+    assert cached_user_service.cache().hits == 1
+    assert cached_user_service.cache().misses == 3
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_partially_cached_in_requested_order(users_api, cached_user_service):
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+    await cached_user_service.list_users_by_ids([15942919536460, 15942919536461])
+    cached_user_service.cache().invalidate(15942919536461)
+
+    users_api.v3_users_get.return_value = V2UserList(users=[UserV2(id=15942919536461)], errors=[])
+    users_list = await cached_user_service.list_users_by_ids([15942919536461, 15942919536460])
+
+    users_api.v3_users_get.assert_called_with(uid="15942919536461", local=False, session_token="session_token")
+    assert [user.id for user in users_list.users] == [15942919536461, 15942919536460]
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_emails_and_usernames_cached(users_api, cached_user_service):
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+    await cached_user_service.list_users_by_usernames(["tw", "SA"])
+
+    users_list = await cached_user_service.list_users_by_usernames(["tw"])
+    await cached_user_service.list_users_by_emails(["technicalwriter@symphony.com"])
+
+    assert users_api.v3_users_get.call_count == 2
+    assert users_list.users[0].email_address == "technicalwriter@symphony.com"
+
+
+@pytest.mark.asyncio
+async def test_list_users_by_ids_with_active_not_cached(users_api, cached_user_service):
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+
+    await cached_user_service.list_users_by_ids([15942919536460], active=True)
+    await cached_user_service.list_users_by_ids([15942919536460], active=True)
+
+    assert users_api.v3_users_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_user_detail_cached(user_api, cached_user_service):
+    user_api.v2_admin_user_uid_get = AsyncMock()
+    user_api.v2_admin_user_uid_get.return_value = get_deserialized_object_from_resource(V2UserDetail,
+                                                                                        "user/user_detail.json")
+
+    await cached_user_service.get_user_detail(7215545078461)
+    user_detail = await cached_user_service.get_user_detail(7215545078461)
+
+    user_api.v2_admin_user_uid_get.assert_called_once()
+    assert user_detail.user_attributes.user_name == "johndoe"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("update", [
+    lambda service: service.update(15942919536460, V2UserAttributes()),
+    lambda service: service.suspend(15942919536460),
+    lambda service: service.unsuspend(15942919536460),
+    lambda service: service.update_status(15942919536460, UserStatus(status="ENABLED")),
+    lambda service: service.add_role(15942919536460, RoleId.INDIVIDUAL),
+])
+async def test_update_invalidates_cache(user_api, users_api, cached_user_service, update):
+    user_api.v2_admin_user_uid_get = AsyncMock()
+    user_api.v2_admin_user_uid_get.return_value = get_deserialized_object_from_resource(V2UserDetail,
+                                                                                        "user/user_detail.json")
+    user_api.v2_admin_user_uid_update_post = AsyncMock()
+    user_api.v1_admin_user_user_id_suspension_update_put = AsyncMock()
+    user_api.v1_admin_user_uid_status_update_post = AsyncMock()
+    user_api.v1_admin_user_uid_roles_add_post = AsyncMock()
+    users_api.v3_users_get = AsyncMock()
+    users_api.v3_users_get.return_value = get_deserialized_object_from_resource(V2UserList, "user/list_user.json")
+    await cached_user_service.list_users_by_ids([15942919536460, 15942919536461])
+    await cached_user_service.get_user_detail(15942919536460)
+
+    await update(cached_user_service)
+    await cached_user_service.list_users_by_ids([15942919536460, 15942919536461])
+    await cached_user_service.get_user_detail(15942919536460)
+
+    users_api.v3_users_get.assert_called_with(uid="15942919536460", local=False, session_token="session_token")
+    assert user_api.v2_admin_user_uid_get.call_count == 2
@@ -14,6 +14,7 @@ from symphony.bdk.core.service.presence.presence_service import PresenceService
 from symphony.bdk.core.service.session.session_service import SessionService
 from symphony.bdk.core.service.signal.signal_service import SignalService
 from symphony.bdk.core.service.stream.stream_service import StreamService
+from symphony.bdk.core.service.user.user_cache import UserCache
 from symphony.bdk.core.service.user.user_service import UserService
 from symphony.bdk.core.service_factory import ServiceFactory
 from symphony.bdk.gen import ApiClient
@@ -45,6 +46,14 @@ def test_get_user_service(service_factory):
     user_service = service_factory.get_user_service()
     assert user_service is not None
     assert isinstance(user_service, UserService)
+    assert user_service.cache() is None
+
+
+def test_get_user_service_with_cache(api_client_factory, config):
+    config.user_cache.enabled = True
+    user_service = ServiceFactory(api_client_factory, AuthSession(None), config).get_user_service()
+
+    assert isinstance(user_service.cache(), UserCache)
 
 
 def test_get_message_service(service_factory):
@@ -12,6 +12,8 @@ from symphony.bdk.core.config.exception import BotNotConfiguredError, BdkConfigE
 from symphony.bdk.core.config.loader import BdkConfigLoader
 from symphony.bdk.core.config.model.bdk_config import BdkConfig
 from symphony.bdk.core.extension import ExtensionService
+from symphony.bdk.core.service.stream.room_membership_cache import RoomMembershipListener
+from symphony.bdk.core.service.stream.stream_cache import StreamCacheListener
 from symphony.bdk.core.symphony_bdk import SymphonyBdk
 from tests.utils.resource_utils import get_config_resource_filepath
 
@@ -41,6 +43,8 @@ def fixture_mock_obo_session():
     obo_session = AsyncMock(OboAuthSession)
     obo_session.session_token.return_value = "session_token"
     obo_session.key_manager_token.return_value = ""
+    obo_session.user_id = 1234
+    obo_session.username = None
     return obo_session
 
 
@@ -59,6 +63,53 @@ async def test_bot_session(config):
             assert await auth_session.key_manager_token == "km_token"
 
 
+@pytest.mark.asyncio
+async def test_bot_session_renewal_stopped_on_close(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        bot_session = symphony_bdk.bot_session()
+        assert bot_session._token_renewal_config is config.bot.token_renewal
+        bot_session.close = AsyncMock()
+
+    bot_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_user_loaders_closed_on_close(config, mock_obo_session):
+    async with SymphonyBdk(config) as symphony_bdk:
+        user_loader = symphony_bdk.users().loader()
+        user_loader.close = AsyncMock()
+        obo_user_loader = symphony_bdk.obo_services(mock_obo_session).users().loader()
+        obo_user_loader.close = AsyncMock()
+
+    user_loader.close.assert_awaited_once()
+    obo_user_loader.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_room_membership_listener_subscribed(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        assert symphony_bdk.streams().room_membership_cache() is None
+        assert not any(isinstance(listener, RoomMembershipListener)
+                       for listener in symphony_bdk.datafeed()._listeners)
+
+    config.room_membership_cache.enabled = True
+    async with SymphonyBdk(config) as symphony_bdk:
+        listeners = [listener for listener in symphony_bdk.datafeed()._listeners
+                     if isinstance(listener, RoomMembershipListener)]
+        assert len(listeners) == 1
+        assert listeners[0]._room_membership_cache is symphony_bdk.streams().room_membership_cache()
+
+
+@pytest.mark.asyncio
+async def test_stream_cache_listener_subscribed(config):
+    config.stream_cache.enabled = True
+    async with SymphonyBdk(config) as symphony_bdk:
+        listeners = [listener for listener in symphony_bdk.datafeed()._listeners
+                     if isinstance(listener, StreamCacheListener)]
+        assert len(listeners) == 1
+        assert listeners[0]._stream_cache is symphony_bdk.streams().stream_cache()
+
+
 @pytest.mark.asyncio
 async def test_bot_extensions_service_initialisation(config):
     async with SymphonyBdk(config) as symphony_bdk:
@@ -123,6 +174,16 @@ async def test_obo_with_username(config):
             mock_authenticate.assert_called_once_with(username)
 
 
+@pytest.mark.asyncio
+async def test_obo_session_reused_for_same_user(config):
+    async with SymphonyBdk(config) as symphony_bdk:
+        obo_session = symphony_bdk.obo(user_id=12345)
+
+        assert symphony_bdk.obo(user_id=12345) is obo_session
+        assert symphony_bdk.obo(username="my.bot.user") is not obo_session
+        assert symphony_bdk.obo_services(obo_session) is symphony_bdk.obo_services(symphony_bdk.obo(user_id=12345))
+
+
 @pytest.mark.asyncio
 async def test_obo_with_user_id_and_username(config):
     with patch.object(OboAuthenticatorRsa, "authenticate_by_username") as authenticate_by_username, \
@@ -152,6 +213,42 @@ async def test_obo_services(config, mock_obo_session):
             assert obo_services is not None
 
 
+@pytest.mark.asyncio
+async def test_obo_services_share_bdk_clients(config, mock_obo_session):
+    async with SymphonyBdk(config) as symphony_bdk:
+        async with symphony_bdk.obo_services(mock_obo_session) as obo_services:
+            assert obo_services._api_client_factory is symphony_bdk._api_client_factory
+
+        assert symphony_bdk._api_client_factory.get_pod_client().rest_client.pool_manager.closed is False
+
+
+@pytest.mark.asyncio
+async def test_obo_services_cached_per_user(config, mock_obo_session):
+    other_obo_session = AsyncMock(OboAuthSession)
+    other_obo_session.user_id = None
+    other_obo_session.username = "other.user"
+
+    async with SymphonyBdk(config) as symphony_bdk:
+        obo_services = symphony_bdk.obo_services(mock_obo_session)
+
+        assert symphony_bdk.obo_services(mock_obo_session) is obo_services
+        assert symphony_bdk.obo_services(other_obo_session) is not obo_services
+
+
+@pytest.mark.asyncio
+async def test_obo_services_renewed_when_session_changes(config, mock_obo_session):
+    new_obo_session = AsyncMock(OboAuthSession)
+    new_obo_session.user_id = mock_obo_session.user_id
+    new_obo_session.username = None
+
+    async with SymphonyBdk(config) as symphony_bdk:
+        obo_services = symphony_bdk.obo_services(mock_obo_session)
+        new_obo_services = symphony_bdk.obo_services(new_obo_session)
+
+        assert new_obo_services is not obo_services
+        assert new_obo_services.obo_session is new_obo_session
+
+
 @pytest.mark.asyncio
 async def test_obo_fails(config):
     with pytest.raises(AuthInitializationError):
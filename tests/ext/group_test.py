@@ -171,6 +171,45 @@ async def test_list_groups_with_params(group_service, mocked_group, api_client):
     assert params["sortOrder"] == SortOrder(value="ASC")
 
 
+@pytest.mark.asyncio
+async def test_list_all_groups_2_pages_prefetched(group_service, api_client):
+    return_values = [get_deserialized_object_from_resource(GroupList, "group/list_all_groups_page_1.json"),
+                     get_deserialized_object_from_resource(GroupList, "group/list_all_groups_page_2.json")]
+
+    api_client.call_api.side_effect = return_values
+
+    gen = await group_service.list_all_groups(chunk_size=2, max_number=4, prefetch=1)
+    groups = [d async for d in gen]
+
+    args, kwargs = api_client.call_api.call_args
+
+    assert api_client.call_api.call_count == 2
+    assert args[0] == '/v1/groups/type/{typeId}'
+    assert dict(args[3])['after'] == '2'
+    assert dict(args[3])['limit'] == 2
+    assert len(groups) == 4
+    assert groups[0]['name'] == 'SDl test 0'
+    assert groups[1]['name'] == 'SDl test 1'
+    assert groups[2]['name'] == 'SDl test 2'
+    assert groups[3]['name'] == 'SDl test 3'
+
+@pytest.mark.asyncio
+async def test_list_groups_with_params(group_service, mocked_group, api_client):
+    api_client.call_api.return_value = GroupList(data=[mocked_group])
+
+    groups = await group_service.list_groups(status=Status(value="ACTIVE"), before="0", after="50", limit=50,
+                                             sort_order=SortOrder(value="ASC"))
+    assert len(groups.data) == 1
+    api_client.call_api.assert_called_once()
+    assert api_client.call_api.call_args.args[0] == "/v1/groups/type/{typeId}"
+    params = dict(api_client.call_api.call_args.args[3])
+    assert params["status"] == Status(value="ACTIVE")
+    assert params["before"] == "0"
+    assert params["after"] == "50"
+    assert params["limit"] == 50
+    assert params["sortOrder"] == SortOrder(value="ASC")
+
+
 @pytest.mark.asyncio
 async def test_update_group(group_service, mocked_group, api_client):
     mocked_group.name = "Updated name"